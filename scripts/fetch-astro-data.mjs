@@ -14,17 +14,15 @@
  */
 
 import { createHash } from 'node:crypto';
-import { existsSync, mkdirSync, readFileSync, writeFileSync } from 'node:fs';
+import { mkdirSync, readFileSync, renameSync, rmSync, writeFileSync } from 'node:fs';
 import { dirname, join } from 'node:path';
 import { fileURLToPath } from 'node:url';
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 const DATA_DIR = join(__dirname, '..', 'web', 'src', 'data');
 
-// Ensure output directory exists
-if (!existsSync(DATA_DIR)) {
-  mkdirSync(DATA_DIR, { recursive: true });
-}
+// Ensure output directory exists (a no-op when it already does)
+mkdirSync(DATA_DIR, { recursive: true });
 
 // ─── Helpers ────────────────────────────────────────────────────────────────
 
@@ -36,10 +34,31 @@ function sha256(content) {
   return createHash('sha256').update(content).digest('hex').slice(0, 12);
 }
 
+/** Previous contents of a data file, read with one open rather than an existence check first. */
+function readPrevious(filename) {
+  try {
+    return readFileSync(join(DATA_DIR, filename), 'utf-8');
+  } catch (err) {
+    if (err.code === 'ENOENT') return null;
+    throw err;
+  }
+}
+
+/**
+ * Write JSON through a temporary file and rename it into place, so an
+ * interrupted run never leaves a truncated data file behind.
+ */
 function safeWrite(filename, data) {
   const content = JSON.stringify(data, null, 2);
   const filepath = join(DATA_DIR, filename);
-  writeFileSync(filepath, content, 'utf-8');
+  const partial = `${filepath}.part`;
+  try {
+    writeFileSync(partial, content, 'utf-8');
+    renameSync(partial, filepath);
+  } catch (err) {
+    rmSync(partial, { force: true });
+    throw err;
+  }
   console.log(`  wrote ${filename} (${(content.length / 1024).toFixed(1)} KB)`);
   return content;
 }
@@ -114,6 +133,8 @@ async function fetchNeoData() {
 // ─── Comet Orbital Elements (MPC) ──────────────────────────────────────────
 
 const MPC_COMET_URL = 'https://www.minorplanetcenter.net/iau/MPCORB/CometEls.txt';
+const INTERSTELLAR_DESIGNATION = /^\d+I(?:\/|$)/i;
+const PUBLICATION_REFERENCE_GAP = /\s{2,}/;
 
 /**
  * Convert calendar date to Julian date
@@ -138,34 +159,27 @@ function parseMPCCometLine(line) {
   }
 
   try {
-    const perihelionDateStr = line.substring(14, 29).trim();
-    const qStr = line.substring(30, 40).trim();
-    const eStr = line.substring(41, 52).trim();
-    const omegaStr = line.substring(51, 62).trim();
-    const nodeStr = line.substring(61, 72).trim();
-    const incStr = line.substring(71, 82).trim();
+    // q and e decide whether the line is usable, so they are read first and
+    // the remaining columns are only sliced for lines that pass.
+    const q = parseFloat(line.substring(30, 40));
+    const e = parseFloat(line.substring(41, 52));
+    if (Number.isNaN(q) || Number.isNaN(e)) return null;
+
     const epochStr = line.substring(81, 93).trim();
-    const hStr = line.substring(91, 97).trim();
-    const kStr = line.substring(96, 102).trim();
     const nameStr = line.substring(102).trim();
 
-    const q = parseFloat(qStr);
-    const e = parseFloat(eStr);
-    const inc = parseFloat(incStr);
-    const omega = parseFloat(omegaStr);
-    const node = parseFloat(nodeStr);
-    const parsedH = parseFloat(hStr);
-    const parsedK = parseFloat(kStr);
+    const inc = parseFloat(line.substring(71, 82));
+    const omega = parseFloat(line.substring(51, 62));
+    const node = parseFloat(line.substring(61, 72));
+    const parsedH = parseFloat(line.substring(91, 97));
+    const parsedK = parseFloat(line.substring(96, 102));
     const H = Number.isFinite(parsedH) ? parsedH : 10.0;
     const K = Number.isFinite(parsedK) ? parsedK : 10.0;
 
-    if (Number.isNaN(q) || Number.isNaN(e)) return null;
-
-    const perihelionParts = perihelionDateStr.split(/\s+/);
-    if (perihelionParts.length !== 3) return null;
-    const year = parseInt(perihelionParts[0], 10);
-    const month = parseInt(perihelionParts[1], 10);
-    const day = parseFloat(perihelionParts[2]);
+    // Perihelion date ("YYYY MM DD.dddd") from its fixed columns
+    const year = parseInt(line.substring(14, 18), 10);
+    const month = parseInt(line.substring(19, 21), 10);
+    const day = parseFloat(line.substring(22, 29));
     if (!Number.isFinite(year) || !Number.isFinite(month) || !Number.isFinite(day)) return null;
     const perihelionJD = dateToJulian(year, month, day);
 
@@ -179,17 +193,19 @@ function parseMPCCometLine(line) {
       }
     }
 
-    // Parse designation and name
-    const catalogName = nameStr.trim().split(/\s{2,}/, 1)[0];
+    // Parse designation and name. nameStr is already trimmed; the publication
+    // reference after the first wide gap is cut without building a split array.
+    const referenceGap = nameStr.search(PUBLICATION_REFERENCE_GAP);
+    const catalogName = referenceGap >= 0 ? nameStr.substring(0, referenceGap) : nameStr;
     let designation = catalogName;
     let name = catalogName;
-    if (catalogName.includes('(') && catalogName.includes(')')) {
-      const parenStart = catalogName.indexOf('(');
-      const parenEnd = catalogName.lastIndexOf(')');
+    const parenStart = catalogName.indexOf('(');
+    const parenEnd = parenStart >= 0 ? catalogName.lastIndexOf(')') : -1;
+    const slashIndex = parenEnd >= 0 ? -1 : catalogName.indexOf('/');
+    if (parenEnd >= 0) {
       designation = catalogName.substring(0, parenStart).trim();
       name = catalogName.substring(parenStart + 1, parenEnd);
-    } else if (catalogName.includes('/')) {
-      const slashIndex = catalogName.indexOf('/');
+    } else if (slashIndex >= 0) {
       designation = catalogName.substring(0, slashIndex);
       name = catalogName.substring(slashIndex + 1);
     }
@@ -205,7 +221,7 @@ function parseMPCCometLine(line) {
       perihelionTime: perihelionJD,
       absoluteMagnitude: H,
       slopeParameter: K,
-      isInterstellar: /^\d+I(?:\/|$)/i.test(designation.trim()),
+      isInterstellar: INTERSTELLAR_DESIGNATION.test(designation),
       epochJD,
     };
   } catch {
@@ -213,27 +229,50 @@ function parseMPCCometLine(line) {
   }
 }
 
-async function fetchCometData() {
+/**
+ * Yield the lines of a response body as chunks arrive, so the full text is
+ * never held in memory alongside its split copy.
+ */
+async function* readLines(body) {
+  let pending = '';
+  for await (const chunk of body.pipeThrough(new TextDecoderStream())) {
+    const lines = (pending + chunk).split('\n');
+    pending = lines.pop();
+    yield* lines;
+  }
+  yield pending;
+}
+
+/**
+ * Fetch and parse CometEls.txt. When `ifModifiedSince` is given the request is
+ * conditional, and `comets` is null if MPC reports the file unchanged.
+ */
+async function fetchCometData(ifModifiedSince = null) {
   console.log('Fetching comet orbital elements...');
 
-  const response = await fetch(MPC_COMET_URL);
+  const headers = ifModifiedSince ? { 'If-Modified-Since': ifModifiedSince } : {};
+  const response = await fetch(MPC_COMET_URL, { headers });
+  if (response.status === 304) {
+    console.log(`  not modified since ${ifModifiedSince}`);
+    return { comets: null, lastModified: ifModifiedSince };
+  }
   if (!response.ok) {
     throw new Error(`MPC CometEls ${response.status}: ${response.statusText}`);
   }
 
-  const text = await response.text();
-  const lines = text.split('\n');
   const comets = [];
+  let lineCount = 0;
 
-  for (const line of lines) {
+  for await (const line of readLines(response.body)) {
+    lineCount++;
     const comet = parseMPCCometLine(line);
     if (comet) {
       comets.push(comet);
     }
   }
 
-  console.log(`  parsed ${comets.length} comets from ${lines.length} lines`);
-  return comets;
+  console.log(`  parsed ${comets.length} comets from ${lineCount} lines`);
+  return { comets, lastModified: response.headers.get('last-modified') };
 }
 
 // ─── Asteroid Physical Data (hardcoded from JPL SBDB) ──────────────────────
@@ -453,7 +492,7 @@ async function main() {
   console.log('=== NightSeek Astronomy Data Fetch ===\n');
 
   if (process.argv.includes('--comets-only')) {
-    const comets = await fetchCometData();
+    const { comets } = await fetchCometData();
     safeWrite('comets.json', comets);
     console.log('\nDone.');
     return;
@@ -461,36 +500,45 @@ async function main() {
 
   const hashes = {};
   const errors = [];
+  const lastModified = {};
+
+  // Only ask MPC for a conditional response when the previous comets.json is
+  // still on disk to fall back to
+  const previousMeta = JSON.parse(readPrevious('meta.json') ?? '{}');
+  const previousComets = readPrevious('comets.json');
+  const cometsSince = previousComets ? (previousMeta.lastModified?.['comets.json'] ?? null) : null;
+
+  // The remote sources are independent, so they are fetched concurrently and
+  // written in a fixed order once every request has settled
+  const [neo, comets, donki, ephemeris] = await Promise.allSettled([
+    fetchNeoData(),
+    fetchCometData(cometsSince),
+    fetchDonkiData(),
+    fetchHorizonsData(),
+  ]);
+
+  const record = (result, filename, label, key, write) => {
+    try {
+      if (result.status === 'rejected') throw result.reason;
+      hashes[filename] = sha256(write(result.value));
+    } catch (err) {
+      console.error(`  ${label} fetch failed: ${err.message}`);
+      errors.push(`${key}: ${err.message}`);
+    }
+  };
+  const writeAs = filename => data => safeWrite(filename, data);
 
   // NEO data
-  try {
-    const neo = await fetchNeoData();
-    const content = safeWrite('neo.json', neo);
-    hashes['neo.json'] = sha256(content);
-  } catch (err) {
-    console.error(`  NEO fetch failed: ${err.message}`);
-    errors.push(`neo: ${err.message}`);
-  }
+  record(neo, 'neo.json', 'NEO', 'neo', writeAs('neo.json'));
 
-  // Comet data
-  try {
-    const comets = await fetchCometData();
-    const content = safeWrite('comets.json', comets);
-    hashes['comets.json'] = sha256(content);
-  } catch (err) {
-    console.error(`  Comet fetch failed: ${err.message}`);
-    errors.push(`comets: ${err.message}`);
-  }
+  // Comet data; an unchanged MPC file keeps the existing comets.json
+  record(comets, 'comets.json', 'Comet', 'comets', result => {
+    if (result.lastModified) lastModified['comets.json'] = result.lastModified;
+    return result.comets ? safeWrite('comets.json', result.comets) : previousComets;
+  });
 
   // DONKI space weather data
-  try {
-    const donki = await fetchDonkiData();
-    const content = safeWrite('donki.json', donki);
-    hashes['donki.json'] = sha256(content);
-  } catch (err) {
-    console.error(`  DONKI fetch failed: ${err.message}`);
-    errors.push(`donki: ${err.message}`);
-  }
+  record(donki, 'donki.json', 'DONKI', 'donki', writeAs('donki.json'));
 
   // Asteroid data (never fails — hardcoded)
   const asteroids = getAsteroidData();
@@ -498,19 +546,13 @@ async function main() {
   hashes['asteroids.json'] = sha256(asteroidContent);
 
   // JPL Horizons ephemeris data
-  try {
-    const ephemeris = await fetchHorizonsData();
-    const content = safeWrite('ephemeris.json', ephemeris);
-    hashes['ephemeris.json'] = sha256(content);
-  } catch (err) {
-    console.error(`  Horizons fetch failed: ${err.message}`);
-    errors.push(`horizons: ${err.message}`);
-  }
+  record(ephemeris, 'ephemeris.json', 'Horizons', 'horizons', writeAs('ephemeris.json'));
 
   // Write meta
   const meta = {
     fetchedAt: new Date().toISOString(),
     hashes,
+    lastModified: Object.keys(lastModified).length > 0 ? lastModified : undefined,
     errors: errors.length > 0 ? errors : undefined,
   };
   safeWrite('meta.json', meta);
@@ -10,7 +10,7 @@ import {
 } from 'lucide-react';
 import type { ReactNode } from 'react';
 import { useMemo } from 'react';
-import { SkyCalculator } from '@/lib/astronomy/calculator';
+import { getSkyCalculator } from '@/lib/astronomy/calculator';
 import {
   buildMilkyWayNightPlan,
   type MilkyWayNightPlan,
@@ -316,7 +316,7 @@ export default function MilkyWayPlannerCard({
 }: MilkyWayPlannerCardProps) {
   const bortle = calculateBortle(location.latitude, location.longitude);
   const plans = useMemo(() => {
-    const calculator = new SkyCalculator(location.latitude, location.longitude);
+    const calculator = getSkyCalculator(location.latitude, location.longitude);
     return forecastRange.map(item =>
       buildMilkyWayNightPlan(item, horizonProfile, calculator, bortle.value)
     );
@@ -328,7 +328,7 @@ export default function MilkyWayPlannerCard({
     buildMilkyWayNightPlan(
       forecast,
       horizonProfile,
-      new SkyCalculator(location.latitude, location.longitude),
+      getSkyCalculator(location.latitude, location.longitude),
       bortle.value
     );
   const bestForecastPlan = getBestForecastPlan(plans);
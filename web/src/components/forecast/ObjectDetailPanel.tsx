@@ -4,7 +4,7 @@ import { RatingStars } from '@/components/ui/Rating';
 import Tooltip from '@/components/ui/Tooltip';
 import { useBodyScrollLock } from '@/hooks/useBodyScrollLock';
 import { useFocusTrap } from '@/hooks/useFocusTrap';
-import { SkyCalculator } from '@/lib/astronomy/calculator';
+import { getSkyCalculator } from '@/lib/astronomy/calculator';
 import { formatDistance } from '@/lib/gaia';
 import { fetchEnhancedGaiaStarField } from '@/lib/gaia/enhanced-queries';
 import { formatAsteroidDiameter, formatRotationPeriod } from '@/lib/jpl/sbdb';
@@ -84,7 +84,7 @@ export default function ObjectDetailPanel({
     () =>
       latitude === undefined || longitude === undefined
         ? null
-        : new SkyCalculator(latitude, longitude),
+        : getSkyCalculator(latitude, longitude),
     [latitude, longitude]
   );
   const accessibleImagingWindow =
@@ -22,7 +22,6 @@ import { useCallback, useEffect, useRef, useState } from 'react';
 import { useBodyScrollLock } from '@/hooks/useBodyScrollLock';
 import { useFocusTrap } from '@/hooks/useFocusTrap';
 import { formatImagingWindow } from '@/lib/astronomy/imaging-windows';
-import { searchCelestialObjects } from '@/lib/search/object-search';
 import {
   azimuthToCardinal,
   formatAltitude,
@@ -411,6 +410,9 @@ export default function ObjectSearchModal({ location, onClose }: ObjectSearchMod
       setHasSearched(true);
 
       try {
+        // The search engine and its catalog loaders are only needed once the
+        // user searches, so they load with the first query instead of the app.
+        const { searchCelestialObjects } = await import('@/lib/search/object-search');
         const searchResults = await searchCelestialObjects(searchQuery, location, 20, message => {
           setSearchMessage(message);
         });
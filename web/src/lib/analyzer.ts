@@ -1,6 +1,7 @@
 import * as Astronomy from 'astronomy-engine';
 import { fromZonedTime, toZonedTime } from 'date-fns-tz';
 import type {
+  AsteroidPhysicalData,
   AstronomicalEvents,
   DSOCatalogEntry,
   Location,
@@ -13,7 +14,13 @@ import type {
   ScoredObject,
   Settings,
 } from '@/types';
-import { SkyCalculator } from './astronomy/calculator';
+import {
+  buildCatalogColumns,
+  catalogColumnDirection,
+  type CatalogColumns,
+  getSkyCalculator,
+  type SkyCalculator,
+} from './astronomy/calculator';
 import {
   getConstellation,
   getConstellationFullName,
@@ -26,7 +33,7 @@ import {
   isOuterPlanet,
 } from './astronomy/elongation';
 import { getJupiterMoonsData } from './astronomy/galilean-moons';
-import { getBestImagingWindow } from './astronomy/imaging-windows';
+import { createImagingWindowFinder } from './astronomy/imaging-windows';
 import { getLibrationForNight } from './astronomy/libration';
 import { getLunarApsisForNight } from './astronomy/lunar-apsis';
 import { getEclipseSeasonInfo } from './astronomy/lunar-nodes';
@@ -38,12 +45,13 @@ import { PLANETS } from './astronomy/planets';
 import { getSeeingFromWeather } from './astronomy/seeing';
 import { getLocalSiderealTime } from './astronomy/sidereal';
 import { getVenusPeakInfo } from './astronomy/venus-peak';
-import { calculateCometVisibility, fetchComets } from './catalogs/comets';
+import { calculateCometVisibility, fetchComets, isPropagatableComet } from './catalogs/comets';
 import { getCommonName } from './catalogs/common-names';
 import {
   calculateMinorPlanetVisibility,
   getDwarfPlanets,
   getNotableAsteroids,
+  type MinorPlanetData,
 } from './catalogs/minor-planets';
 import { loadOpenNGCCatalog } from './catalogs/opengc';
 import { detectConjunctions } from './events/conjunctions';
@@ -54,7 +62,7 @@ import { getTransitForDisplay } from './events/transits';
 import { fetchAsteroidPhysicalData } from './jpl/sbdb';
 import { computeAuroraForecast, fetchSpaceWeather } from './nasa/donki';
 import { fetchNeoCloseApproachesRange } from './nasa/neows';
-import { calculateTotalScore } from './scoring';
+import { createNightScorer } from './scoring';
 import { getEffectiveFOV } from './telescopes';
 import { formatDateKey } from './utils/format';
 import { logger } from './utils/logger';
@@ -79,6 +87,83 @@ interface AllVisibilities {
   jupiterVisible: boolean;
 }
 
+/**
+ * Planets with their astronomy-engine body and inner/outer classification,
+ * resolved once rather than per planet per night.
+ */
+const ANALYZED_PLANETS = PLANETS.map(planet => ({
+  name: planet.name,
+  body: Astronomy.Body[planet.name as keyof typeof Astronomy.Body],
+  isInner: isInnerPlanet(planet.name),
+  isOuter: isOuterPlanet(planet.name),
+}));
+
+/**
+ * Allowance for refraction and precession, which the closed-form altitude
+ * ceiling ignores, when screening deep-sky objects.
+ */
+const DSO_SCREEN_MARGIN_DEG = 2;
+
+/**
+ * Deep-sky catalog entry with the night-independent display metadata resolved.
+ */
+interface PreparedDSO {
+  entry: DSOCatalogEntry;
+  commonName: string;
+  constellation: string;
+  direction: readonly [number, number, number];
+}
+
+/**
+ * Prepared objects plus their coordinates in column form, so each night's
+ * altitude screen runs over typed arrays instead of the object list.
+ */
+interface PreparedDSOCatalog {
+  objects: PreparedDSO[];
+  columns: CatalogColumns;
+}
+
+/** Prepared catalogs by loaded subset, which the OpenNGC loader reuses across forecasts. */
+const preparedDSOCatalogs = new WeakMap<readonly DSOCatalogEntry[], PreparedDSOCatalog>();
+
+/**
+ * Resolve display names, constellations and J2000 direction cosines once per
+ * catalog subset instead of once per object per night.
+ */
+function prepareDSOCatalog(dsoCatalog: readonly DSOCatalogEntry[]): PreparedDSOCatalog {
+  const cached = preparedDSOCatalogs.get(dsoCatalog);
+  if (cached) return cached;
+
+  // The columns hold each object's declination trig, which its direction
+  // cosines reuse rather than recomputing from the entry
+  const columns = buildCatalogColumns(dsoCatalog);
+  const objects = dsoCatalog.map((dso, index) => {
+    const baseCommonName = dso.commonName || getCommonName(dso.name);
+    let commonName: string;
+    if (dso.messierNumber === null) {
+      commonName = baseCommonName ?? dso.name;
+    } else {
+      commonName = baseCommonName
+        ? `M${dso.messierNumber} ${baseCommonName}`
+        : `M${dso.messierNumber}`;
+    }
+
+    const constellation = dso.constellation
+      ? getConstellationFullName(dso.constellation)
+      : getConstellation(dso.raHours, dso.decDegrees);
+
+    return {
+      entry: dso,
+      commonName,
+      constellation,
+      direction: catalogColumnDirection(columns, index),
+    };
+  });
+  const prepared = { objects, columns };
+  preparedDSOCatalogs.set(dsoCatalog, prepared);
+  return prepared;
+}
+
 function errorWithCause(message: string, cause: unknown): Error {
   return Object.assign(new Error(message), { cause });
 }
@@ -91,30 +176,81 @@ async function withFallback<T>(operation: () => Promise<T>, fallback: T): Promis
   }
 }
 
+interface PreparedMinorPlanet {
+  body: MinorPlanetData;
+  physicalData: AsteroidPhysicalData | null;
+}
+
+/** Prepared lists by source list; the bundled minor-planet catalogs are static. */
+const preparedMinorPlanetLists = new WeakMap<MinorPlanetData[], PreparedMinorPlanet[]>();
+
+/**
+ * Resolve bundled asteroid physical data once per catalog list instead of
+ * one lookup per asteroid per night.
+ */
+function prepareMinorPlanets(bodies: MinorPlanetData[]): PreparedMinorPlanet[] {
+  const cached = preparedMinorPlanetLists.get(bodies);
+  if (cached) return cached;
+
+  const prepared = bodies.map(body => ({
+    body,
+    physicalData: body.category === 'asteroid' ? fetchAsteroidPhysicalData(body.name) : null,
+  }));
+  preparedMinorPlanetLists.set(bodies, prepared);
+  return prepared;
+}
+
+/**
+ * Calculate visibility for dwarf planets or asteroids. Both lists share the
+ * same orbit model; asteroids additionally carry bundled physical data.
+ */
+function calculateMinorPlanetVisibilities(
+  bodies: PreparedMinorPlanet[],
+  calculator: SkyCalculator,
+  nightInfo: NightInfo,
+  maxMagnitude: number
+): ObjectVisibility[] {
+  const visibilities: ObjectVisibility[] = [];
+  for (const { body, physicalData } of bodies) {
+    let visibility: ObjectVisibility | null;
+    try {
+      visibility = calculateMinorPlanetVisibility(body, calculator, nightInfo, maxMagnitude);
+    } catch (error) {
+      const kind = body.category === 'asteroid' ? 'asteroid' : 'dwarf-planet';
+      throw errorWithCause(`Invalid ${kind} orbit: ${body.name}`, error);
+    }
+    if (!visibility) continue;
+
+    if (physicalData) visibility.physicalData = physicalData;
+    visibilities.push(visibility);
+  }
+  return visibilities;
+}
+
 /**
  * Calculate visibility for all object types for a given night.
  */
 // biome-ignore lint/complexity/noExcessiveCognitiveComplexity: Visibility calculation covers many object types
-async function calculateAllVisibilities(
+function calculateAllVisibilities(
   calculator: SkyCalculator,
   observer: Astronomy.Observer,
   nightInfo: NightInfo,
   nightDate: Date,
-  dsoCatalog: DSOCatalogEntry[],
+  dsoCatalog: PreparedDSOCatalog,
   cometCatalog: Awaited<ReturnType<typeof fetchComets>>,
-  dwarfPlanetList: ReturnType<typeof getDwarfPlanets>,
-  asteroidList: ReturnType<typeof getNotableAsteroids>,
+  dwarfPlanetList: PreparedMinorPlanet[],
+  asteroidList: PreparedMinorPlanet[],
   settings: Settings
-): Promise<AllVisibilities> {
+): AllVisibilities {
   const planets: ObjectVisibility[] = [];
   let jupiterVisible = false;
 
-  for (const planet of PLANETS) {
+  for (const planet of ANALYZED_PLANETS) {
     try {
       const visibility = calculator.calculatePlanetVisibility(planet.name, nightInfo);
 
       if (visibility.isVisible) {
-        const body = Astronomy.Body[planet.name as keyof typeof Astronomy.Body];
+        const { body } = planet;
 
         visibility.constellation = getPlanetConstellation(
           body,
@@ -122,12 +258,12 @@ async function calculateAllVisibilities(
           observer
         );
 
-        if (isInnerPlanet(planet.name)) {
+        if (planet.isInner) {
           const elongInfo = getElongationForPlanet(planet.name, nightDate);
           if (elongInfo) visibility.elongationDeg = elongInfo.elongationDeg;
         }
 
-        if (isOuterPlanet(planet.name)) {
+        if (planet.isOuter) {
           const oppInfo = getOppositionForPlanet(planet.name, nightDate);
           if (oppInfo) visibility.isAtOpposition = oppInfo.isActive;
         }
@@ -155,11 +291,11 @@ async function calculateAllVisibilities(
         visibility.isNearPerihelion = perihelionInfo.isNear;
         visibility.perihelionSolarFluxBoostPercent = perihelionInfo.solarFluxBoostPercent;
 
-        if (planet.name.toLowerCase() === 'saturn') {
+        if (body === Astronomy.Body.Saturn) {
           visibility.saturnRings = calculator.getSaturnRingInfo(nightDate);
         }
 
-        if (planet.name.toLowerCase() === 'jupiter') {
+        if (body === Astronomy.Body.Jupiter) {
           jupiterVisible = true;
         }
 
@@ -170,21 +306,22 @@ async function calculateAllVisibilities(
     }
   }
 
+  // Screen the catalog with a closed-form altitude bound before any
+  // per-object sampling: targets that stay below the horizon for the whole
+  // window would only come back with isVisible false. The whole catalog is
+  // screened in one pass over its coordinate columns.
+  const candidates = calculator.screenCatalogColumns(
+    nightInfo,
+    dsoCatalog.columns,
+    -DSO_SCREEN_MARGIN_DEG
+  );
   const dsos: ObjectVisibility[] = [];
-  for (const dso of dsoCatalog) {
-    const baseCommonName = dso.commonName || getCommonName(dso.name);
-    let formattedCommonName: string;
-    if (dso.messierNumber === null) {
-      formattedCommonName = baseCommonName ?? dso.name;
-    } else {
-      formattedCommonName = baseCommonName
-        ? `M${dso.messierNumber} ${baseCommonName}`
-        : `M${dso.messierNumber}`;
-    }
-
-    const constellation = dso.constellation
-      ? getConstellationFullName(dso.constellation)
-      : getConstellation(dso.raHours, dso.decDegrees);
+  const { objects } = dsoCatalog;
+  // Most objects fail the screen, so the walk is indexed over the mask and
+  // never builds an [index, object] pair for a rejected one.
+  for (let index = 0; index < objects.length; index++) {
+    if (candidates[index] === 0) continue;
+    const { entry: dso, commonName, constellation, direction } = objects[index];
 
     let visibility: ObjectVisibility;
     try {
@@ -200,9 +337,10 @@ async function calculateAllVisibilities(
           angularSizeArcmin: dso.majorAxisArcmin ?? 0,
           minorAxisArcmin: dso.minorAxisArcmin ?? undefined,
           surfaceBrightness: dso.surfaceBrightness,
-          commonName: formattedCommonName,
+          commonName,
           isMessier: dso.messierNumber !== null,
           constellation,
+          direction,
         }
       );
     } catch (error) {
@@ -238,53 +376,27 @@ async function calculateAllVisibilities(
 
   const comets: ObjectVisibility[] = [];
   for (const comet of cometCatalog) {
-    let visibility: ObjectVisibility | null;
-    try {
-      visibility = calculateCometVisibility(comet, calculator, nightInfo, settings.cometMagnitude);
-    } catch (error) {
-      // One malformed upstream orbit must not discard the user's entire
-      // forecast. Keep the remaining independently valid comet solutions.
-      logger.warn(`Skipping invalid comet orbit: ${comet.designation}`, error);
-      continue;
-    }
+    const visibility = calculateCometVisibility(
+      comet,
+      calculator,
+      nightInfo,
+      settings.cometMagnitude
+    );
     if (visibility) comets.push(visibility);
   }
 
-  const dwarfPlanetVis: ObjectVisibility[] = [];
-  for (const dp of dwarfPlanetList) {
-    let visibility: ObjectVisibility | null;
-    try {
-      visibility = calculateMinorPlanetVisibility(
-        dp,
-        calculator,
-        nightInfo,
-        settings.cometMagnitude
-      );
-    } catch (error) {
-      throw errorWithCause(`Invalid dwarf-planet orbit: ${dp.name}`, error);
-    }
-    if (visibility) dwarfPlanetVis.push(visibility);
-  }
-
-  const asteroidVis: ObjectVisibility[] = [];
-  for (const asteroid of asteroidList) {
-    let visibility: ObjectVisibility | null;
-    try {
-      visibility = calculateMinorPlanetVisibility(
-        asteroid,
-        calculator,
-        nightInfo,
-        settings.cometMagnitude
-      );
-    } catch (error) {
-      throw errorWithCause(`Invalid asteroid orbit: ${asteroid.name}`, error);
-    }
-    if (visibility) {
-      const physicalData = await fetchAsteroidPhysicalData(asteroid.name);
-      if (physicalData) visibility.physicalData = physicalData;
-      asteroidVis.push(visibility);
-    }
-  }
+  const dwarfPlanetVis = calculateMinorPlanetVisibilities(
+    dwarfPlanetList,
+    calculator,
+    nightInfo,
+    settings.cometMagnitude
+  );
+  const asteroidVis = calculateMinorPlanetVisibilities(
+    asteroidList,
+    calculator,
+    nightInfo,
+    settings.cometMagnitude
+  );
 
   let milkyWay: MilkyWayPlan;
   let moon: ObjectVisibility;
@@ -331,7 +443,7 @@ function buildNightAstronomicalEvents(
   spaceWeather: Awaited<ReturnType<typeof fetchSpaceWeather>>,
   latitude: number,
   jupiterVisible: boolean,
-  timezone: string
+  nightKey: string
 ): AstronomicalEvents {
   const lunarApsis = getLunarApsisForNight(nightInfo);
   const eclipses = detectEclipses(nightDate, observer, 1);
@@ -339,8 +451,7 @@ function buildNightAstronomicalEvents(
   const jupiterMoons = jupiterVisible ? getJupiterMoonsData(nightInfo, true) : null;
   const eclipseSeason = getEclipseSeasonInfo(nightDate);
   const planetaryTransit = getTransitForDisplay(nightDate);
-  const nightDateStr = formatDateKey(nightDate, timezone);
-  const neoCloseApproaches = neoDataByDate.get(nightDateStr) ?? [];
+  const neoCloseApproaches = neoDataByDate.get(nightKey) ?? [];
   const moonPhaseEvents = getMoonPhaseEvents(nightDate, nightInfo);
   const planetsNearPerihelion = getPlanetsNearPerihelion(nightDate);
   const venusPeak = getVenusPeakInfo(nightDate);
@@ -386,25 +497,179 @@ function scoreNightObjects(
   const sunPos = calculator.getSunPosition(nightDate);
 
   // Calculate imaging windows
+  const findImagingWindow = createImagingWindowFinder(nightInfo, weather, calculator);
   for (const obj of allObjects) {
-    const imagingWindow = getBestImagingWindow(obj, nightInfo, weather, calculator);
+    const imagingWindow = findImagingWindow(obj);
     if (imagingWindow) obj.imagingWindow = imagingWindow;
   }
 
-  return allObjects
-    .map(obj =>
-      calculateTotalScore(
-        obj,
-        nightInfo,
-        weather,
-        sunPos.ra,
-        events.oppositions,
-        events.lunarApsis,
-        events.venusPeak,
-        fov
-      )
-    )
-    .sort((a, b) => b.totalScore - a.totalScore);
+  const scoreObject = createNightScorer(
+    nightInfo,
+    weather,
+    sunPos.ra,
+    events.oppositions,
+    events.lunarApsis,
+    events.venusPeak,
+    fov
+  );
+
+  return allObjects.map(scoreObject).sort((a, b) => b.totalScore - a.totalScore);
+}
+
+/**
+ * Inputs shared by every night of a forecast. Each night depends only on these
+ * and its own date, so nights can be analyzed independently of one another.
+ */
+interface NightAnalysisContext {
+  calculator: SkyCalculator;
+  observer: Astronomy.Observer;
+  settings: Settings;
+  latitude: number;
+  catalogs: {
+    dsoCatalog: PreparedDSOCatalog;
+    cometCatalog: Awaited<ReturnType<typeof fetchComets>>;
+    dwarfPlanets: PreparedMinorPlanet[];
+    asteroids: PreparedMinorPlanet[];
+  };
+  weatherData: Awaited<ReturnType<typeof fetchWeather>> | null;
+  airQualityData: Awaited<ReturnType<typeof fetchAirQuality>> | null;
+  oppositions: ReturnType<typeof detectOppositions>;
+  maxElongations: ReturnType<typeof detectMaxElongations>;
+  neoDataByDate: Map<string, NeoCloseApproach[]>;
+  spaceWeather: Awaited<ReturnType<typeof fetchSpaceWeather>>;
+  fov: { width: number; height: number } | null;
+}
+
+/**
+ * Analyze a single night: visibilities, weather, events and scored objects.
+ */
+function analyzeNight(
+  context: NightAnalysisContext,
+  nightDate: Date,
+  nightKey: string
+): { forecast: NightForecast; scored: ScoredObject[] } {
+  const {
+    calculator,
+    observer,
+    settings,
+    latitude,
+    catalogs,
+    weatherData,
+    airQualityData,
+    oppositions,
+    maxElongations,
+    neoDataByDate,
+    spaceWeather,
+    fov,
+  } = context;
+
+  // Calculate night info
+  const nightInfo = calculator.getNightInfo(nightDate);
+
+  // Calculate exact moon phase events
+  const moonPhaseEvents = getMoonPhaseEvents(nightDate, nightInfo);
+  nightInfo.moonPhaseExact = moonPhaseEvents.tonightEvent;
+
+  // Calculate local sidereal time at midnight (UTC midpoint of astronomical night)
+  nightInfo.localSiderealTimeAtMidnight = getLocalSiderealTime(
+    calculator.getNightMidpoint(nightInfo).date,
+    calculator.getLongitude()
+  );
+
+  // Calculate all object visibilities
+  let vis: AllVisibilities;
+  try {
+    vis = calculateAllVisibilities(
+      calculator,
+      observer,
+      nightInfo,
+      nightDate,
+      catalogs.dsoCatalog,
+      catalogs.cometCatalog,
+      catalogs.dwarfPlanets,
+      catalogs.asteroids,
+      settings
+    );
+  } catch (error) {
+    throw errorWithCause(`Visibility calculation failed for ${nightDate.toISOString()}`, error);
+  }
+
+  // Parse weather for this night
+  let weather: NightWeather | null = null;
+  if (weatherData) {
+    try {
+      weather = parseNightWeather(weatherData, airQualityData, nightInfo);
+    } catch {
+      // Weather parsing failed
+    }
+  }
+
+  const forecastConfidence: 'high' | 'medium' | 'low' =
+    weather !== null && weather.avgAerosolOpticalDepth !== null
+      ? 'high'
+      : weather === null
+        ? 'low'
+        : 'medium';
+
+  nightInfo.seeingForecast = getSeeingFromWeather(weather);
+
+  // Build events
+  const conjunctions = detectConjunctions(observer, vis.planets, nightInfo);
+  const meteorShowers = detectMeteorShowers(calculator, nightInfo);
+  const astronomicalEvents = buildNightAstronomicalEvents(
+    nightDate,
+    nightInfo,
+    observer,
+    oppositions,
+    maxElongations,
+    neoDataByDate,
+    spaceWeather,
+    latitude,
+    vis.jupiterVisible,
+    nightKey
+  );
+
+  // Create forecast
+  const forecast: NightForecast = {
+    nightInfo,
+    planets: vis.planets,
+    dsos: vis.dsos,
+    comets: vis.comets,
+    dwarfPlanets: vis.dwarfPlanets,
+    asteroids: vis.asteroids,
+    // Keep the complete band and core geometry even when parts are below the
+    // usable night window so the planner can explain every outcome.
+    milkyWay: vis.milkyWay,
+    moon: vis.moon,
+    weather,
+    forecastConfidence,
+    conjunctions,
+    meteorShowers,
+    astronomicalEvents,
+  };
+
+  // Score all objects
+  const allObjects: ObjectVisibility[] = [
+    ...vis.planets,
+    ...vis.dsos,
+    ...vis.comets,
+    ...vis.dwarfPlanets,
+    ...vis.asteroids,
+    selectMilkyWayRepresentative(vis.milkyWay),
+    ...(vis.moon.isVisible ? [vis.moon] : []),
+  ];
+
+  const scored = scoreNightObjects(
+    allObjects,
+    nightInfo,
+    weather,
+    calculator,
+    nightDate,
+    astronomicalEvents,
+    fov
+  );
+
+  return { forecast, scored };
 }
 
 /**
@@ -423,7 +688,7 @@ export async function generateForecast(
 
   // Initialize calculator
   progress('Initializing astronomical calculator...', 5);
-  const calculator = new SkyCalculator(latitude, longitude);
+  const calculator = getSkyCalculator(latitude, longitude);
   const observer = new Astronomy.Observer(latitude, longitude, 0);
 
   // Start independent data sources together. On a cold load this removes a
@@ -466,6 +731,17 @@ export async function generateForecast(
   localNow.setHours(12, 0, 0, 0);
   const today = fromZonedTime(localNow, locationTimezone);
 
+  // Advance absolute days from the selected location's noon anchor. Using
+  // setDate() here would apply the device's DST rules, which may be unrelated
+  // to the observing location.
+  const nightDates = Array.from(
+    { length: forecastDays },
+    (_, dayOffset) => new Date(today.getTime() + dayOffset * 86_400_000)
+  );
+  // Civil-date keys in the location's timezone, shared by the NEO lookup and
+  // the scored-object map.
+  const nightKeys = nightDates.map(nightDate => formatDateKey(nightDate, locationTimezone));
+
   // Start the location-dependent NEO request before synchronous event work so
   // its network latency overlaps those calculations.
   const neoDataPromise = withFallback(
@@ -481,133 +757,53 @@ export async function generateForecast(
   // Both feeds are independent and were started as early as their inputs allowed.
   const [neoDataByDate, spaceWeather] = await Promise.all([neoDataPromise, spaceWeatherPromise]);
 
+  // One malformed upstream orbit must not discard the user's entire forecast.
+  // Validate each comet once across the forecast span instead of guarding
+  // every per-night evaluation.
+  const forecastStartJd = today.getTime() / 86_400_000 + 2440587.5;
+  const forecastJds = [forecastStartJd, forecastStartJd + forecastDays];
+  const validComets = cometCatalog.filter(comet => {
+    if (isPropagatableComet(comet, forecastJds)) return true;
+    logger.warn(`Skipping invalid comet orbit: ${comet.designation}`);
+    return false;
+  });
+
   // Compute effective FOV for scoring
   const fov = getEffectiveFOV(settings.telescope, settings.customFOV);
 
-  for (let i = 0; i < forecastDays; i++) {
-    // Advance absolute days from the selected location's noon anchor. Using
-    // setDate() here would apply the device's DST rules, which may be unrelated
-    // to the observing location.
-    const nightDate = new Date(today.getTime() + i * 86_400_000);
+  const nightContext: NightAnalysisContext = {
+    calculator,
+    observer,
+    settings,
+    latitude,
+    catalogs: {
+      dsoCatalog: prepareDSOCatalog(dsoCatalog),
+      cometCatalog: validComets,
+      dwarfPlanets: prepareMinorPlanets(dwarfPlanets),
+      asteroids: prepareMinorPlanets(asteroids),
+    },
+    weatherData,
+    airQualityData,
+    oppositions,
+    maxElongations,
+    neoDataByDate,
+    spaceWeather,
+    fov,
+  };
 
+  for (const [i, nightDate] of nightDates.entries()) {
     const progressPercent = 30 + Math.floor((i / forecastDays) * 60);
     progress(`Analyzing night ${i + 1} of ${forecastDays}...`, progressPercent);
 
-    // Yield to event loop so progress updates can render
+    // Yield to event loop so progress updates can render. This is the only
+    // suspension point per night: the night analysis itself is synchronous,
+    // so it runs as one uninterrupted task instead of resuming through a
+    // microtask for every visible asteroid.
     await new Promise(resolve => setTimeout(resolve, 0));
 
-    // Calculate night info
-    const nightInfo = calculator.getNightInfo(nightDate);
-
-    // Calculate exact moon phase events
-    const moonPhaseEvents = getMoonPhaseEvents(nightDate, nightInfo);
-    nightInfo.moonPhaseExact = moonPhaseEvents.tonightEvent;
-
-    // Calculate local sidereal time at midnight (UTC midpoint of astronomical night)
-    const midnight = new Date(
-      (nightInfo.observingWindowStart.getTime() + nightInfo.observingWindowEnd.getTime()) / 2
-    );
-    nightInfo.localSiderealTimeAtMidnight = getLocalSiderealTime(
-      midnight,
-      calculator.getLongitude()
-    );
-
-    // Calculate all object visibilities
-    let vis: Awaited<ReturnType<typeof calculateAllVisibilities>>;
-    try {
-      vis = await calculateAllVisibilities(
-        calculator,
-        observer,
-        nightInfo,
-        nightDate,
-        dsoCatalog,
-        cometCatalog,
-        dwarfPlanets,
-        asteroids,
-        settings
-      );
-    } catch (error) {
-      throw errorWithCause(`Visibility calculation failed for ${nightDate.toISOString()}`, error);
-    }
-
-    // Parse weather for this night
-    let weather: NightWeather | null = null;
-    if (weatherData) {
-      try {
-        weather = parseNightWeather(weatherData, airQualityData, nightInfo);
-      } catch {
-        // Weather parsing failed
-      }
-    }
-
-    const forecastConfidence: 'high' | 'medium' | 'low' =
-      weather !== null && weather.avgAerosolOpticalDepth !== null
-        ? 'high'
-        : weather === null
-          ? 'low'
-          : 'medium';
-
-    nightInfo.seeingForecast = getSeeingFromWeather(weather);
-
-    // Build events
-    const conjunctions = detectConjunctions(observer, vis.planets, nightInfo);
-    const meteorShowers = detectMeteorShowers(calculator, nightInfo);
-    const astronomicalEvents = buildNightAstronomicalEvents(
-      nightDate,
-      nightInfo,
-      observer,
-      oppositions,
-      maxElongations,
-      neoDataByDate,
-      spaceWeather,
-      latitude,
-      vis.jupiterVisible,
-      locationTimezone
-    );
-
-    // Create forecast
-    const forecast: NightForecast = {
-      nightInfo,
-      planets: vis.planets,
-      dsos: vis.dsos,
-      comets: vis.comets,
-      dwarfPlanets: vis.dwarfPlanets,
-      asteroids: vis.asteroids,
-      // Keep the complete band and core geometry even when parts are below the
-      // usable night window so the planner can explain every outcome.
-      milkyWay: vis.milkyWay,
-      moon: vis.moon,
-      weather,
-      forecastConfidence,
-      conjunctions,
-      meteorShowers,
-      astronomicalEvents,
-    };
-
+    const { forecast, scored } = analyzeNight(nightContext, nightDate, nightKeys[i]);
     forecasts.push(forecast);
-
-    // Score all objects
-    const allObjects: ObjectVisibility[] = [
-      ...vis.planets,
-      ...vis.dsos,
-      ...vis.comets,
-      ...vis.dwarfPlanets,
-      ...vis.asteroids,
-      selectMilkyWayRepresentative(vis.milkyWay),
-      ...(vis.moon.isVisible ? [vis.moon] : []),
-    ];
-
-    const scored = scoreNightObjects(
-      allObjects,
-      nightInfo,
-      weather,
-      calculator,
-      nightDate,
-      astronomicalEvents,
-      fov
-    );
-
-    scoredObjects.set(formatDateKey(nightDate, locationTimezone), scored);
+    scoredObjects.set(nightKeys[i], scored);
   }
 
   // Determine best nights
@@ -624,13 +820,18 @@ export async function generateForecast(
   };
 }
 
+/** Number of nights highlighted as the best of the forecast. */
+const MAX_BEST_NIGHTS = 3;
+
 /**
  * Determine the best nights based on night quality score.
  * Uses the same scoring system as the displayed night rating for consistency.
  * Only considers nights that have a valid observation window (bestTime).
  */
 function determineBestNights(forecasts: NightForecast[], timezone?: string): string[] {
-  const nightScores: Array<{ date: string; score: number }> = [];
+  // Keep the top nights in one pass (descending score, earlier night first on
+  // ties) instead of collecting, filtering and sorting every night.
+  const best: Array<{ forecast: NightForecast; score: number }> = [];
 
   for (const forecast of forecasts) {
     // Only consider nights with a valid observation window
@@ -641,19 +842,18 @@ function determineBestNights(forecasts: NightForecast[], timezone?: string): str
 
     // Use the same night quality calculation as displayed in the UI
     // This ensures the "best nights" badge aligns with the star rating shown
-    const quality = calculateHeadlineNightQuality(forecast.weather, forecast.nightInfo);
+    const { score } = calculateHeadlineNightQuality(forecast.weather, forecast.nightInfo);
 
-    nightScores.push({
-      date: formatDateKey(forecast.nightInfo.date, timezone),
-      score: quality.score,
-    });
+    // Only include nights with at least a "fair" score (40+)
+    if (score < 40) continue;
+
+    let insertAt = best.length;
+    while (insertAt > 0 && score > best[insertAt - 1].score) insertAt--;
+    if (insertAt < MAX_BEST_NIGHTS) {
+      best.splice(insertAt, 0, { forecast, score });
+      if (best.length > MAX_BEST_NIGHTS) best.pop();
+    }
   }
 
-  // Sort by score and return top nights (up to 3)
-  // Only include nights with at least a "fair" score (40+)
-  return nightScores
-    .filter(n => n.score >= 40)
-    .sort((a, b) => b.score - a.score)
-    .slice(0, 3)
-    .map(n => n.date);
+  return best.map(({ forecast }) => formatDateKey(forecast.nightInfo.date, timezone));
 }
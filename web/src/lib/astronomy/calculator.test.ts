@@ -1,7 +1,33 @@
 import * as Astronomy from 'astronomy-engine';
 import { beforeEach, describe, expect, it } from 'vitest';
 import { createMockNightInfo } from '@/test/factories';
-import { angularSeparation, SkyCalculator } from './calculator';
+import {
+  angularSeparation,
+  buildCatalogColumns,
+  catalogColumnDirection,
+  getSkyCalculator,
+  j2000Direction,
+  SkyCalculator,
+} from './calculator';
+
+describe('catalogColumnDirection', () => {
+  it('matches j2000Direction for each catalog row', () => {
+    const targets = [
+      { raHours: 0, decDegrees: 0 },
+      { raHours: 5.5, decDegrees: -69.75 },
+      { raHours: 18.6, decDegrees: 38.8 },
+    ];
+    const columns = buildCatalogColumns(targets);
+
+    for (const [index, { raHours, decDegrees }] of targets.entries()) {
+      const expected = j2000Direction(raHours, decDegrees);
+      const direction = catalogColumnDirection(columns, index);
+      for (let axis = 0; axis < 3; axis++) {
+        expect(direction[axis]).toBeCloseTo(expected[axis], 12);
+      }
+    }
+  });
+});
 
 describe('angularSeparation', () => {
   it('should return 0 for identical positions', () => {
@@ -692,6 +718,15 @@ describe('SkyCalculator', () => {
       expect(result).toHaveProperty('altitude');
       expect(result).toHaveProperty('azimuth');
     });
+
+    it('gives a J2000 direction consistent with its RA and Dec', () => {
+      const result = calculator.getMoonPosition(new Date('2025-01-15T22:00:00Z'));
+      const expected = j2000Direction(result.ra, result.dec);
+
+      for (let axis = 0; axis < 3; axis++) {
+        expect(result.direction[axis]).toBeCloseTo(expected[axis], 10);
+      }
+    });
   });
 
   describe('getSunPosition', () => {
@@ -732,6 +767,83 @@ describe('SkyCalculator', () => {
     });
   });
 
+  describe('getAltitudeCeiling', () => {
+    it('bounds the sampled peak altitude of fixed targets', () => {
+      const nightInfo = calculator.getNightInfo(new Date('2025-01-15T12:00:00Z'));
+      const ceiling = calculator.getAltitudeCeiling(nightInfo);
+
+      for (let raHours = 0; raHours < 24; raHours += 3) {
+        for (const decDeg of [-45, -20, 0, 30, 70]) {
+          const { maxAltitude } = calculator.calculateVisibility(
+            raHours,
+            decDeg,
+            nightInfo,
+            'Test Object',
+            'dso'
+          );
+          const bound = ceiling(raHours, decDeg);
+
+          expect(bound + 2).toBeGreaterThanOrEqual(maxAltitude);
+          if (maxAltitude > 0) expect(bound).toBeGreaterThan(maxAltitude - 2);
+        }
+      }
+    });
+
+    it('screens out every target when there is no observing window', () => {
+      const nightInfo = createMockNightInfo({ observingWindowMode: 'none' });
+      expect(calculator.getAltitudeCeiling(nightInfo)(6, 0)).toBe(-90);
+    });
+  });
+
+  describe('screenCatalogColumns', () => {
+    it('keeps exactly the targets whose ceiling reaches the threshold', () => {
+      const nightInfo = calculator.getNightInfo(new Date('2025-01-15T12:00:00Z'));
+      const ceiling = calculator.getAltitudeCeiling(nightInfo);
+      const targets: { raHours: number; decDegrees: number }[] = [];
+      for (let raHours = 0; raHours < 24; raHours += 2) {
+        for (const decDegrees of [-80, -45, -20, 0, 30, 70]) targets.push({ raHours, decDegrees });
+      }
+
+      const mask = calculator.screenCatalogColumns(nightInfo, buildCatalogColumns(targets), -2);
+
+      for (const [index, { raHours, decDegrees }] of targets.entries()) {
+        expect(mask[index]).toBe(ceiling(raHours, decDegrees) >= -2 ? 1 : 0);
+      }
+    });
+  });
+
+  describe('getAltAzForTargets', () => {
+    it('matches per-target altitude and azimuth', () => {
+      const time = new Date('2025-01-16T00:00:00Z');
+      const targets = [
+        { raHours: 3, decDeg: 58 },
+        { raHours: 14.2, decDeg: -12 },
+      ];
+      const batch = calculator.getAltAzForTargets(targets, time);
+
+      for (const [index, { raHours, decDeg }] of targets.entries()) {
+        const single = calculator.getAltAz(raHours, decDeg, time);
+        expect(batch[index].altitude).toBeCloseTo(single.altitude, 4);
+        expect(batch[index].azimuth).toBeCloseTo(single.azimuth, 4);
+      }
+    });
+  });
+
+  describe('getNightMidpoint', () => {
+    it('returns one shared AstroTime at the middle of the observing window', () => {
+      const nightInfo = calculator.getNightInfo(new Date('2025-01-15T12:00:00Z'));
+      const midpoint = calculator.getNightMidpoint(nightInfo);
+      const expectedMs =
+        (nightInfo.observingWindowStart.getTime() + nightInfo.observingWindowEnd.getTime()) / 2;
+
+      expect(midpoint.date.getTime()).toBe(expectedMs);
+      expect(calculator.getNightMidpoint(nightInfo)).toBe(midpoint);
+      expect(calculator.getAltAz(6, 20, midpoint)).toEqual(
+        calculator.getAltAz(6, 20, new Date(expectedMs))
+      );
+    });
+  });
+
   describe('calculateVisibility', () => {
     it('should return visibility info', () => {
       const nightInfo = calculator.getNightInfo(new Date('2025-01-15T12:00:00Z'));
@@ -780,6 +892,68 @@ describe('SkyCalculator', () => {
       expect(result.maxAltitude).toBeLessThan(30);
       expect(result.isVisible).toBe(true);
     });
+
+    it('skips moon geometry for targets that never rise', () => {
+      const nightInfo = calculator.getNightInfo(new Date('2025-01-15T12:00:00Z'));
+      const result = calculator.calculateVisibility(12, -80, nightInfo, 'Circumpolar south', 'dso');
+
+      expect(result.isVisible).toBe(false);
+      expect(result.moonSeparation).toBeNull();
+      expect(result.moonAltitudeAtPeak).toBeNull();
+      expect(result.moonWarning).toBe(false);
+    });
+
+    it('matches per-time getAltAz on the shared night sample grid', () => {
+      const nightInfo = calculator.getNightInfo(new Date('2025-01-15T12:00:00Z'));
+      const result = calculator.calculateVisibility(5.588, -5.391, nightInfo, 'M42', 'dso');
+
+      for (const [index, [time, altitude]] of result.altitudeSamples.entries()) {
+        const expected = calculator.getAltAz(5.588, -5.391, time);
+        expect(altitude).toBeCloseTo(expected.altitude, 3);
+        expect(result.azimuthSamples[index][1]).toBeCloseTo(expected.azimuth, 3);
+      }
+    });
+
+    it('reports threshold windows consistent with the altitude samples', () => {
+      const nightInfo = calculator.getNightInfo(new Date('2025-01-15T12:00:00Z'));
+      // Capella culminates near 86° from New York and stays high through a winter night.
+      const result = calculator.calculateVisibility(5.278, 45.998, nightInfo, 'Capella', 'dso');
+
+      expect(result.above45Start).not.toBeNull();
+      expect(result.above45End).not.toBeNull();
+      const start = (result.above45Start as Date).getTime();
+      const end = (result.above45End as Date).getTime();
+      expect(end).toBeGreaterThan(start);
+      for (const [time, altitude] of result.altitudeSamples) {
+        if (time.getTime() > start + 1 && time.getTime() < end - 1) {
+          expect(altitude).toBeGreaterThanOrEqual(45);
+        }
+      }
+    });
+
+    it('skips windows above the peak altitude', () => {
+      const nightInfo = calculator.getNightInfo(new Date('2025-01-15T12:00:00Z'));
+      const result = calculator.calculateVisibility(5.588, -5.391, nightInfo, 'M42', 'dso');
+
+      expect(result.maxAltitude).toBeLessThan(60);
+      expect(result.above60Start).toBeNull();
+      expect(result.above75Start).toBeNull();
+    });
+
+    it('derives peak moon geometry from the shared Moon samples', () => {
+      const nightInfo = calculator.getNightInfo(new Date('2025-01-15T12:00:00Z'));
+      const result = calculator.calculateVisibility(5.588, -5.391, nightInfo, 'M42', 'dso');
+      const peakTime = result.maxAltitudeTime as Date;
+
+      expect(result.moonSeparation).toBeCloseTo(
+        calculator.getMoonSeparation(result.raHours, result.decDegrees, peakTime),
+        6
+      );
+      expect(result.moonAltitudeAtPeak).toBeCloseTo(
+        calculator.getMoonPosition(peakTime).altitude,
+        6
+      );
+    });
   });
 
   describe('calculatePlanetVisibility', () => {
@@ -791,6 +965,19 @@ describe('SkyCalculator', () => {
       expect(result.objectType).toBe('planet');
     });
 
+    it('matches the full ephemeris at every night sample', () => {
+      const nightInfo = calculator.getNightInfo(new Date('2025-01-15T12:00:00Z'));
+      const result = calculator.calculatePlanetVisibility('mars', nightInfo);
+      const observer = new Astronomy.Observer(latitude, longitude, elevation);
+
+      for (const [index, [time, altitude]] of result.altitudeSamples.entries()) {
+        const equator = Astronomy.Equator(Astronomy.Body.Mars, time, observer, true, true);
+        const horizon = Astronomy.Horizon(time, observer, equator.ra, equator.dec, 'normal');
+        expect(altitude).toBeCloseTo(horizon.altitude, 3);
+        expect(result.azimuthSamples[index][1]).toBeCloseTo(horizon.azimuth, 3);
+      }
+    });
+
     it('should throw for invalid planet', () => {
       const nightInfo = calculator.getNightInfo(new Date('2025-01-15T12:00:00Z'));
 
@@ -836,3 +1023,13 @@ describe('SkyCalculator', () => {
     });
   });
 });
+
+describe('getSkyCalculator', () => {
+  it('shares one calculator per observing site', () => {
+    const calculator = getSkyCalculator(51.5074, -0.1278);
+
+    expect(getSkyCalculator(51.5074, -0.1278)).toBe(calculator);
+    expect(getSkyCalculator(40.7128, -74.006)).not.toBe(calculator);
+    expect(calculator.getLatitude()).toBe(51.5074);
+  });
+});
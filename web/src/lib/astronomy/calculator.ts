@@ -11,34 +11,88 @@ import { AU_TO_KM } from './constants';
 import { calculateMoonlightInfo } from './moonlight';
 import { calculateApparentDiameter, PLANET_DIAMETER_RANGES } from './planets';
 
-function getAboveAltitudeSegment(
-  startSample: [Date, number],
-  endSample: [Date, number],
-  threshold: number
-): [number, number] | null {
-  const [startTime, startAltitude] = startSample;
-  const [endTime, endAltitude] = endSample;
-  const startMs = startTime.getTime();
-  const endMs = endTime.getTime();
-  if (endMs <= startMs) return null;
-
-  const startsAbove = startAltitude >= threshold;
-  const endsAbove = endAltitude >= threshold;
-  if (!startsAbove && !endsAbove) return null;
-  if (startsAbove && endsAbove) return [startMs, endMs];
-
-  const ratio = (threshold - startAltitude) / (endAltitude - startAltitude);
-  const crossingMs = startMs + (endMs - startMs) * ratio;
-  return startsAbove ? [startMs, crossingMs] : [crossingMs, endMs];
+interface AltitudeWindows {
+  above45: [Date, Date] | null;
+  above60: [Date, Date] | null;
+  above75: [Date, Date] | null;
 }
 
-function appendOrMergeWindow(windows: [Date, Date][], segment: [number, number]): void {
-  const previous = windows[windows.length - 1];
-  if (previous && segment[0] <= previous[1].getTime() + 1) {
-    previous[1] = new Date(Math.max(previous[1].getTime(), segment[1]));
-    return;
-  }
-  windows.push([new Date(segment[0]), new Date(segment[1])]);
+const WINDOW_THRESHOLDS = [45, 60, 75] as const;
+
+/**
+ * Single-pass tracker of the longest interval above each window threshold.
+ * Samples are fed as they are computed, so one traversal of the night serves
+ * every threshold. Crossings are linearly interpolated between samples and
+ * touching segments are merged; ties keep the earliest window.
+ */
+function createAltitudeWindowScanner(): {
+  add: (timeMs: number, altitude: number) => void;
+  finish: () => AltitudeWindows;
+} {
+  const count = WINDOW_THRESHOLDS.length;
+  const runStart = new Float64Array(count);
+  const runEnd = new Float64Array(count);
+  const longestStart = new Float64Array(count);
+  const longestEnd = new Float64Array(count);
+  const hasRun = new Uint8Array(count);
+  const hasLongest = new Uint8Array(count);
+  let previousMs = 0;
+  let previousAltitude = 0;
+  let hasPrevious = false;
+
+  const closeRun = (k: number) => {
+    const isLonger = runEnd[k] - runStart[k] > longestEnd[k] - longestStart[k];
+    if (hasRun[k] && (!hasLongest[k] || isLonger)) {
+      longestStart[k] = runStart[k];
+      longestEnd[k] = runEnd[k];
+      hasLongest[k] = 1;
+    }
+  };
+
+  const add = (endMs: number, endAltitude: number) => {
+    const startMs = previousMs;
+    const startAltitude = previousAltitude;
+    const isFirst = !hasPrevious;
+    previousMs = endMs;
+    previousAltitude = endAltitude;
+    hasPrevious = true;
+    if (isFirst || endMs <= startMs) return;
+
+    for (let k = 0; k < count; k++) {
+      const threshold = WINDOW_THRESHOLDS[k];
+      const startsAbove = startAltitude >= threshold;
+      const endsAbove = endAltitude >= threshold;
+      if (!startsAbove && !endsAbove) continue;
+
+      let segmentStart = startMs;
+      let segmentEnd = endMs;
+      if (startsAbove !== endsAbove) {
+        const ratio = (threshold - startAltitude) / (endAltitude - startAltitude);
+        const crossingMs = startMs + (endMs - startMs) * ratio;
+        if (startsAbove) segmentEnd = crossingMs;
+        else segmentStart = crossingMs;
+      }
+
+      if (hasRun[k] && segmentStart <= runEnd[k] + 1) {
+        runEnd[k] = Math.max(runEnd[k], segmentEnd);
+      } else {
+        closeRun(k);
+        runStart[k] = segmentStart;
+        runEnd[k] = segmentEnd;
+        hasRun[k] = 1;
+      }
+    }
+  };
+
+  const finish = (): AltitudeWindows => {
+    const windowAt = (k: number): [Date, Date] | null => {
+      closeRun(k);
+      return hasLongest[k] ? [new Date(longestStart[k]), new Date(longestEnd[k])] : null;
+    };
+    return { above45: windowAt(0), above60: windowAt(1), above75: windowAt(2) };
+  };
+
+  return { add, finish };
 }
 
 interface VisibilityOptions {
@@ -52,6 +106,8 @@ interface VisibilityOptions {
   constellation?: string;
   isMessier?: boolean;
   positionAtTime?: (time: Date) => { raHours: number; decDegrees: number };
+  /** Precomputed `j2000Direction` for fixed targets that are sampled every night. */
+  direction?: readonly [number, number, number];
 }
 
 function buildObjectMetadata(objectName: string, options: VisibilityOptions) {
@@ -68,6 +124,37 @@ function buildObjectMetadata(objectName: string, options: VisibilityOptions) {
   };
 }
 
+/**
+ * Optional fields the forecast pipeline fills in after a visibility record is
+ * built. Declaring them at construction gives every record the same property
+ * layout, so the per-object scoring loop stays monomorphic instead of reading
+ * from many differently-shaped objects.
+ */
+const DEFERRED_VISIBILITY_FIELDS = {
+  elongationDeg: undefined,
+  isAtOpposition: undefined,
+  libration: undefined,
+  hourAngle: undefined,
+  meridianTransitTime: undefined,
+  sunAngle: undefined,
+  heliocentricDistanceAU: undefined,
+  geocentricDistanceAU: undefined,
+  isNearPerihelion: undefined,
+  perihelionSolarFluxBoostPercent: undefined,
+  imagingWindow: undefined,
+  saturnRings: undefined,
+  physicalData: undefined,
+} satisfies Partial<ObjectVisibility>;
+
+/** Angular distance in degrees between two unit vectors. */
+export function directionSeparation(
+  a: readonly [number, number, number],
+  b: readonly [number, number, number]
+): number {
+  const cosine = a[0] * b[0] + a[1] * b[1] + a[2] * b[2];
+  return (Math.acos(Math.max(-1, Math.min(1, cosine))) * 180) / Math.PI;
+}
+
 /**
  * Calculate angular separation between two celestial objects
  * Uses Vincenty formula for accuracy
@@ -100,22 +187,210 @@ export function angularSeparation(ra1: number, dec1: number, ra2: number, dec2:
 function equatorOfDateFromJ2000(
   raHours: number,
   decDegrees: number,
-  time: Date
+  time: Astronomy.FlexibleDateTime
 ): { ra: number; dec: number } {
+  const astroTime = Astronomy.MakeTime(time);
+  const vector = j2000UnitVector(raHours, decDegrees, astroTime);
+  const ofDateVector = Astronomy.RotateVector(Astronomy.Rotation_EQJ_EQD(astroTime), vector);
+  const equator = Astronomy.EquatorFromVector(ofDateVector);
+  return { ra: equator.ra, dec: equator.dec };
+}
+
+/** Direction cosines of J2000 equatorial coordinates. */
+export function j2000Direction(raHours: number, decDegrees: number): [number, number, number] {
   const raRadians = (raHours * 15 * Math.PI) / 180;
   const decRadians = (decDegrees * Math.PI) / 180;
   const cosDec = Math.cos(decRadians);
-  const vector = new Astronomy.Vector(
-    cosDec * Math.cos(raRadians),
-    cosDec * Math.sin(raRadians),
-    Math.sin(decRadians),
-    new Astronomy.AstroTime(time)
+  return [cosDec * Math.cos(raRadians), cosDec * Math.sin(raRadians), Math.sin(decRadians)];
+}
+
+/** Unit vector for fixed J2000 catalog coordinates. */
+function j2000UnitVector(
+  raHours: number,
+  decDegrees: number,
+  time: Astronomy.FlexibleDateTime
+): Astronomy.Vector {
+  const [x, y, z] = j2000Direction(raHours, decDegrees);
+  return new Astronomy.Vector(x, y, z, Astronomy.MakeTime(time));
+}
+
+/**
+ * Refracted horizontal coordinates of a J2000 direction under an EQJ → HOR
+ * rotation. Equivalent to RotateVector + HorizonFromVector without allocating
+ * intermediate vectors, since this runs for every target at every sample.
+ */
+function horizonFromJ2000Direction(
+  rotation: Astronomy.RotationMatrix,
+  x: number,
+  y: number,
+  z: number
+): { altitude: number; azimuth: number } {
+  const rot = rotation.rot;
+  return horizonFromComponents(
+    rot[0][0] * x + rot[1][0] * y + rot[2][0] * z,
+    rot[0][1] * x + rot[1][1] * y + rot[2][1] * z,
+    rot[0][2] * x + rot[1][2] * y + rot[2][2] * z
   );
-  const ofDateVector = Astronomy.RotateVector(Astronomy.Rotation_EQJ_EQD(time), vector);
-  const equator = Astronomy.EquatorFromVector(ofDateVector);
-  return { ra: equator.ra, dec: equator.dec };
 }
 
+/**
+ * Flatten per-sample J2000 → horizontal rotations into one contiguous table
+ * of nine entries per sample, laid out as the north, west and zenith rows.
+ */
+function packRotations(rotations: Astronomy.RotationMatrix[]): Float64Array {
+  const table = new Float64Array(rotations.length * 9);
+  for (let index = 0; index < rotations.length; index++) {
+    const rot = rotations[index].rot;
+    const offset = index * 9;
+    for (let axis = 0; axis < 3; axis++) {
+      table[offset + axis * 3] = rot[0][axis];
+      table[offset + axis * 3 + 1] = rot[1][axis];
+      table[offset + axis * 3 + 2] = rot[2][axis];
+    }
+  }
+  return table;
+}
+
+/** Horizontal coordinates from north, west and zenith direction components. */
+function horizonFromComponents(
+  north: number,
+  west: number,
+  zenith: number
+): { altitude: number; azimuth: number } {
+  const geometricAltitude = (Math.atan2(zenith, Math.hypot(north, west)) * 180) / Math.PI;
+  let azimuth = (Math.atan2(-west, north) * 180) / Math.PI;
+  if (azimuth < 0) azimuth += 360;
+
+  return {
+    altitude: geometricAltitude + Astronomy.Refraction('normal', geometricAltitude),
+    azimuth,
+  };
+}
+
+/** Planet bodies keyed by lowercase name. */
+const PLANET_BODIES: ReadonlyMap<string, Astronomy.Body> = new Map([
+  ['mercury', Astronomy.Body.Mercury],
+  ['venus', Astronomy.Body.Venus],
+  ['mars', Astronomy.Body.Mars],
+  ['jupiter', Astronomy.Body.Jupiter],
+  ['saturn', Astronomy.Body.Saturn],
+  ['uranus', Astronomy.Body.Uranus],
+  ['neptune', Astronomy.Body.Neptune],
+]);
+
+/** Spacing of the ephemeris knots that planet positions are interpolated from. */
+const PLANET_KNOT_INTERVAL_MS = 60 * 60 * 1000;
+
+/**
+ * Topocentric equator-of-date position of a planet, linearly interpolated
+ * from hourly ephemeris knots spanning [startMs, endMs]. Planet directions
+ * (including diurnal parallax) are smooth on this scale, so the interpolation
+ * error stays far below an arcsecond while needing a fraction of the full
+ * ephemeris evaluations.
+ */
+function createPlanetEquatorInterpolator(
+  body: Astronomy.Body,
+  observer: Astronomy.Observer,
+  startMs: number,
+  endMs: number
+): (timeMs: number) => { ra: number; dec: number } {
+  const knotCount = Math.max(2, Math.ceil((endMs - startMs) / PLANET_KNOT_INTERVAL_MS) + 1);
+  const xs = new Float64Array(knotCount);
+  const ys = new Float64Array(knotCount);
+  const zs = new Float64Array(knotCount);
+  for (let index = 0; index < knotCount; index++) {
+    const knotTime = new Date(startMs + index * PLANET_KNOT_INTERVAL_MS);
+    const { vec } = Astronomy.Equator(body, knotTime, observer, true, true);
+    xs[index] = vec.x;
+    ys[index] = vec.y;
+    zs[index] = vec.z;
+  }
+
+  return timeMs => {
+    const position = (timeMs - startMs) / PLANET_KNOT_INTERVAL_MS;
+    const index = Math.min(knotCount - 2, Math.max(0, Math.floor(position)));
+    const fraction = position - index;
+    const x = xs[index] + (xs[index + 1] - xs[index]) * fraction;
+    const y = ys[index] + (ys[index + 1] - ys[index]) * fraction;
+    const z = zs[index] + (zs[index + 1] - zs[index]) * fraction;
+
+    let ra = (Math.atan2(y, x) * 12) / Math.PI;
+    if (ra < 0) ra += 24;
+    return { ra, dec: (Math.atan2(z, Math.hypot(x, y)) * 180) / Math.PI };
+  };
+}
+
+/** Upper bound on a fixed J2000 target's geometric altitude over a night. */
+type AltitudeCeiling = (raHours: number, decDeg: number) => number;
+
+/** The same bound as the sine of the altitude, from precomputed declination trig. */
+type SineAltitudeCeiling = (raHours: number, sinDec: number, cosDec: number) => number;
+
+/**
+ * Fixed catalog coordinates laid out column-wise, with the declination trig
+ * resolved once so a nightly screen only varies the hour angle.
+ */
+export interface CatalogColumns {
+  raHours: Float64Array;
+  sinDec: Float64Array;
+  cosDec: Float64Array;
+}
+
+export function buildCatalogColumns(
+  targets: ReadonlyArray<{ raHours: number; decDegrees: number }>
+): CatalogColumns {
+  const raHours = new Float64Array(targets.length);
+  const sinDec = new Float64Array(targets.length);
+  const cosDec = new Float64Array(targets.length);
+  for (const [index, target] of targets.entries()) {
+    const decRadians = (target.decDegrees * Math.PI) / 180;
+    raHours[index] = target.raHours;
+    sinDec[index] = Math.sin(decRadians);
+    cosDec[index] = Math.cos(decRadians);
+  }
+  return { raHours, sinDec, cosDec };
+}
+
+/** `j2000Direction` for one catalog row, reusing its stored declination trig. */
+export function catalogColumnDirection(
+  columns: CatalogColumns,
+  index: number
+): [number, number, number] {
+  const raRadians = (columns.raHours[index] * 15 * Math.PI) / 180;
+  const cosDec = columns.cosDec[index];
+  return [cosDec * Math.cos(raRadians), cosDec * Math.sin(raRadians), columns.sinDec[index]];
+}
+
+/**
+ * Sample times shared by every object evaluated for one night. The J2000 →
+ * horizontal rotations depend only on time and observer, so they are built
+ * once per night and reused for all fixed-position targets.
+ */
+interface NightSampleGrid {
+  times: Date[];
+  timesMs: Float64Array;
+  astroTimes: Astronomy.AstroTime[] | null;
+  midpoint: Astronomy.AstroTime | null;
+  rotations: Astronomy.RotationMatrix[] | null;
+  rotationTable: Float64Array | null;
+  altitudeCeiling: AltitudeCeiling | null;
+  sineAltitudeCeiling: SineAltitudeCeiling | null;
+  moon: MoonPosition[] | null;
+}
+
+interface MoonPosition {
+  ra: number;
+  dec: number;
+  altitude: number;
+  azimuth: number;
+  direction: readonly [number, number, number]; // J2000 unit vector
+}
+
+const SAMPLE_INTERVAL_MS = 10 * 60 * 1000;
+
+/** Sidereal hours elapsed per solar hour. */
+const SIDEREAL_RATE = 1.00273790935;
+
 interface SolarObservingWindow {
   astronomicalNightMode: NightInfo['astronomicalNightMode'];
   observingWindowMode: NightInfo['observingWindowMode'];
@@ -221,6 +496,7 @@ function resolveSolarObservingWindow(
 
 export class SkyCalculator {
   private observer: Astronomy.Observer;
+  private nightSampleGrids = new WeakMap<NightInfo, NightSampleGrid>();
 
   constructor(latitude: number, longitude: number, elevation: number = 0) {
     this.observer = new Astronomy.Observer(latitude, longitude, elevation);
@@ -350,10 +626,10 @@ export class SkyCalculator {
       seeingForecast: null,
     };
 
-    const moonSamples = this.sampleAltitudesForNight(time => {
-      const position = this.getMoonPosition(time);
-      return { altitude: position.altitude, azimuth: position.azimuth };
-    }, nightInfo).altitudeSamples;
+    const moonPositions = this.getNightMoonSamples(nightInfo);
+    const moonSamples: [Date, number][] = this.getNightSampleGrid(nightInfo).times.map(
+      (time, index) => [time, moonPositions[index].altitude]
+    );
     nightInfo.moonlight = calculateMoonlightInfo(
       moonIlluminationPct,
       moonSamples,
@@ -370,20 +646,38 @@ export class SkyCalculator {
   getAltAz(
     raHours: number,
     decDeg: number,
-    time: Date
+    time: Astronomy.FlexibleDateTime
   ): {
     altitude: number;
     azimuth: number;
   } {
-    const equatorOfDate = equatorOfDateFromJ2000(raHours, decDeg, time);
-    return this.getAltAzOfDate(equatorOfDate.ra, equatorOfDate.dec, time);
+    const astroTime = Astronomy.MakeTime(time);
+    const equatorOfDate = equatorOfDateFromJ2000(raHours, decDeg, astroTime);
+    return this.getAltAzOfDate(equatorOfDate.ra, equatorOfDate.dec, astroTime);
+  }
+
+  /**
+   * Get altitude and azimuth for several fixed J2000 targets at one instant.
+   * The J2000 → horizontal rotation is built once and applied to every target.
+   */
+  getAltAzForTargets(
+    targets: ReadonlyArray<{ raHours: number; decDeg: number }>,
+    time: Astronomy.FlexibleDateTime
+  ): { altitude: number; azimuth: number }[] {
+    if (targets.length === 0) return [];
+
+    const rotation = Astronomy.Rotation_EQJ_HOR(time, this.observer);
+    return targets.map(({ raHours, decDeg }) => {
+      const [x, y, z] = j2000Direction(raHours, decDeg);
+      return horizonFromJ2000Direction(rotation, x, y, z);
+    });
   }
 
   /** Convert equator-of-date coordinates to local horizontal coordinates. */
   private getAltAzOfDate(
     raHours: number,
     decDeg: number,
-    time: Date
+    time: Astronomy.FlexibleDateTime
   ): { altitude: number; azimuth: number } {
     const horizon = Astronomy.Horizon(time, this.observer, raHours, decDeg, 'normal');
 
@@ -396,11 +690,20 @@ export class SkyCalculator {
   /**
    * Get moon position at a given time
    */
-  getMoonPosition(time: Date): { ra: number; dec: number; altitude: number; azimuth: number } {
-    const moonEquator = Astronomy.Equator(Astronomy.Body.Moon, time, this.observer, false, true);
+  getMoonPosition(time: Astronomy.FlexibleDateTime): MoonPosition {
+    // One AstroTime serves all three calls so its cached nutation and
+    // sidereal time are computed once.
+    const astroTime = Astronomy.MakeTime(time);
+    const moonEquator = Astronomy.Equator(
+      Astronomy.Body.Moon,
+      astroTime,
+      this.observer,
+      false,
+      true
+    );
     const moonEquatorOfDate = Astronomy.Equator(
       Astronomy.Body.Moon,
-      time,
+      astroTime,
       this.observer,
       true,
       true
@@ -408,14 +711,20 @@ export class SkyCalculator {
     const { altitude, azimuth } = this.getAltAzOfDate(
       moonEquatorOfDate.ra,
       moonEquatorOfDate.dec,
-      time
+      astroTime
     );
 
+    // The J2000 direction comes from the ephemeris vector itself, so Moon
+    // separations against cached target directions need no further trig.
+    const { x, y, z } = moonEquator.vec;
+    const length = Math.hypot(x, y, z);
+
     return {
       ra: moonEquator.ra,
       dec: moonEquator.dec,
       altitude,
       azimuth,
+      direction: [x / length, y / length, z / length],
     };
   }
 
@@ -443,19 +752,6 @@ export class SkyCalculator {
     return time === null ? null : this.getBodyPositionJ2000(body, time);
   }
 
-  private getBodyMoonSeparationAtOptionalTime(
-    body: Astronomy.Body,
-    time: Date | null
-  ): number | null {
-    if (time === null) return null;
-    const equator = this.getBodyPositionJ2000(body, time);
-    return this.getMoonSeparation(equator.ra, equator.dec, time);
-  }
-
-  private getMoonAltitudeAtOptionalTime(time: Date | null): number | null {
-    return time === null ? null : this.getMoonPosition(time).altitude;
-  }
-
   /**
    * Calculate moon separation from a celestial object
    */
@@ -466,34 +762,190 @@ export class SkyCalculator {
   }
 
   /**
-   * Find window where object is above a given altitude
+   * Get the shared sample grid for a night, building it on first use
    */
-  private findAltitudeWindow(samples: [Date, number][], threshold: number): [Date, Date] | null {
-    const windows: [Date, Date][] = [];
+  private getNightSampleGrid(nightInfo: NightInfo): NightSampleGrid {
+    const cached = this.nightSampleGrids.get(nightInfo);
+    if (cached) return cached;
+
+    const times: Date[] = [];
+    if (nightInfo.observingWindowMode !== 'none') {
+      const startTime = nightInfo.observingWindowStart.getTime();
+      const endTime = nightInfo.observingWindowEnd.getTime();
+      for (let t = startTime; t < endTime; t += SAMPLE_INTERVAL_MS) {
+        times.push(new Date(t));
+      }
+      if (endTime >= startTime) {
+        times.push(new Date(endTime));
+      }
+    }
+
+    const grid: NightSampleGrid = {
+      times,
+      timesMs: Float64Array.from(times, time => time.getTime()),
+      astroTimes: null,
+      midpoint: null,
+      rotations: null,
+      rotationTable: null,
+      altitudeCeiling: null,
+      sineAltitudeCeiling: null,
+      moon: null,
+    };
+    this.nightSampleGrids.set(nightInfo, grid);
+    return grid;
+  }
 
-    for (let index = 0; index < samples.length - 1; index++) {
-      const segment = getAboveAltitudeSegment(samples[index], samples[index + 1], threshold);
-      if (segment) appendOrMergeWindow(windows, segment);
+  /**
+   * Get the AstroTime for every sample of the night. The rotations, Moon
+   * samples and planet samples all read these, so each sample's time scales
+   * and nutation are evaluated once per night rather than once per call.
+   */
+  private getNightAstroTimes(nightInfo: NightInfo): Astronomy.AstroTime[] {
+    const grid = this.getNightSampleGrid(nightInfo);
+    if (grid.astroTimes === null) {
+      grid.astroTimes = grid.times.map(time => new Astronomy.AstroTime(time));
     }
+    return grid.astroTimes;
+  }
 
-    let longestWindow: [Date, Date] | null = null;
-    for (const window of windows) {
-      if (
-        longestWindow === null ||
-        window[1].getTime() - window[0].getTime() >
-          longestWindow[1].getTime() - longestWindow[0].getTime()
-      ) {
-        longestWindow = window;
-      }
+  /**
+   * Get the AstroTime at the middle of the observing window. Midnight
+   * lookups (meteor radiants, Moon position, comet and minor-planet
+   * screening) share this one instance, so its nutation and sidereal time
+   * are evaluated once per night.
+   */
+  getNightMidpoint(nightInfo: NightInfo): Astronomy.AstroTime {
+    const grid = this.getNightSampleGrid(nightInfo);
+    if (grid.midpoint === null) {
+      const midpointMs =
+        (nightInfo.observingWindowStart.getTime() + nightInfo.observingWindowEnd.getTime()) / 2;
+      grid.midpoint = new Astronomy.AstroTime(new Date(midpointMs));
+    }
+    return grid.midpoint;
+  }
+
+  /**
+   * Get Moon positions on the night's sample grid. Every target's moon
+   * separation and the moonlight summary read from this one set of samples.
+   */
+  private getNightMoonSamples(nightInfo: NightInfo): MoonPosition[] {
+    const grid = this.getNightSampleGrid(nightInfo);
+    if (grid.moon === null) {
+      grid.moon = this.getNightAstroTimes(nightInfo).map(time => this.getMoonPosition(time));
+    }
+    return grid.moon;
+  }
+
+  /**
+   * Get the Moon position at a sampled time, reusing the night's Moon samples
+   * for grid times and evaluating the ephemeris only for off-grid times
+   */
+  private getMoonAtSample(
+    nightInfo: NightInfo,
+    time: Date | null,
+    sampleIndex: number
+  ): MoonPosition | null {
+    if (time === null) return null;
+    return sampleIndex >= 0
+      ? this.getNightMoonSamples(nightInfo)[sampleIndex]
+      : this.getMoonPosition(time);
+  }
+
+  /**
+   * Get the J2000 → horizontal rotation for every sample of the night
+   */
+  private getNightRotations(nightInfo: NightInfo): Astronomy.RotationMatrix[] {
+    const grid = this.getNightSampleGrid(nightInfo);
+    if (grid.rotations === null) {
+      grid.rotations = this.getNightAstroTimes(nightInfo).map(time =>
+        Astronomy.Rotation_EQJ_HOR(time, this.observer)
+      );
     }
-    return longestWindow;
+    return grid.rotations;
+  }
+
+  /**
+   * Get the night's rotations packed into a flat table, shared by every
+   * fixed-position target evaluated that night
+   */
+  private getNightRotationTable(nightInfo: NightInfo): Float64Array {
+    const grid = this.getNightSampleGrid(nightInfo);
+    if (grid.rotationTable === null) {
+      grid.rotationTable = packRotations(this.getNightRotations(nightInfo));
+    }
+    return grid.rotationTable;
+  }
+
+  /**
+   * Build a horizontal-coordinate sampler for fixed J2000 coordinates. Grid
+   * samples read the night's packed rotation table, which every catalog
+   * target shares; off-grid times (peak refinement) fall back to a direct
+   * rotation.
+   */
+  private fixedPositionSampler(
+    raHours: number,
+    decDeg: number,
+    nightInfo: NightInfo,
+    direction?: readonly [number, number, number]
+  ): (time: Date, sampleIndex: number) => { altitude: number; azimuth: number } {
+    const table = this.getNightRotationTable(nightInfo);
+
+    // The target direction is fixed, so its J2000 direction cosines are
+    // evaluated once (or supplied by the catalog) and every sample reduces to
+    // a 3x3 rotation.
+    const [x, y, z] = direction ?? j2000Direction(raHours, decDeg);
+
+    return (time, sampleIndex) => {
+      if (sampleIndex < 0) {
+        return horizonFromJ2000Direction(Astronomy.Rotation_EQJ_HOR(time, this.observer), x, y, z);
+      }
+      const offset = sampleIndex * 9;
+      return horizonFromComponents(
+        table[offset] * x + table[offset + 1] * y + table[offset + 2] * z,
+        table[offset + 3] * x + table[offset + 4] * y + table[offset + 5] * z,
+        table[offset + 6] * x + table[offset + 7] * y + table[offset + 8] * z
+      );
+    };
+  }
+
+  /**
+   * Build a horizontal-coordinate sampler for a planet. Grid samples are
+   * interpolated from hourly ephemeris knots; off-grid times (peak refinement)
+   * use the full ephemeris.
+   */
+  private planetPositionSampler(
+    body: Astronomy.Body,
+    nightInfo: NightInfo
+  ): (time: Date, sampleIndex: number) => { altitude: number; azimuth: number } {
+    const { timesMs } = this.getNightSampleGrid(nightInfo);
+    const astroTimes = this.getNightAstroTimes(nightInfo);
+    const interpolate =
+      timesMs.length > 0
+        ? createPlanetEquatorInterpolator(
+            body,
+            this.observer,
+            timesMs[0],
+            timesMs[timesMs.length - 1]
+          )
+        : null;
+
+    return (time, sampleIndex) => {
+      if (interpolate && sampleIndex >= 0) {
+        const equator = interpolate(timesMs[sampleIndex]);
+        return this.getAltAzOfDate(equator.ra, equator.dec, astroTimes[sampleIndex]);
+      }
+      const astroTime = new Astronomy.AstroTime(time);
+      const equator = Astronomy.Equator(body, astroTime, this.observer, true, true);
+      return this.getAltAzOfDate(equator.ra, equator.dec, astroTime);
+    };
   }
 
   /**
-   * Sample altitudes for an object throughout the night
+   * Sample altitudes for an object throughout the night. The callback receives
+   * the index into the night's shared sample grid, or -1 for off-grid times.
    */
   private sampleAltitudesForNight(
-    getAltitudeAt: (time: Date) => { altitude: number; azimuth: number },
+    getAltitudeAt: (time: Date, sampleIndex: number) => { altitude: number; azimuth: number },
     nightInfo: NightInfo
   ): {
     altitudeSamples: [Date, number][];
@@ -501,6 +953,8 @@ export class SkyCalculator {
     maxAltitude: number;
     maxAltitudeTime: Date | null;
     azimuthAtPeak: number;
+    peakSampleIndex: number;
+    windows: AltitudeWindows;
   } {
     const altitudeSamples: [Date, number][] = [];
     const azimuthSamples: [Date, number][] = [];
@@ -508,18 +962,15 @@ export class SkyCalculator {
     let maxAltitudeTime: Date | null = null;
     let azimuthAtPeak = 0;
 
-    if (nightInfo.observingWindowMode === 'none') {
-      return { altitudeSamples, azimuthSamples, maxAltitude, maxAltitudeTime, azimuthAtPeak };
-    }
+    let peakIndex = -1;
 
-    const startTime = nightInfo.observingWindowStart.getTime();
-    const endTime = nightInfo.observingWindowEnd.getTime();
-    const interval = 10 * 60 * 1000; // 10 minutes
-
-    const sampleAt = (timeMs: number) => {
-      const time = new Date(timeMs);
-      const { altitude, azimuth } = getAltitudeAt(time);
+    const { times, timesMs } = this.getNightSampleGrid(nightInfo);
+    const windowScanner = createAltitudeWindowScanner();
+    for (let index = 0; index < times.length; index++) {
+      const time = times[index];
+      const { altitude, azimuth } = getAltitudeAt(time, index);
 
+      windowScanner.add(timesMs[index], altitude);
       altitudeSamples.push([time, altitude]);
       azimuthSamples.push([time, azimuth]);
 
@@ -527,23 +978,14 @@ export class SkyCalculator {
         maxAltitude = altitude;
         maxAltitudeTime = time;
         azimuthAtPeak = azimuth;
+        peakIndex = index;
       }
-    };
-
-    for (let t = startTime; t < endTime; t += interval) {
-      sampleAt(t);
-    }
-    if (endTime >= startTime) {
-      sampleAt(endTime);
     }
 
     // The samples are deliberately coarse for charting and threshold-window
     // detection, but the displayed culmination time should not be rounded to
     // that grid. A three-point parabolic interpolation gives a precise peak
     // estimate with one additional ephemeris evaluation.
-    const peakIndex = maxAltitudeTime
-      ? altitudeSamples.findIndex(([time]) => time.getTime() === maxAltitudeTime?.getTime())
-      : -1;
     if (peakIndex > 0 && peakIndex < altitudeSamples.length - 1) {
       const [previousTime, previousAltitude] = altitudeSamples[peakIndex - 1];
       const [sampledPeakTime, sampledPeakAltitude] = altitudeSamples[peakIndex];
@@ -558,30 +1000,109 @@ export class SkyCalculator {
           Math.min(1, 0.5 * ((previousAltitude - nextAltitude) / denominator))
         );
         const refinedTime = new Date(sampledPeakTime.getTime() + sampleOffset * previousSpacing);
-        const refinedPosition = getAltitudeAt(refinedTime);
+        const refinedPosition = getAltitudeAt(refinedTime, -1);
         if (refinedPosition.altitude >= maxAltitude) {
           maxAltitude = refinedPosition.altitude;
           maxAltitudeTime = refinedTime;
           azimuthAtPeak = refinedPosition.azimuth;
+          peakIndex = -1;
         }
       }
     }
 
-    return { altitudeSamples, azimuthSamples, maxAltitude, maxAltitudeTime, azimuthAtPeak };
+    return {
+      altitudeSamples,
+      azimuthSamples,
+      maxAltitude,
+      maxAltitudeTime,
+      azimuthAtPeak,
+      peakSampleIndex: peakIndex,
+      windows: windowScanner.finish(),
+    };
   }
 
   /**
-   * Find all altitude threshold windows
+   * Build an upper bound on the geometric altitude a fixed J2000 target can
+   * reach during the night's observing window. Altitude falls monotonically
+   * with |hour angle|, so the bound is the altitude at the hour angle nearest
+   * the meridian within the window's sidereal span — one trig evaluation per
+   * target, with no ephemeris calls. The bound ignores refraction and
+   * precession (together under two degrees), so callers should allow that
+   * margin before discarding a target. Built once per night and shared.
    */
-  private findAllAltitudeWindows(samples: [Date, number][]): {
-    above45: [Date, Date] | null;
-    above60: [Date, Date] | null;
-    above75: [Date, Date] | null;
-  } {
-    return {
-      above45: this.findAltitudeWindow(samples, 45),
-      above60: this.findAltitudeWindow(samples, 60),
-      above75: this.findAltitudeWindow(samples, 75),
+  getAltitudeCeiling(nightInfo: NightInfo): AltitudeCeiling {
+    const grid = this.getNightSampleGrid(nightInfo);
+    if (grid.altitudeCeiling === null) {
+      const sineCeiling = this.getSineAltitudeCeiling(grid);
+      grid.altitudeCeiling =
+        grid.timesMs.length === 0
+          ? () => -90
+          : (raHours, decDeg) => {
+              const decRadians = (decDeg * Math.PI) / 180;
+              const sinAltitude = sineCeiling(raHours, Math.sin(decRadians), Math.cos(decRadians));
+              return (Math.asin(Math.max(-1, Math.min(1, sinAltitude))) * 180) / Math.PI;
+            };
+    }
+    return grid.altitudeCeiling;
+  }
+
+  /**
+   * Screen a whole catalog against the night's altitude ceiling in one pass.
+   * Entry i of the result is 1 when target i may reach minAltitudeDeg. The
+   * comparison is made on sines, so no per-target inverse trig is needed.
+   */
+  screenCatalogColumns(
+    nightInfo: NightInfo,
+    columns: CatalogColumns,
+    minAltitudeDeg: number
+  ): Uint8Array {
+    const sineCeiling = this.getSineAltitudeCeiling(this.getNightSampleGrid(nightInfo));
+    const threshold = Math.sin((minAltitudeDeg * Math.PI) / 180);
+    const { raHours, sinDec, cosDec } = columns;
+    const mask = new Uint8Array(raHours.length);
+    for (let index = 0; index < raHours.length; index++) {
+      mask[index] = sineCeiling(raHours[index], sinDec[index], cosDec[index]) >= threshold ? 1 : 0;
+    }
+    return mask;
+  }
+
+  private getSineAltitudeCeiling(grid: NightSampleGrid): SineAltitudeCeiling {
+    if (grid.sineAltitudeCeiling === null) {
+      grid.sineAltitudeCeiling = this.buildSineAltitudeCeiling(grid.timesMs);
+    }
+    return grid.sineAltitudeCeiling;
+  }
+
+  private buildSineAltitudeCeiling(timesMs: Float64Array): SineAltitudeCeiling {
+    if (timesMs.length === 0) return () => -1;
+
+    const latitudeRadians = (this.observer.latitude * Math.PI) / 180;
+    const sinLatitude = Math.sin(latitudeRadians);
+    const cosLatitude = Math.cos(latitudeRadians);
+    const startSiderealHours =
+      Astronomy.SiderealTime(new Date(timesMs[0])) + this.observer.longitude / 15;
+    const spanSiderealHours =
+      ((timesMs[timesMs.length - 1] - timesMs[0]) / 3_600_000) * SIDEREAL_RATE;
+
+    return (raHours, sinDec, cosDec) => {
+      // Hour angle at the window start, normalized to [-12, 12)
+      let startHourAngle = (startSiderealHours - raHours) % 24;
+      if (startHourAngle < -12) startHourAngle += 24;
+      else if (startHourAngle >= 12) startHourAngle -= 24;
+      const endHourAngle = startHourAngle + spanSiderealHours;
+
+      let nearestHourAngle: number;
+      if (endHourAngle < 0) {
+        nearestHourAngle = -endHourAngle;
+      } else if (startHourAngle <= 0 || endHourAngle >= 24) {
+        nearestHourAngle = 0;
+      } else {
+        nearestHourAngle = Math.min(startHourAngle, 24 - endHourAngle);
+      }
+
+      return (
+        sinLatitude * sinDec + cosLatitude * cosDec * Math.cos((nearestHourAngle * Math.PI) / 12)
+      );
     };
   }
 
@@ -596,29 +1117,62 @@ export class SkyCalculator {
     objectType: ObjectCategory,
     options: VisibilityOptions = {}
   ): ObjectVisibility {
-    const positionAtTime = options.positionAtTime ?? (() => ({ raHours, decDegrees: decDeg }));
-    const { altitudeSamples, azimuthSamples, maxAltitude, maxAltitudeTime, azimuthAtPeak } =
-      this.sampleAltitudesForNight(time => {
-        const position = positionAtTime(time);
-        return this.getAltAz(position.raHours, position.decDegrees, time);
-      }, nightInfo);
-
-    const windows = this.findAllAltitudeWindows(altitudeSamples);
+    const movingPositionAtTime = options.positionAtTime;
+    const positionAtTime = movingPositionAtTime ?? (() => ({ raHours, decDegrees: decDeg }));
+    const rotations = movingPositionAtTime ? this.getNightRotations(nightInfo) : null;
+    const {
+      altitudeSamples,
+      azimuthSamples,
+      maxAltitude,
+      maxAltitudeTime,
+      azimuthAtPeak,
+      peakSampleIndex,
+      windows,
+    } = this.sampleAltitudesForNight(
+      movingPositionAtTime
+        ? (time, sampleIndex) => {
+            const position = movingPositionAtTime(time);
+            if (rotations && sampleIndex >= 0) {
+              const [x, y, z] = j2000Direction(position.raHours, position.decDegrees);
+              return horizonFromJ2000Direction(rotations[sampleIndex], x, y, z);
+            }
+            return this.getAltAz(position.raHours, position.decDegrees, time);
+          }
+        : this.fixedPositionSampler(raHours, decDeg, nightInfo, options.direction),
+      nightInfo
+    );
 
     const peakPosition = maxAltitudeTime
       ? positionAtTime(maxAltitudeTime)
       : { raHours, decDegrees: decDeg };
-    const moonSeparation = maxAltitudeTime
-      ? this.getMoonSeparation(peakPosition.raHours, peakPosition.decDegrees, maxAltitudeTime)
+    // Moon geometry only matters for targets that rise; skipping it for the
+    // rest avoids an off-grid Moon ephemeris after peak refinement.
+    const isVisible = maxAltitude >= 0;
+    const moonAtPeak = isVisible
+      ? this.getMoonAtSample(nightInfo, maxAltitudeTime, peakSampleIndex)
       : null;
-    const moonAltitudeAtPeak = this.getMoonAltitudeAtOptionalTime(maxAltitudeTime);
+    // A fixed target's cached direction turns the separation into a dot
+    // product with the Moon's direction
+    const fixedDirection = movingPositionAtTime ? undefined : options.direction;
+    let moonSeparation: number | null = null;
+    if (moonAtPeak) {
+      moonSeparation = fixedDirection
+        ? directionSeparation(fixedDirection, moonAtPeak.direction)
+        : angularSeparation(
+            peakPosition.raHours * 15,
+            peakPosition.decDegrees,
+            moonAtPeak.ra * 15,
+            moonAtPeak.dec
+          );
+    }
+    const moonAltitudeAtPeak = moonAtPeak?.altitude ?? null;
 
     return {
       objectName,
       objectType,
       // Visibility means the target rises during the selected usable observing
       // window. Darkness and imaging-quality cutoffs are evaluated separately.
-      isVisible: maxAltitude >= 0,
+      isVisible,
       maxAltitude,
       maxAltitudeTime,
       above45Start: windows.above45?.[0] ?? null,
@@ -645,6 +1199,7 @@ export class SkyCalculator {
       apparentDiameterMin: null,
       apparentDiameterMax: null,
       positionAngle: null,
+      ...DEFERRED_VISIBILITY_FIELDS,
     };
   }
 
@@ -652,17 +1207,7 @@ export class SkyCalculator {
    * Get planet body from name
    */
   private getPlanetBody(planetName: string): Astronomy.Body {
-    const bodyMap: Record<string, Astronomy.Body> = {
-      mercury: Astronomy.Body.Mercury,
-      venus: Astronomy.Body.Venus,
-      mars: Astronomy.Body.Mars,
-      jupiter: Astronomy.Body.Jupiter,
-      saturn: Astronomy.Body.Saturn,
-      uranus: Astronomy.Body.Uranus,
-      neptune: Astronomy.Body.Neptune,
-    };
-
-    const body = bodyMap[planetName.toLowerCase()];
+    const body = PLANET_BODIES.get(planetName.toLowerCase());
     if (!body) {
       throw new Error(`Unknown planet: ${planetName}`);
     }
@@ -679,26 +1224,41 @@ export class SkyCalculator {
     let peakMagnitude: number | null = null;
     let peakDistance: number | null = null;
 
-    const { altitudeSamples, azimuthSamples, maxAltitude, maxAltitudeTime, azimuthAtPeak } =
-      this.sampleAltitudesForNight(time => {
-        const equator = Astronomy.Equator(body, time, observer, true, true);
-        return this.getAltAzOfDate(equator.ra, equator.dec, time);
-      }, nightInfo);
+    const {
+      altitudeSamples,
+      azimuthSamples,
+      maxAltitude,
+      maxAltitudeTime,
+      azimuthAtPeak,
+      peakSampleIndex,
+      windows,
+    } = this.sampleAltitudesForNight(this.planetPositionSampler(body, nightInfo), nightInfo);
 
     // Get magnitude and distance at peak
     if (maxAltitudeTime) {
-      const illum = Astronomy.Illumination(body, maxAltitudeTime);
-      const equator = Astronomy.Equator(body, maxAltitudeTime, observer, true, true);
+      const peakTime = new Astronomy.AstroTime(maxAltitudeTime);
+      const illum = Astronomy.Illumination(body, peakTime);
+      const equator = Astronomy.Equator(body, peakTime, observer, true, true);
       peakMagnitude = illum.mag;
       peakDistance = equator.dist * AU_TO_KM;
     }
 
     const peakPosition = this.getBodyPositionJ2000AtOptionalTime(body, maxAltitudeTime);
 
-    const windows = this.findAllAltitudeWindows(altitudeSamples);
-
-    const moonSeparation = this.getBodyMoonSeparationAtOptionalTime(body, maxAltitudeTime);
-    const moonAltitudeAtPeak = this.getMoonAltitudeAtOptionalTime(maxAltitudeTime);
+    const isVisible = maxAltitude >= 0;
+    const moonAtPeak = isVisible
+      ? this.getMoonAtSample(nightInfo, maxAltitudeTime, peakSampleIndex)
+      : null;
+    const moonSeparation =
+      peakPosition && moonAtPeak
+        ? angularSeparation(
+            peakPosition.ra * 15,
+            peakPosition.dec,
+            moonAtPeak.ra * 15,
+            moonAtPeak.dec
+          )
+        : null;
+    const moonAltitudeAtPeak = moonAtPeak?.altitude ?? null;
 
     const ranges = PLANET_DIAMETER_RANGES[planetName.toLowerCase()];
     const apparentDiameter = peakDistance
@@ -710,7 +1270,7 @@ export class SkyCalculator {
     return {
       objectName: displayName,
       objectType: 'planet',
-      isVisible: maxAltitude >= 0,
+      isVisible,
       maxAltitude,
       maxAltitudeTime,
       above45Start: windows.above45?.[0] ?? null,
@@ -732,16 +1292,15 @@ export class SkyCalculator {
       azimuthAtPeak,
       raHours: peakPosition?.ra ?? 0,
       decDegrees: peakPosition?.dec ?? 0,
-      magnitude: peakMagnitude,
-      isInterstellar: false,
-      subtype: null,
-      angularSizeArcmin: apparentDiameter ? apparentDiameter / 60 : 0,
-      surfaceBrightness: null,
-      commonName: displayName,
+      ...buildObjectMetadata(displayName, {
+        magnitude: peakMagnitude,
+        angularSizeArcmin: apparentDiameter ? apparentDiameter / 60 : 0,
+      }),
       apparentDiameterArcsec: apparentDiameter,
       apparentDiameterMin: ranges?.[0] ?? null,
       apparentDiameterMax: ranges?.[1] ?? null,
       positionAngle: null,
+      ...DEFERRED_VISIBILITY_FIELDS,
     };
   }
 
@@ -792,30 +1351,31 @@ export class SkyCalculator {
         azimuthAtPeak: 0,
         raHours: 0,
         decDegrees: 0,
-        magnitude: null,
-        isInterstellar: false,
-        subtype: null,
-        angularSizeArcmin: 31,
-        surfaceBrightness: null,
-        commonName: 'Moon',
+        ...buildObjectMetadata('Moon', { angularSizeArcmin: 31 }),
         apparentDiameterArcsec: 1860,
         apparentDiameterMin: 1760,
         apparentDiameterMax: 2010,
         positionAngle: null,
+        ...DEFERRED_VISIBILITY_FIELDS,
       };
     }
 
-    const { altitudeSamples, azimuthSamples, maxAltitude, maxAltitudeTime, azimuthAtPeak } =
-      this.sampleAltitudesForNight(time => {
-        const pos = this.getMoonPosition(time);
-        return { altitude: pos.altitude, azimuth: pos.azimuth };
-      }, nightInfo);
-
-    const peakPosition = this.getBodyPositionJ2000AtOptionalTime(
-      Astronomy.Body.Moon,
-      maxAltitudeTime
+    const moonPositions = this.getNightMoonSamples(nightInfo);
+    const {
+      altitudeSamples,
+      azimuthSamples,
+      maxAltitude,
+      maxAltitudeTime,
+      azimuthAtPeak,
+      peakSampleIndex,
+    } = this.sampleAltitudesForNight(
+      (time, sampleIndex) =>
+        sampleIndex >= 0 ? moonPositions[sampleIndex] : this.getMoonPosition(time),
+      nightInfo
     );
 
+    const peakPosition = this.getMoonAtSample(nightInfo, maxAltitudeTime, peakSampleIndex);
+
     return {
       objectName: 'Moon',
       objectType: 'moon',
@@ -837,16 +1397,12 @@ export class SkyCalculator {
       azimuthAtPeak,
       raHours: peakPosition?.ra ?? 0,
       decDegrees: peakPosition?.dec ?? 0,
-      magnitude: null,
-      isInterstellar: false,
-      subtype: null,
-      angularSizeArcmin: 31, // Average lunar diameter
-      surfaceBrightness: null,
-      commonName: 'Moon',
+      ...buildObjectMetadata('Moon', { angularSizeArcmin: 31 }), // Average lunar diameter
       apparentDiameterArcsec: 1860, // ~31 arcmin
       apparentDiameterMin: 1760,
       apparentDiameterMax: 2010,
       positionAngle: null,
+      ...DEFERRED_VISIBILITY_FIELDS,
     };
   }
 
@@ -1053,3 +1609,35 @@ export class SkyCalculator {
     };
   }
 }
+
+/** Most recently used calculators, keyed by observer coordinates. */
+const sharedCalculators = new Map<string, SkyCalculator>();
+const MAX_SHARED_CALCULATORS = 4;
+
+/**
+ * Get a calculator shared by every caller at the same site. Its per-night
+ * caches (sample grid, horizon rotations, Moon samples) are keyed by the
+ * NightInfo objects the forecast produces, so views that re-evaluate a
+ * forecast night reuse the work the forecast already did.
+ */
+export function getSkyCalculator(
+  latitude: number,
+  longitude: number,
+  elevation: number = 0
+): SkyCalculator {
+  const key = `${latitude},${longitude},${elevation}`;
+  let calculator = sharedCalculators.get(key);
+  if (calculator) {
+    // Refresh recency by re-inserting at the end of the map's order.
+    sharedCalculators.delete(key);
+  } else {
+    calculator = new SkyCalculator(latitude, longitude, elevation);
+  }
+  sharedCalculators.set(key, calculator);
+
+  if (sharedCalculators.size > MAX_SHARED_CALCULATORS) {
+    const oldestKey = sharedCalculators.keys().next().value;
+    if (oldestKey !== undefined) sharedCalculators.delete(oldestKey);
+  }
+  return calculator;
+}
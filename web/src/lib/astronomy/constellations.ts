@@ -103,6 +103,14 @@ export function getConstellationFullName(abbrev: string): string {
   return CONSTELLATION_NAMES[abbrev] || abbrev;
 }
 
+/**
+ * Whether Astronomy.Constellation accepts the coordinates. Checking up front
+ * keeps malformed catalog rows from taking the exception path on every call.
+ */
+function isConstellationInput(raHours: number, decDegrees: number): boolean {
+  return Number.isFinite(raHours) && Number.isFinite(decDegrees) && Math.abs(decDegrees) <= 90;
+}
+
 /**
  * Look up the constellation containing the given equatorial coordinates
  * @param raHours Right ascension in hours (0-24)
@@ -110,6 +118,7 @@ export function getConstellationFullName(abbrev: string): string {
  * @returns Constellation name (e.g., "Orion", "Leo", etc.)
  */
 export function getConstellation(raHours: number, decDegrees: number): string {
+  if (!isConstellationInput(raHours, decDegrees)) return 'Unknown';
   try {
     const constellation = Astronomy.Constellation(raHours, decDegrees);
     return constellation.name;
@@ -128,6 +137,7 @@ export function getConstellationInfo(
   raHours: number,
   decDegrees: number
 ): { name: string; symbol: string } {
+  if (!isConstellationInput(raHours, decDegrees)) return { name: 'Unknown', symbol: '?' };
   try {
     const constellation = Astronomy.Constellation(raHours, decDegrees);
     return {
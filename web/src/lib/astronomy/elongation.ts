@@ -7,6 +7,11 @@ const INNER_PLANETS: Array<{ name: 'Mercury' | 'Venus'; body: Astronomy.Body }>
   { name: 'Venus', body: Astronomy.Body.Venus },
 ];
 
+/** Inner planets keyed by lower-case name for case-insensitive lookups. */
+const INNER_PLANETS_BY_NAME = new Map(
+  INNER_PLANETS.map(planet => [planet.name.toLowerCase(), planet])
+);
+
 // Window for considering "at max elongation"
 const ELONGATION_WINDOW_DAYS = 7;
 const DAY_MS = 24 * 60 * 60 * 1000;
@@ -156,7 +161,7 @@ export function getElongationForPlanet(
   planetName: string,
   date: Date
 ): { elongationDeg: number; isNearMax: boolean; isEastern: boolean } | null {
-  const planet = INNER_PLANETS.find(p => p.name.toLowerCase() === planetName.toLowerCase());
+  const planet = INNER_PLANETS_BY_NAME.get(planetName.toLowerCase());
 
   if (!planet) return null;
 
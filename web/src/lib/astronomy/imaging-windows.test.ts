@@ -7,6 +7,7 @@ import {
 import { SkyCalculator } from './calculator';
 import {
   calculateImagingWindows,
+  createImagingWindowFinder,
   formatImagingWindow,
   getBestImagingWindow,
   getImagingWindowSummary,
@@ -91,6 +92,17 @@ describe('imaging-windows', () => {
       expect(result).toEqual([]);
     });
 
+    it('returns no windows when the peak stays below the imaging floor', () => {
+      const result = calculateImagingWindows(
+        createMockVisibility(18),
+        createMockNightInfo(),
+        createMockWeather(0),
+        calculator
+      );
+
+      expect(result).toEqual([]);
+    });
+
     it('should return windows for visible object', () => {
       const visibility = createMockVisibility(70);
       const nightInfo = createMockNightInfo();
@@ -214,6 +226,21 @@ describe('imaging-windows', () => {
     });
   });
 
+  describe('createImagingWindowFinder', () => {
+    it('matches getBestImagingWindow for every object it evaluates', () => {
+      const nightInfo = createMockNightInfo();
+      const weather = createMockWeather(10);
+      const findImagingWindow = createImagingWindowFinder(nightInfo, weather, calculator);
+
+      for (const maxAltitude of [18, 45, 75]) {
+        const visibility = createMockVisibility(maxAltitude);
+        expect(findImagingWindow(visibility)).toEqual(
+          getBestImagingWindow(visibility, nightInfo, weather, calculator)
+        );
+      }
+    });
+  });
+
   describe('formatImagingWindow', () => {
     it('should format window as time range with quality', () => {
       const window = {
@@ -8,13 +8,18 @@ import type {
 import { avg } from '../utils/array-math';
 import { formatTimeRange } from '../utils/format';
 import { calculateAirmass } from './airmass';
-import { angularSeparation, type SkyCalculator } from './calculator';
+import { directionSeparation, j2000Direction, type SkyCalculator } from './calculator';
 
 /**
  * Minimum window duration in minutes to be considered useful
  */
 const MIN_WINDOW_DURATION_MINUTES = 30;
 
+/**
+ * Lowest altitude (degrees) that can contribute to an imaging window
+ */
+const MIN_IMAGING_ALTITUDE = 20;
+
 /**
  * Quality thresholds for imaging windows
  */
@@ -30,7 +35,7 @@ const QUALITY_THRESHOLDS = {
  * Higher altitude = better quality (less atmosphere)
  */
 function calculateAltitudeQuality(altitude: number): number {
-  if (altitude < 20) return 0;
+  if (altitude < MIN_IMAGING_ALTITUDE) return 0;
   if (altitude < 30) return 30;
   if (altitude < 45) return 50;
   if (altitude < 60) return 70;
@@ -120,57 +125,98 @@ function getHourlyWeatherAt(weather: NightWeather | null, time: Date): HourlyWea
   return null;
 }
 
-function getMoonSeparationAt(
+/**
+ * Conditions at a sample time that do not depend on the target
+ */
+interface SampleConditions {
+  moonDirection: readonly [number, number, number];
+  moonAltitude: number;
+  cloudCover: number;
+}
+
+/**
+ * Build a lookup of per-sample conditions for one night. Every object's
+ * altitude samples fall on the night's shared sample grid, so the Moon
+ * ephemeris and hourly weather lookup run once per sample time instead of
+ * once per sample per object.
+ */
+function createSampleConditions(
+  weather: NightWeather | null,
+  calculator: SkyCalculator
+): (time: Date) => SampleConditions {
+  const conditionsByTime = new Map<number, SampleConditions>();
+  return time => {
+    let conditions = conditionsByTime.get(time.getTime());
+    if (!conditions) {
+      const moon = calculator.getMoonPosition(time);
+      const hourlyWeather = getHourlyWeatherAt(weather, time);
+      conditions = {
+        moonDirection: moon.direction,
+        moonAltitude: moon.altitude,
+        cloudCover: hourlyWeather?.cloudCover ?? weather?.avgCloudCover ?? 30,
+      };
+      conditionsByTime.set(time.getTime(), conditions);
+    }
+    return conditions;
+  };
+}
+
+const PLANET_BODIES: Partial<Record<string, Astronomy.Body>> = {
+  Mercury: Astronomy.Body.Mercury,
+  Venus: Astronomy.Body.Venus,
+  Mars: Astronomy.Body.Mars,
+  Jupiter: Astronomy.Body.Jupiter,
+  Saturn: Astronomy.Body.Saturn,
+  Uranus: Astronomy.Body.Uranus,
+  Neptune: Astronomy.Body.Neptune,
+};
+
+type Direction = readonly [number, number, number];
+
+/**
+ * Build a lookup of the target's direction cosines at each sample time, or
+ * null for the Moon itself. Fixed targets resolve their direction once, so
+ * each sample's Moon separation reduces to a dot product with the shared
+ * Moon direction.
+ */
+function createTargetDirection(
   object: ObjectVisibility,
-  calculator: SkyCalculator,
-  time: Date
-): number | null {
+  calculator: SkyCalculator
+): ((time: Date) => Direction) | null {
   if (object.objectType === 'moon') return null;
 
-  const planetBodies: Partial<Record<string, Astronomy.Body>> = {
-    Mercury: Astronomy.Body.Mercury,
-    Venus: Astronomy.Body.Venus,
-    Mars: Astronomy.Body.Mars,
-    Jupiter: Astronomy.Body.Jupiter,
-    Saturn: Astronomy.Body.Saturn,
-    Uranus: Astronomy.Body.Uranus,
-    Neptune: Astronomy.Body.Neptune,
-  };
-  const planet = planetBodies[object.objectName];
+  const planet = PLANET_BODIES[object.objectName];
   if (planet) {
-    const body = calculator.getBodyPositionJ2000(planet, time);
-    const moon = calculator.getMoonPosition(time);
-    return angularSeparation(body.ra * 15, body.dec, moon.ra * 15, moon.dec);
+    return time => {
+      const position = calculator.getBodyPositionJ2000(planet, time);
+      return j2000Direction(position.ra, position.dec);
+    };
   }
 
-  return calculator.getMoonSeparation(object.raHours, object.decDegrees, time);
+  const direction = j2000Direction(object.raHours, object.decDegrees);
+  return () => direction;
 }
 
 /**
  * Calculate imaging quality at a specific time
  */
 function calculateQualityAtTime(
-  time: Date,
   altitude: number,
-  object: ObjectVisibility,
+  targetDirection: Direction | null,
   nightInfo: NightInfo,
-  weather: NightWeather | null,
-  calculator: SkyCalculator
+  conditions: SampleConditions
 ): { score: number; factors: ImagingWindow['factors'] } {
   const altitudeQuality = calculateAltitudeQuality(altitude);
   const airmassQuality = calculateAirmassQuality(altitude);
-  const moonAltitude = calculator.getMoonPosition(time).altitude;
-  const moonSeparation = getMoonSeparationAt(object, calculator, time);
+  const moonSeparation = targetDirection
+    ? directionSeparation(targetDirection, conditions.moonDirection)
+    : null;
   const moonQuality = calculateMoonInterferenceQuality(
     moonSeparation,
     nightInfo.moonIllumination,
-    moonAltitude
+    conditions.moonAltitude
   );
-
-  // Get cloud cover from weather data
-  const hourlyWeather = getHourlyWeatherAt(weather, time);
-  const cloudCover = hourlyWeather?.cloudCover ?? weather?.avgCloudCover ?? 30;
-  const cloudQuality = calculateCloudQuality(cloudCover);
+  const cloudQuality = calculateCloudQuality(conditions.cloudCover);
 
   // Weighted average of all factors
   const score =
@@ -227,16 +273,36 @@ function finalizeImagingWindow(
  * Analyzes the night in time slices and identifies the best periods
  * for imaging based on altitude, airmass, moon interference, and weather.
  */
-// biome-ignore lint/complexity/noExcessiveCognitiveComplexity: Window calculation requires iterating through night samples with state tracking
 export function calculateImagingWindows(
   object: ObjectVisibility,
   nightInfo: NightInfo,
   weather: NightWeather | null,
   calculator: SkyCalculator
+): ImagingWindow[] {
+  return findImagingWindows(
+    object,
+    nightInfo,
+    createSampleConditions(weather, calculator),
+    calculator
+  );
+}
+
+// biome-ignore lint/complexity/noExcessiveCognitiveComplexity: Window calculation requires iterating through night samples with state tracking
+function findImagingWindows(
+  object: ObjectVisibility,
+  nightInfo: NightInfo,
+  conditionsAt: (time: Date) => SampleConditions,
+  calculator: SkyCalculator
 ): ImagingWindow[] {
   const windows: ImagingWindow[] = [];
 
-  if (!object.isVisible || object.altitudeSamples.length === 0) {
+  // An object whose peak stays below the imaging floor has only break points,
+  // so skip the per-sample walk entirely.
+  if (
+    !object.isVisible ||
+    object.maxAltitude < MIN_IMAGING_ALTITUDE ||
+    object.altitudeSamples.length === 0
+  ) {
     return windows;
   }
 
@@ -247,9 +313,10 @@ export function calculateImagingWindows(
     score: number;
     factors: ImagingWindow['factors'];
   }> = [];
+  const targetDirectionAt = createTargetDirection(object, calculator);
 
   for (const [time, altitude] of object.altitudeSamples) {
-    if (altitude < 20) {
+    if (altitude < MIN_IMAGING_ALTITUDE) {
       // Preserve the point as a hard break. Dropping it would make the points
       // on either side look contiguous and could bridge two separate arcs.
       qualityPoints.push({
@@ -261,7 +328,12 @@ export function calculateImagingWindows(
       continue;
     }
 
-    const quality = calculateQualityAtTime(time, altitude, object, nightInfo, weather, calculator);
+    const quality = calculateQualityAtTime(
+      altitude,
+      targetDirectionAt ? targetDirectionAt(time) : null,
+      nightInfo,
+      conditionsAt(time)
+    );
 
     qualityPoints.push({
       time,
@@ -324,6 +396,20 @@ export function getBestImagingWindow(
   return windows.length > 0 ? windows[0] : null;
 }
 
+/**
+ * Bind the night, weather and calculator once and return a finder for each
+ * object's best imaging window. Objects evaluated through the same finder
+ * share the per-sample Moon and weather lookups.
+ */
+export function createImagingWindowFinder(
+  nightInfo: NightInfo,
+  weather: NightWeather | null,
+  calculator: SkyCalculator
+): (object: ObjectVisibility) => ImagingWindow | null {
+  const conditionsAt = createSampleConditions(weather, calculator);
+  return object => findImagingWindows(object, nightInfo, conditionsAt, calculator)[0] ?? null;
+}
+
 /**
  * Format imaging window for display
  */
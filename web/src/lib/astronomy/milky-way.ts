@@ -5,7 +5,7 @@ import type {
   NightInfo,
   ObjectVisibility,
 } from '@/types';
-import type { SkyCalculator } from './calculator';
+import { j2000Direction, type SkyCalculator } from './calculator';
 
 interface MilkyWaySectionDefinition {
   id: string;
@@ -138,39 +138,51 @@ export function galacticToEquatorial(
   };
 }
 
+/**
+ * Equatorial positions of every band sample. They depend only on the fixed
+ * Galactic coordinates, so they are converted once rather than every night.
+ */
+const MILKY_WAY_BAND_POSITIONS = MILKY_WAY_SECTIONS.map(section =>
+  BAND_LATITUDE_SAMPLES.map(galacticLatitudeDeg => {
+    const equatorial = galacticToEquatorial(section.galacticLongitudeDeg, galacticLatitudeDeg);
+    return {
+      galacticLatitudeDeg,
+      ...equatorial,
+      direction: j2000Direction(equatorial.raHours, equatorial.decDegrees),
+    };
+  })
+);
+
 function createBandSample(
   calculator: SkyCalculator,
   nightInfo: NightInfo,
   section: MilkyWaySectionDefinition,
-  galacticLatitudeDeg: number
+  position: (typeof MILKY_WAY_BAND_POSITIONS)[number][number]
 ): MilkyWayBandSample {
-  const { raHours, decDegrees } = galacticToEquatorial(
-    section.galacticLongitudeDeg,
-    galacticLatitudeDeg
-  );
   const visibility = calculator.calculateVisibility(
-    raHours,
-    decDegrees,
+    position.raHours,
+    position.decDegrees,
     nightInfo,
     'Milky Way',
     'milky_way',
     {
       commonName: section.label,
       constellation: section.label,
+      direction: position.direction,
     }
   );
 
-  return { galacticLatitudeDeg, visibility };
+  return { galacticLatitudeDeg: position.galacticLatitudeDeg, visibility };
 }
 
 export function calculateMilkyWayPlan(
   calculator: SkyCalculator,
   nightInfo: NightInfo
 ): MilkyWayPlan {
-  const sections: MilkyWaySection[] = MILKY_WAY_SECTIONS.map(section => ({
+  const sections: MilkyWaySection[] = MILKY_WAY_SECTIONS.map((section, index) => ({
     ...section,
-    samples: BAND_LATITUDE_SAMPLES.map(latitude =>
-      createBandSample(calculator, nightInfo, section, latitude)
+    samples: MILKY_WAY_BAND_POSITIONS[index].map(position =>
+      createBandSample(calculator, nightInfo, section, position)
     ),
   }));
 
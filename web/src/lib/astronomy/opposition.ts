@@ -10,6 +10,11 @@ const OUTER_PLANETS: Array<{ name: string; body: Astronomy.Body }> = [
   { name: 'Neptune', body: Astronomy.Body.Neptune },
 ];
 
+/** Outer planets keyed by lower-case name for case-insensitive lookups. */
+const OUTER_PLANETS_BY_NAME = new Map(
+  OUTER_PLANETS.map(planet => [planet.name.toLowerCase(), planet])
+);
+
 // How many days before/after opposition to consider it "active"
 const OPPOSITION_WINDOW_DAYS = 14;
 const DAY_MS = 24 * 60 * 60 * 1000;
@@ -109,7 +114,7 @@ export function detectOppositions(date: Date, forecastDays: number = 7): Opposit
  * Get opposition info for a specific planet name
  */
 export function getOppositionForPlanet(planetName: string, date: Date): OppositionEvent | null {
-  const planet = OUTER_PLANETS.find(p => p.name.toLowerCase() === planetName.toLowerCase());
+  const planet = OUTER_PLANETS_BY_NAME.get(planetName.toLowerCase());
 
   if (!planet) return null;
 
@@ -5,6 +5,7 @@ import {
   heliocentricToEquatorial,
   lightTimeCorrectedEquatorial,
   meanMotion,
+  orbitalPlaneBasis,
   orbitalToEcliptic,
   solveKepler,
 } from './orbital-mechanics';
@@ -109,6 +110,23 @@ describe('orbital-mechanics', () => {
     });
   });
 
+  describe('orbitalPlaneBasis', () => {
+    it('returns orthonormal perihelion and in-plane axes', () => {
+      const { px, py, pz, qx, qy, qz } = orbitalPlaneBasis(1.1, 0.4, 0.7);
+      expect(px * px + py * py + pz * pz).toBeCloseTo(1, 12);
+      expect(qx * qx + qy * qy + qz * qz).toBeCloseTo(1, 12);
+      expect(px * qx + py * qy + pz * qz).toBeCloseTo(0, 12);
+    });
+
+    it('matches orbitalToEcliptic for the same angles', () => {
+      const basis = orbitalPlaneBasis(1.1, 0.4, 0.7);
+      const result = orbitalToEcliptic(0.3, -0.8, 1.1, 0.4, 0.7);
+      expect(result.x).toBeCloseTo(basis.px * 0.3 - basis.qx * 0.8, 12);
+      expect(result.y).toBeCloseTo(basis.py * 0.3 - basis.qy * 0.8, 12);
+      expect(result.z).toBeCloseTo(basis.pz * 0.3 - basis.qz * 0.8, 12);
+    });
+  });
+
   describe('heliocentricToEquatorial', () => {
     it('should return valid RA and Dec ranges', () => {
       // Object at (2, 0, 0) AU
@@ -148,6 +166,18 @@ describe('orbital-mechanics', () => {
       );
       expect(positionAt(result.emissionJulianDate).x).toBeLessThan(positionAt(observationJD).x);
     });
+
+    it('gives identical results when the Earth position is reused', () => {
+      const observationJD = 2461200.5;
+      const positionAt = () => ({ x: 2, y: -1, z: 0.3 });
+      const first = lightTimeCorrectedEquatorial(positionAt, observationJD);
+      const second = lightTimeCorrectedEquatorial(positionAt, observationJD);
+      const direct = heliocentricToEquatorial(2, -1, 0.3, observationJD);
+
+      expect(second).toEqual(first);
+      expect(first.ra).toBeCloseTo(direct.ra, 10);
+      expect(first.dec).toBeCloseTo(direct.dec, 10);
+    });
   });
 
   describe('meanMotion', () => {
@@ -1,6 +1,9 @@
 import * as Astronomy from 'astronomy-engine';
 import { GAUSSIAN_GRAVITATIONAL_CONSTANT } from './constants';
 
+/** J2000 ecliptic → J2000 equator rotation; a fixed obliquity, so built once. */
+const ECLIPTIC_TO_EQUATORIAL = Astronomy.Rotation_ECL_EQJ();
+
 /**
  * Solve Kepler's equation for eccentric anomaly.
  * Supports both elliptical (e < 1) and hyperbolic (e >= 1) orbits.
@@ -46,32 +49,70 @@ export function getEarthPosition(julianDate: number): { x: number; y: number; z:
   return { x: earthEcliptic.x, y: earthEcliptic.y, z: earthEcliptic.z };
 }
 
-export interface LightTimeCorrectedPosition {
+/**
+ * Earth's heliocentric J2000 equatorial position by observation Julian date.
+ * Every comet and minor planet is evaluated at the same night sample times,
+ * so the VSOP Earth solve is shared across objects instead of repeated for
+ * each. Cleared when it grows past a few nights of samples.
+ */
+const earthPositionByJulianDate = new Map<number, Astronomy.Vector>();
+const MAX_EARTH_POSITIONS = 1024;
+
+function getEarthHelioEqj(julianDate: number, time: Astronomy.AstroTime): Astronomy.Vector {
+  let earth = earthPositionByJulianDate.get(julianDate);
+  if (!earth) {
+    if (earthPositionByJulianDate.size >= MAX_EARTH_POSITIONS) earthPositionByJulianDate.clear();
+    earth = Astronomy.HelioVector(Astronomy.Body.Earth, time);
+    earthPositionByJulianDate.set(julianDate, earth);
+  }
+  return earth;
+}
+
+/**
+ * Earth's heliocentric distance in AU at a Julian date. Every body evaluated
+ * at that date shares the cached Earth position rather than solving VSOP
+ * again for its magnitude terms.
+ */
+export function getEarthSunDistance(julianDate: number): number {
+  const time = new Astronomy.AstroTime(new Date((julianDate - 2440587.5) * 86400000));
+  return getEarthHelioEqj(julianDate, time).Length();
+}
+
+type EclipticPosition = { x: number; y: number; z: number };
+
+export interface LightTimeCorrectedPosition<P extends EclipticPosition = EclipticPosition> {
   ra: number;
   dec: number;
   distance: number;
   emissionJulianDate: number;
+  /** Heliocentric position from the final light-time iteration. */
+  emittedPosition: P;
 }
 
+/** Maximum light-time iterations before accepting the current estimate. */
+const MAX_LIGHT_TIME_ITERATIONS = 8;
+
 /**
  * Convert a moving heliocentric ecliptic orbit to an astrometric geocentric
- * position, iterating the object's emission time for light travel.
+ * position, iterating the object's emission time for light travel. The
+ * emitted heliocentric position is returned so callers need not propagate
+ * the orbit again for magnitude or distance terms.
  */
-export function lightTimeCorrectedEquatorial(
-  positionAtJulianDate: (julianDate: number) => { x: number; y: number; z: number },
+export function lightTimeCorrectedEquatorial<P extends EclipticPosition>(
+  positionAtJulianDate: (julianDate: number) => P,
   observationJulianDate: number
-): LightTimeCorrectedPosition {
+): LightTimeCorrectedPosition<P> {
   const observationDate = new Date((observationJulianDate - 2440587.5) * 86400000);
   const observationTime = new Astronomy.AstroTime(observationDate);
-  const earthEqj = Astronomy.HelioVector(Astronomy.Body.Earth, observationTime);
+  const earthEqj = getEarthHelioEqj(observationJulianDate, observationTime);
   let emissionJulianDate = observationJulianDate;
+  let emittedPosition = positionAtJulianDate(emissionJulianDate);
   let geo = new Astronomy.Vector(0, 0, 0, observationTime);
 
-  for (let iteration = 0; iteration < 8; iteration++) {
-    const objectEcliptic = positionAtJulianDate(emissionJulianDate);
+  for (let iteration = 1; ; iteration++) {
     const objectEqj = Astronomy.RotateVector(
-      Astronomy.Rotation_ECL_EQJ(),
-      new Astronomy.Vector(objectEcliptic.x, objectEcliptic.y, objectEcliptic.z, observationTime)
+      ECLIPTIC_TO_EQUATORIAL,
+      new Astronomy.Vector(emittedPosition.x, emittedPosition.y, emittedPosition.z, observationTime)
     );
     geo = new Astronomy.Vector(
       objectEqj.x - earthEqj.x,
@@ -80,11 +121,10 @@ export function lightTimeCorrectedEquatorial(
       observationTime
     );
     const nextEmissionJulianDate = observationJulianDate - geo.Length() / Astronomy.C_AUDAY;
-    if (Math.abs(nextEmissionJulianDate - emissionJulianDate) < 1e-10) {
-      emissionJulianDate = nextEmissionJulianDate;
-      break;
-    }
+    const converged = Math.abs(nextEmissionJulianDate - emissionJulianDate) < 1e-10;
     emissionJulianDate = nextEmissionJulianDate;
+    if (converged || iteration >= MAX_LIGHT_TIME_ITERATIONS) break;
+    emittedPosition = positionAtJulianDate(emissionJulianDate);
   }
 
   const equator = Astronomy.EquatorFromVector(geo);
@@ -93,20 +133,32 @@ export function lightTimeCorrectedEquatorial(
     dec: equator.dec,
     distance: geo.Length(),
     emissionJulianDate,
+    emittedPosition,
   };
 }
 
 /**
- * Transform orbital plane coordinates to heliocentric ecliptic coordinates.
- * Applies the three Euler-angle rotation matrices.
+ * Ecliptic components of the orbital-plane axes: P points to perihelion and Q
+ * is 90° ahead in the direction of motion. They depend only on the angular
+ * elements, so propagators compute them once per orbit.
  */
-export function orbitalToEcliptic(
-  xOrbital: number,
-  yOrbital: number,
+export interface OrbitalPlaneBasis {
+  px: number;
+  py: number;
+  pz: number;
+  qx: number;
+  qy: number;
+  qz: number;
+}
+
+/**
+ * Build the orbital-plane basis from the three Euler angles.
+ */
+export function orbitalPlaneBasis(
   omegaRad: number,
   OmegaRad: number,
   iRad: number
-): { x: number; y: number; z: number } {
+): OrbitalPlaneBasis {
   const cosOmega = Math.cos(OmegaRad);
   const sinOmega = Math.sin(OmegaRad);
   const cosI = Math.cos(iRad);
@@ -114,15 +166,33 @@ export function orbitalToEcliptic(
   const cosOmegaArg = Math.cos(omegaRad);
   const sinOmegaArg = Math.sin(omegaRad);
 
-  const x =
-    (cosOmega * cosOmegaArg - sinOmega * sinOmegaArg * cosI) * xOrbital +
-    (-cosOmega * sinOmegaArg - sinOmega * cosOmegaArg * cosI) * yOrbital;
-  const y =
-    (sinOmega * cosOmegaArg + cosOmega * sinOmegaArg * cosI) * xOrbital +
-    (-sinOmega * sinOmegaArg + cosOmega * cosOmegaArg * cosI) * yOrbital;
-  const z = sinOmegaArg * sinI * xOrbital + cosOmegaArg * sinI * yOrbital;
+  return {
+    px: cosOmega * cosOmegaArg - sinOmega * sinOmegaArg * cosI,
+    py: sinOmega * cosOmegaArg + cosOmega * sinOmegaArg * cosI,
+    pz: sinOmegaArg * sinI,
+    qx: -cosOmega * sinOmegaArg - sinOmega * cosOmegaArg * cosI,
+    qy: -sinOmega * sinOmegaArg + cosOmega * cosOmegaArg * cosI,
+    qz: cosOmegaArg * sinI,
+  };
+}
 
-  return { x, y, z };
+/**
+ * Transform orbital plane coordinates to heliocentric ecliptic coordinates.
+ * Applies the three Euler-angle rotation matrices.
+ */
+export function orbitalToEcliptic(
+  xOrbital: number,
+  yOrbital: number,
+  omegaRad: number,
+  OmegaRad: number,
+  iRad: number
+): { x: number; y: number; z: number } {
+  const { px, py, pz, qx, qy, qz } = orbitalPlaneBasis(omegaRad, OmegaRad, iRad);
+  return {
+    x: px * xOrbital + qx * yOrbital,
+    y: py * xOrbital + qy * yOrbital,
+    z: pz * xOrbital + qz * yOrbital,
+  };
 }
 
 /**
@@ -137,8 +207,8 @@ export function heliocentricToEquatorial(
   const date = new Date((julianDate - 2440587.5) * 86400000);
   const time = new Astronomy.AstroTime(date);
   const eclipticVector = new Astronomy.Vector(helioX, helioY, helioZ, time);
-  const objectEqj = Astronomy.RotateVector(Astronomy.Rotation_ECL_EQJ(), eclipticVector);
-  const earthEqj = Astronomy.HelioVector(Astronomy.Body.Earth, time);
+  const objectEqj = Astronomy.RotateVector(ECLIPTIC_TO_EQUATORIAL, eclipticVector);
+  const earthEqj = getEarthHelioEqj(julianDate, time);
 
   // Geocentric J2000 position using Astronomy Engine's VSOP Earth ephemeris.
   const geoX = objectEqj.x - earthEqj.x;
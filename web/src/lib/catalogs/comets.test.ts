@@ -1,7 +1,17 @@
-import { describe, expect, it } from 'vitest';
+import { describe, expect, it, vi } from 'vitest';
+import { createMockNightInfo } from '@/test/factories';
+import { SkyCalculator } from '../astronomy/calculator';
 import { lightTimeCorrectedEquatorial } from '../astronomy/orbital-mechanics';
 import type { ParsedComet } from './comets';
-import { calculateCometPosition, isInterstellarDesignation, parseMPCCometLine } from './comets';
+import {
+  calculateCometMagnitude,
+  calculateCometPosition,
+  calculateCometVisibility,
+  isInterstellarDesignation,
+  isPropagatableComet,
+  minimumCometMagnitude,
+  parseMPCCometLine,
+} from './comets';
 
 function comet(eccentricity: number): ParsedComet {
   return {
@@ -20,6 +30,24 @@ function comet(eccentricity: number): ParsedComet {
   };
 }
 
+/** MPC two-body elements for 3I/ATLAS. */
+function interstellarAtlas(): ParsedComet {
+  return {
+    designation: '3I',
+    name: 'ATLAS',
+    perihelionDistance: 1.356507,
+    eccentricity: 6.139884,
+    inclination: 175.1129,
+    longitudeOfAscendingNode: 322.1535,
+    argumentOfPerihelion: 128.0055,
+    perihelionTime: 2460977.9825,
+    absoluteMagnitude: 11.8,
+    slopeParameter: 4,
+    isInterstellar: true,
+    epochJD: 2461000.5,
+  };
+}
+
 describe('comet conic propagation', () => {
   it.each([0.999995, 1, 1.000005])(
     'preserves perihelion distance for eccentricity %s',
@@ -62,20 +90,7 @@ describe('MPC comet parser', () => {
   });
 
   it('keeps the MPC two-body 3I solution close to JPL Horizons in July 2026', () => {
-    const threeI: ParsedComet = {
-      designation: '3I',
-      name: 'ATLAS',
-      perihelionDistance: 1.356507,
-      eccentricity: 6.139884,
-      inclination: 175.1129,
-      longitudeOfAscendingNode: 322.1535,
-      argumentOfPerihelion: 128.0055,
-      perihelionTime: 2460977.9825,
-      absoluteMagnitude: 11.8,
-      slopeParameter: 4,
-      isInterstellar: true,
-      epochJD: 2461000.5,
-    };
+    const threeI = interstellarAtlas();
     const observation = new Date('2026-07-21T23:59:00Z');
     const observationJd = observation.getTime() / 86_400_000 + 2440587.5;
     const position = lightTimeCorrectedEquatorial(
@@ -102,3 +117,58 @@ describe('interstellar classification', () => {
     expect(isInterstellarDesignation('C/2023 A3')).toBe(false);
   });
 });
+
+describe('comet magnitude lower bound', () => {
+  it.each([4, -2])(
+    'never exceeds the light-time corrected apparent magnitude (slope %d)',
+    slopeParameter => {
+      const target = { ...comet(0.95), slopeParameter };
+      for (let offset = -2000; offset <= 2000; offset += 250) {
+        const jd = 2460000 + offset;
+        const equator = lightTimeCorrectedEquatorial(
+          sampleJd => calculateCometPosition(target, sampleJd),
+          jd
+        );
+        const emitted = calculateCometPosition(target, equator.emissionJulianDate);
+        const apparent = calculateCometMagnitude(
+          target.absoluteMagnitude,
+          equator.distance,
+          emitted.r,
+          target.slopeParameter
+        );
+
+        const bound = minimumCometMagnitude(target, calculateCometPosition(target, jd).r);
+        expect(bound).toBeLessThanOrEqual(apparent);
+      }
+    }
+  );
+});
+
+describe('comet visibility prefilter', () => {
+  it('skips night sampling for a comet that stays below the horizon', () => {
+    // 3I sits near +20° declination in July 2026, out of reach from 85°S.
+    const calculator = new SkyCalculator(-85, 0);
+    const calculateVisibility = vi.spyOn(calculator, 'calculateVisibility');
+    const nightInfo = createMockNightInfo({
+      observingWindowStart: new Date('2026-07-21T20:00:00Z'),
+      observingWindowEnd: new Date('2026-07-22T04:00:00Z'),
+    });
+
+    expect(calculateCometVisibility(interstellarAtlas(), calculator, nightInfo, 25)).toBeNull();
+    expect(calculateVisibility).not.toHaveBeenCalled();
+  });
+});
+
+describe('comet orbit validation', () => {
+  it('accepts well-formed orbits across the forecast span', () => {
+    expect(isPropagatableComet(comet(0.95), [2460000, 2460014])).toBe(true);
+    expect(isPropagatableComet(interstellarAtlas(), [2461243, 2461257])).toBe(true);
+  });
+
+  it('rejects elements that cannot be propagated', () => {
+    expect(isPropagatableComet(comet(Number.NaN), [2460000, 2460014])).toBe(false);
+    expect(
+      isPropagatableComet({ ...comet(0.5), perihelionDistance: -1 }, [2460000, 2460014])
+    ).toBe(false);
+  });
+});
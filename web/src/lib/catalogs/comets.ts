@@ -1,14 +1,14 @@
-import cometsJson from '@/data/comets.json';
 import type { NightInfo, ObjectVisibility } from '@/types';
-import type { SkyCalculator } from '../astronomy/calculator';
+import { angularSeparation, type SkyCalculator } from '../astronomy/calculator';
 import { GAUSSIAN_GRAVITATIONAL_CONSTANT } from '../astronomy/constants';
 import {
   lightTimeCorrectedEquatorial,
   meanMotion,
-  orbitalToEcliptic,
+  orbitalPlaneBasis,
   solveKepler,
 } from '../astronomy/orbital-mechanics';
 import { CACHE_KEYS, CACHE_TTLS, getCached, setCache } from '../utils/cache';
+import { forEachResponseLine } from '../utils/response-lines';
 
 // MPC Comet data URL - we'll use a CORS proxy or fetch directly
 const MPC_COMET_URL = 'https://www.minorplanetcenter.net/iau/MPCORB/CometEls.txt';
@@ -17,29 +17,62 @@ const MPC_COMET_URL = 'https://www.minorplanetcenter.net/iau/MPCORB/CometEls.txt
  * Parsed comet from MPC data
  */
 export interface ParsedComet {
-  designation: string;
-  name: string;
-  perihelionDistance: number; // q in AU
-  eccentricity: number;
-  inclination: number; // degrees
-  longitudeOfAscendingNode: number; // degrees
-  argumentOfPerihelion: number; // degrees
-  perihelionTime: number; // Julian date
-  absoluteMagnitude: number; // g
-  slopeParameter: number; // k (default 10)
-  isInterstellar: boolean;
-  epochJD: number;
+  readonly designation: string;
+  readonly name: string;
+  readonly perihelionDistance: number; // q in AU
+  readonly eccentricity: number;
+  readonly inclination: number; // degrees
+  readonly longitudeOfAscendingNode: number; // degrees
+  readonly argumentOfPerihelion: number; // degrees
+  readonly perihelionTime: number; // Julian date
+  readonly absoluteMagnitude: number; // g
+  readonly slopeParameter: number; // k (default 10)
+  readonly isInterstellar: boolean;
+  readonly epochJD: number;
 }
 
+const INTERSTELLAR_DESIGNATION = /^\d+I(?:\/|$)/i;
+
+/** MPC separates the comet name from its publication reference by a wide gap. */
+const PUBLICATION_REFERENCE_GAP = /\s{2,}/;
+
 /** MPC interstellar designations use a numbered I/ prefix (for example 2I/Borisov). */
 export function isInterstellarDesignation(designation: string): boolean {
-  return /^\d+I(?:\/|$)/i.test(designation.trim());
+  return INTERSTELLAR_DESIGNATION.test(designation.trim());
+}
+
+/** Default absolute magnitude and slope when MPC leaves the field blank. */
+const DEFAULT_COMET_MAGNITUDE_PARAMETER = 10.0;
+
+function finiteOrDefault(value: number): number {
+  return Number.isFinite(value) ? value : DEFAULT_COMET_MAGNITUDE_PARAMETER;
 }
 
+/**
+ * Resolve derived and defaulted fields once, before the bundled catalog is
+ * cached, so entries reach the per-night magnitude code as plain finite
+ * numbers. Only the orbital elements are copied: every record shares one
+ * shape and no stray keys from the bundled JSON are kept alive.
+ */
 function normalizeComet(comet: ParsedComet): ParsedComet {
-  return { ...comet, isInterstellar: isInterstellarDesignation(comet.designation) };
+  return {
+    designation: comet.designation,
+    name: comet.name,
+    perihelionDistance: comet.perihelionDistance,
+    eccentricity: comet.eccentricity,
+    inclination: comet.inclination,
+    longitudeOfAscendingNode: comet.longitudeOfAscendingNode,
+    argumentOfPerihelion: comet.argumentOfPerihelion,
+    perihelionTime: comet.perihelionTime,
+    absoluteMagnitude: finiteOrDefault(comet.absoluteMagnitude),
+    slopeParameter: finiteOrDefault(comet.slopeParameter),
+    isInterstellar: isInterstellarDesignation(comet.designation),
+    epochJD: comet.epochJD,
+  };
 }
 
+const INV_LN10 = 1 / Math.LN10;
+
 /**
  * Calculate apparent magnitude for a comet
  * m = g + 5*log10(Δ) + k*log10(r)
@@ -57,31 +90,74 @@ export function calculateCometMagnitude(
 ): number {
   if (earthDistanceAU <= 0 || sunDistanceAU <= 0) return 99.0;
 
-  return absoluteMag + 5 * Math.log10(earthDistanceAU) + slopeParameter * Math.log10(sunDistanceAU);
+  // Both terms share one scale factor, so the base change is applied once
+  return (
+    absoluteMag +
+    (5 * Math.log(earthDistanceAU) + slopeParameter * Math.log(sunDistanceAU)) * INV_LN10
+  );
 }
 
+/** Earth's perihelion and aphelion distances from the Sun (AU). */
+const EARTH_PERIHELION_AU = 0.9833;
+const EARTH_APHELION_AU = 1.0167;
+/** Slack (AU) covering the comet's motion during the light-time step. */
+const LIGHT_TIME_DISTANCE_SLACK_AU = 0.01;
+/** Closest Earth distance assumed when the bound cannot exclude an encounter. */
+const MIN_EARTH_DISTANCE_AU = 0.001;
+
 /**
- * Parse MPC comet designation and name
+ * Brightest apparent magnitude a comet can have at a given heliocentric
+ * distance. Earth stays between perihelion and aphelion, so the geocentric
+ * distance is at least |r - R_earth| whatever the viewing geometry; this lets
+ * faint comets be rejected before the full geocentric light-time solve.
+ */
+export function minimumCometMagnitude(comet: ParsedComet, heliocentricDistanceAU: number): number {
+  const r = heliocentricDistanceAU;
+  const earthDistance = Math.max(
+    r - EARTH_APHELION_AU - LIGHT_TIME_DISTANCE_SLACK_AU,
+    EARTH_PERIHELION_AU - r - LIGHT_TIME_DISTANCE_SLACK_AU,
+    MIN_EARTH_DISTANCE_AU
+  );
+  // The magnitude rises with r for a positive slope and falls for a negative
+  // one, so take whichever end of the light-time slack gives the brighter value.
+  const sunDistance =
+    comet.slopeParameter >= 0
+      ? r - LIGHT_TIME_DISTANCE_SLACK_AU
+      : r + LIGHT_TIME_DISTANCE_SLACK_AU;
+  return calculateCometMagnitude(
+    comet.absoluteMagnitude,
+    earthDistance,
+    Math.max(sunDistance, MIN_EARTH_DISTANCE_AU),
+    comet.slopeParameter
+  );
+}
+
+/**
+ * Parse an already-trimmed MPC comet designation and name
  * Examples:
  *   "C/2023 A3 (Tsuchinshan-ATLAS)" -> code="C/2023 A3", name="Tsuchinshan-ATLAS"
  *   "12P/Pons-Brooks" -> code="12P", name="Pons-Brooks"
  */
 function parseCometName(fullDesignation: string): { designation: string; name: string } {
-  // MPC appends a publication reference in a distant fixed-width column.
-  const catalogName = fullDesignation.trim().split(/\s{2,}/, 1)[0];
-
-  // Check for name in parentheses
-  if (catalogName.includes('(') && catalogName.includes(')')) {
-    const parenStart = catalogName.indexOf('(');
-    const parenEnd = catalogName.lastIndexOf(')');
+  // MPC appends a publication reference in a distant fixed-width column; it
+  // is cut at the first wide gap without building a split array.
+  const referenceGap = fullDesignation.search(PUBLICATION_REFERENCE_GAP);
+  const catalogName =
+    referenceGap >= 0 ? fullDesignation.substring(0, referenceGap) : fullDesignation;
+
+  // Check for name in parentheses; each delimiter is located once and its
+  // index reused for the split
+  const parenStart = catalogName.indexOf('(');
+  const parenEnd = parenStart >= 0 ? catalogName.lastIndexOf(')') : -1;
+  if (parenEnd >= 0) {
     const code = catalogName.substring(0, parenStart).trim();
     const name = catalogName.substring(parenStart + 1, parenEnd);
     return { designation: code, name };
   }
 
   // Check for periodic comet format (e.g., "12P/Pons-Brooks")
-  if (catalogName.includes('/')) {
-    const slashIndex = catalogName.indexOf('/');
+  const slashIndex = catalogName.indexOf('/');
+  if (slashIndex >= 0) {
     const code = catalogName.substring(0, slashIndex);
     const name = catalogName.substring(slashIndex + 1);
     return { designation: code, name };
@@ -106,7 +182,7 @@ export function parseMPCCometLine(line: string): ParsedComet | null {
     }
 
     // MPC CometEls fixed-width columns (zero-based slice boundaries below).
-    // Perihelion date: columns 15-29 (YYYYMMDD.dddd)
+    // Perihelion date: columns 15-29 (YYYY MM DD.dddd)
     // q (perihelion dist): columns 31-39
     // e (eccentricity): columns 42-51
     // ω (arg of perihelion): columns 52-62
@@ -117,37 +193,28 @@ export function parseMPCCometLine(line: string): ParsedComet | null {
     // G (slope): columns 98-103
     // Designation/Name: columns 103-end
 
-    const perihelionDateStr = line.substring(14, 29).trim();
-    const qStr = line.substring(30, 40).trim();
-    const eStr = line.substring(41, 52).trim();
-    const omegaStr = line.substring(51, 62).trim();
-    const nodeStr = line.substring(61, 72).trim();
-    const incStr = line.substring(71, 82).trim();
-    const epochStr = line.substring(81, 93).trim();
-    const hStr = line.substring(91, 97).trim();
-    const kStr = line.substring(96, 102).trim();
-    const nameStr = line.substring(102).trim();
-
-    const q = parseFloat(qStr);
-    const e = parseFloat(eStr);
-    const inc = parseFloat(incStr);
-    const omega = parseFloat(omegaStr);
-    const node = parseFloat(nodeStr);
-    const parsedH = parseFloat(hStr);
-    const parsedK = parseFloat(kStr);
-    const H = Number.isFinite(parsedH) ? parsedH : 10.0;
-    const K = Number.isFinite(parsedK) ? parsedK : 10.0;
-
+    // q and e decide whether the line is usable, so they are read first and
+    // the remaining columns are only sliced for lines that pass.
+    const q = parseFloat(line.substring(30, 40));
+    const e = parseFloat(line.substring(41, 52));
     if (Number.isNaN(q) || Number.isNaN(e)) {
       return null;
     }
 
-    // Parse perihelion date (YYYYMMDD.dddd format)
-    const perihelionParts = perihelionDateStr.split(/\s+/);
-    if (perihelionParts.length !== 3) return null;
-    const year = parseInt(perihelionParts[0], 10);
-    const month = parseInt(perihelionParts[1], 10);
-    const day = parseFloat(perihelionParts[2]);
+    const epochStr = line.substring(81, 93).trim();
+    const nameStr = line.substring(102).trim();
+
+    const inc = parseFloat(line.substring(71, 82));
+    const omega = parseFloat(line.substring(51, 62));
+    const node = parseFloat(line.substring(61, 72));
+    const H = finiteOrDefault(parseFloat(line.substring(91, 97)));
+    const K = finiteOrDefault(parseFloat(line.substring(96, 102)));
+
+    // Perihelion date ("YYYY MM DD.dddd") is read from its fixed year,
+    // month and day columns rather than tokenized per line
+    const year = parseInt(line.substring(14, 18), 10);
+    const month = parseInt(line.substring(19, 21), 10);
+    const day = parseFloat(line.substring(22, 29));
     if (!Number.isFinite(year) || !Number.isFinite(month) || !Number.isFinite(day)) return null;
 
     // Convert the fractional calendar day to Julian date.
@@ -177,7 +244,7 @@ export function parseMPCCometLine(line: string): ParsedComet | null {
       perihelionTime: perihelionJD,
       absoluteMagnitude: H,
       slopeParameter: K,
-      isInterstellar: isInterstellarDesignation(designation),
+      isInterstellar: INTERSTELLAR_DESIGNATION.test(designation),
       epochJD,
     };
   } catch {
@@ -198,14 +265,19 @@ function dateToJulian(year: number, month: number, day: number): number {
   return Math.floor(365.25 * (year + 4716)) + Math.floor(30.6001 * (month + 1)) + day + B - 1524.5;
 }
 
+type HeliocentricPropagator = (julianDate: number) => {
+  x: number;
+  y: number;
+  z: number;
+  r: number;
+};
+
 /**
- * Calculate comet position in heliocentric ecliptic coordinates
- * Returns [x, y, z] in AU
+ * Build a heliocentric ecliptic propagator for a comet. The orbital-plane
+ * rotation, semi-major axis and mean motion depend only on the elements, so
+ * they are evaluated once and each sample only solves for the anomaly.
  */
-export function calculateCometPosition(
-  comet: ParsedComet,
-  julianDate: number
-): { x: number; y: number; z: number; r: number } {
+function createCometPropagator(comet: ParsedComet): HeliocentricPropagator {
   const {
     perihelionDistance: q,
     eccentricity: e,
@@ -215,86 +287,158 @@ export function calculateCometPosition(
     perihelionTime: T,
   } = comet;
 
-  // Convert angles to radians
-  const iRad = (i * Math.PI) / 180;
-  const OmegaRad = (Omega * Math.PI) / 180;
-  const omegaRad = (omega * Math.PI) / 180;
-
-  // Time since perihelion in days
-  const dt = julianDate - T;
-
-  // True anomaly and distance
-  let nu: number;
-  let r: number;
+  const { px, py, pz, qx, qy, qz } = orbitalPlaneBasis(
+    (omega * Math.PI) / 180,
+    (Omega * Math.PI) / 180,
+    (i * Math.PI) / 180
+  );
+  const toEcliptic = (nu: number, r: number) => {
+    // Position in orbital plane
+    const xOrbital = r * Math.cos(nu);
+    const yOrbital = r * Math.sin(nu);
+    return {
+      x: px * xOrbital + qx * yOrbital,
+      y: py * xOrbital + qy * yOrbital,
+      z: pz * xOrbital + qz * yOrbital,
+      r,
+    };
+  };
 
   if (e === 1) {
     // Barker's equation for the parabolic case.
-    const w = (3 * GAUSSIAN_GRAVITATIONAL_CONSTANT * dt) / Math.sqrt(2 * q ** 3);
-    const d = 2 * Math.sinh(Math.asinh(w / 2) / 3);
-    nu = 2 * Math.atan(d);
-    r = q * (1 + d * d);
-  } else if (e < 1) {
+    const parabolicRate = (3 * GAUSSIAN_GRAVITATIONAL_CONSTANT) / Math.sqrt(2 * q ** 3);
+    return julianDate => {
+      const w = parabolicRate * (julianDate - T);
+      const d = 2 * Math.sinh(Math.asinh(w / 2) / 3);
+      return toEcliptic(2 * Math.atan(d), q * (1 + d * d));
+    };
+  }
+
+  if (e < 1) {
     const a = q / (1 - e);
-    const eccentricAnomaly = solveKepler(meanMotion(a) * dt, e, 50, 1e-10);
-    nu =
-      2 *
-      Math.atan2(
-        Math.sqrt(1 + e) * Math.sin(eccentricAnomaly / 2),
-        Math.sqrt(1 - e) * Math.cos(eccentricAnomaly / 2)
-      );
-    r = a * (1 - e * Math.cos(eccentricAnomaly));
-  } else {
-    const a = q / (e - 1);
-    const hyperbolicAnomaly = solveKepler(meanMotion(a) * dt, e, 50, 1e-10);
-    nu =
+    const n = meanMotion(a);
+    const sqrtOnePlusE = Math.sqrt(1 + e);
+    const sqrtOneMinusE = Math.sqrt(1 - e);
+    return julianDate => {
+      const eccentricAnomaly = solveKepler(n * (julianDate - T), e, 50, 1e-10);
+      const nu =
+        2 *
+        Math.atan2(
+          sqrtOnePlusE * Math.sin(eccentricAnomaly / 2),
+          sqrtOneMinusE * Math.cos(eccentricAnomaly / 2)
+        );
+      return toEcliptic(nu, a * (1 - e * Math.cos(eccentricAnomaly)));
+    };
+  }
+
+  const a = q / (e - 1);
+  const n = meanMotion(a);
+  const sqrtEPlusOne = Math.sqrt(e + 1);
+  const sqrtEMinusOne = Math.sqrt(e - 1);
+  return julianDate => {
+    const hyperbolicAnomaly = solveKepler(n * (julianDate - T), e, 50, 1e-10);
+    const nu =
       2 *
       Math.atan2(
-        Math.sqrt(e + 1) * Math.sinh(hyperbolicAnomaly / 2),
-        Math.sqrt(e - 1) * Math.cosh(hyperbolicAnomaly / 2)
+        sqrtEPlusOne * Math.sinh(hyperbolicAnomaly / 2),
+        sqrtEMinusOne * Math.cosh(hyperbolicAnomaly / 2)
       );
-    r = a * (e * Math.cosh(hyperbolicAnomaly) - 1);
-  }
+    return toEcliptic(nu, a * (e * Math.cosh(hyperbolicAnomaly) - 1));
+  };
+}
+
+/**
+ * Propagators keyed by comet, so the load-time orbit check and every night of
+ * the forecast share one set of precomputed orbital constants.
+ */
+const cometPropagators = new WeakMap<ParsedComet, HeliocentricPropagator>();
 
-  // Position in orbital plane
-  const xOrbital = r * Math.cos(nu);
-  const yOrbital = r * Math.sin(nu);
+function getCometPropagator(comet: ParsedComet): HeliocentricPropagator {
+  let propagate = cometPropagators.get(comet);
+  if (!propagate) {
+    propagate = createCometPropagator(comet);
+    cometPropagators.set(comet, propagate);
+  }
+  return propagate;
+}
 
-  // Transform to heliocentric ecliptic coordinates
-  const ecliptic = orbitalToEcliptic(xOrbital, yOrbital, omegaRad, OmegaRad, iRad);
+/**
+ * Calculate comet position in heliocentric ecliptic coordinates
+ * Returns [x, y, z] in AU
+ */
+export function calculateCometPosition(
+  comet: ParsedComet,
+  julianDate: number
+): { x: number; y: number; z: number; r: number } {
+  return getCometPropagator(comet)(julianDate);
+}
 
-  return { ...ecliptic, r };
+/**
+ * Whether a comet's elements propagate to finite positions at every given
+ * Julian date. Used to drop malformed upstream orbits once per forecast.
+ */
+export function isPropagatableComet(comet: ParsedComet, julianDates: number[]): boolean {
+  try {
+    const propagate = getCometPropagator(comet);
+    return julianDates.every(julianDate => {
+      const { x, y, z, r } = propagate(julianDate);
+      return Number.isFinite(x) && Number.isFinite(y) && Number.isFinite(z) && r > 0;
+    });
+  } catch {
+    return false;
+  }
 }
 
 // heliocentricToEquatorial is re-exported from orbital-mechanics for backward compatibility
 export { heliocentricToEquatorial } from '../astronomy/orbital-mechanics';
 
 function getCometEquatorial(
-  comet: ParsedComet,
+  propagate: HeliocentricPropagator,
   time: Date
 ): { raHours: number; decDegrees: number } {
   const jd = time.getTime() / 86400000 + 2440587.5;
-  const equator = lightTimeCorrectedEquatorial(
-    sampleJD => calculateCometPosition(comet, sampleJD),
-    jd
-  );
+  const equator = lightTimeCorrectedEquatorial(propagate, jd);
   return { raHours: equator.ra, decDegrees: equator.dec };
 }
 
 /**
- * Get comet data from bundled static JSON, with IndexedDB cache and MPC live fallback.
+ * Normalized comet catalog kept for the session so repeated forecasts (new
+ * location, changed settings) skip the IndexedDB read and normalization.
+ * Expires with the same TTL as the persisted cache.
  */
-export async function fetchComets(maxMagnitude: number = 12.0): Promise<ParsedComet[]> {
-  // Check cache first
+let loadedCatalog: { comets: ParsedComet[]; loadedAt: number } | null = null;
+
+/**
+ * Load the full normalized comet catalog: session memo, then IndexedDB cache,
+ * then bundled static JSON, then a live MPC fetch.
+ */
+async function loadCometCatalog(): Promise<ParsedComet[]> {
+  if (loadedCatalog && Date.now() - loadedCatalog.loadedAt <= CACHE_TTLS.COMETS) {
+    return loadedCatalog.comets;
+  }
+
+  const remember = (comets: ParsedComet[]) => {
+    loadedCatalog = { comets, loadedAt: Date.now() };
+    return comets;
+  };
+
+  // Check cache first. Every writer stores normalized records (the MPC
+  // parser builds them in the same shape), so a warm start uses them as read.
   const cached = await getCached<ParsedComet[]>(CACHE_KEYS.COMETS, CACHE_TTLS.COMETS);
   if (cached) {
-    return cached.map(normalizeComet).filter(c => c.absoluteMagnitude <= maxMagnitude + 5);
+    return remember(cached);
   }
 
-  // Use bundled static data
-  const staticComets = cometsJson as unknown as ParsedComet[];
+  // Use bundled static data, persisting the normalized records so later
+  // sessions store and read the same compact shape. The ~350KB catalog is
+  // imported lazily, so sessions served from the cache never parse it or keep
+  // a second copy of every comet in memory.
+  const module = await import('@/data/comets.json');
+  const staticComets = module.default as unknown as ParsedComet[];
   if (staticComets && staticComets.length > 0) {
-    await setCache(CACHE_KEYS.COMETS, staticComets);
-    return staticComets.map(normalizeComet).filter(c => c.absoluteMagnitude <= maxMagnitude + 5);
+    const comets = staticComets.map(normalizeComet);
+    await setCache(CACHE_KEYS.COMETS, comets);
+    return remember(comets);
   }
 
   // Fallback: try fetching directly from MPC
@@ -304,19 +448,16 @@ export async function fetchComets(maxMagnitude: number = 12.0): Promise<ParsedCo
       throw new Error(`Failed to fetch comet data: ${response.status}`);
     }
 
-    const text = await response.text();
-    const lines = text.split('\n');
     const comets: ParsedComet[] = [];
-
-    for (const line of lines) {
+    await forEachResponseLine(response, line => {
       const comet = parseMPCCometLine(line);
       if (comet) {
         comets.push(comet);
       }
-    }
+    });
 
     await setCache(CACHE_KEYS.COMETS, comets);
-    return comets.filter(c => c.absoluteMagnitude <= maxMagnitude + 5);
+    return remember(comets);
   } catch (_error) {
     // No data is safer than silently substituting stale historical elements,
     // which can produce convincing but wrong positions and magnitudes.
@@ -324,6 +465,81 @@ export async function fetchComets(maxMagnitude: number = 12.0): Promise<ParsedCo
   }
 }
 
+/**
+ * Magnitude-limited subsets of each loaded catalog, so repeat forecasts and
+ * searches with the same limit skip the scan over every comet.
+ */
+const cometSubsets = new WeakMap<ParsedComet[], Map<number, readonly ParsedComet[]>>();
+
+/**
+ * Get comet data from bundled static JSON, with IndexedDB cache and MPC live fallback.
+ */
+export async function fetchComets(maxMagnitude: number = 12.0): Promise<readonly ParsedComet[]> {
+  const comets = await loadCometCatalog();
+  let subsets = cometSubsets.get(comets);
+  if (!subsets) {
+    subsets = new Map();
+    cometSubsets.set(comets, subsets);
+  }
+
+  let subset = subsets.get(maxMagnitude);
+  if (!subset) {
+    // Absolute magnitude allows for comets brightening near perihelion; the
+    // limit is resolved once so the scan is a single comparison per comet.
+    const absoluteLimit = maxMagnitude + 5;
+    subset = comets.filter(c => c.absoluteMagnitude <= absoluteLimit);
+    subsets.set(maxMagnitude, subset);
+  }
+  return subset;
+}
+
+/**
+ * Allowance (degrees) for refraction and precession from J2000 when bounding
+ * the altitude from J2000 positions.
+ */
+const ALTITUDE_CEILING_MARGIN_DEG = 1.5;
+
+/**
+ * Whether a comet can reach the horizon during the night. Positions at the
+ * window edges and midnight go through the night's closed-form altitude
+ * ceiling; altitude changes by at most the angular distance moved, so half
+ * the larger step between those positions covers the comet's motion in
+ * between. One pass thus fuses the declination and hour-angle screens
+ * without sampling the whole night.
+ */
+function canRiseDuringNight(
+  propagate: HeliocentricPropagator,
+  nightInfo: NightInfo,
+  midnightPosition: { raHours: number; decDegrees: number },
+  calculator: SkyCalculator
+): boolean {
+  const positions = [
+    getCometEquatorial(propagate, nightInfo.observingWindowStart),
+    midnightPosition,
+    getCometEquatorial(propagate, nightInfo.observingWindowEnd),
+  ];
+  const ceiling = calculator.getAltitudeCeiling(nightInfo);
+
+  let highest = -90;
+  let largestStep = 0;
+  for (const [index, { raHours, decDegrees }] of positions.entries()) {
+    if (!Number.isFinite(raHours) || !Number.isFinite(decDegrees)) return true;
+    highest = Math.max(highest, ceiling(raHours, decDegrees));
+    if (index > 0) {
+      const previous = positions[index - 1];
+      const step = angularSeparation(
+        previous.raHours * 15,
+        previous.decDegrees,
+        raHours * 15,
+        decDegrees
+      );
+      largestStep = Math.max(largestStep, step);
+    }
+  }
+
+  return highest + largestStep / 2 + ALTITUDE_CEILING_MARGIN_DEG >= 0;
+}
+
 /**
  * Calculate comet visibility for a given night
  */
@@ -334,18 +550,22 @@ export function calculateCometVisibility(
   maxMagnitude: number = 12.0
 ): ObjectVisibility | null {
   // Get Julian date for midnight
-  const midnight = new Date(
-    (nightInfo.observingWindowStart.getTime() + nightInfo.observingWindowEnd.getTime()) / 2
-  );
-  const jd = midnight.getTime() / 86400000 + 2440587.5;
+  const jd = calculator.getNightMidpoint(nightInfo).date.getTime() / 86400000 + 2440587.5;
 
   // Calculate comet position
-  const equator = lightTimeCorrectedEquatorial(
-    sampleJD => calculateCometPosition(comet, sampleJD),
-    jd
-  );
-  const { ra, dec, distance: earthDist } = equator;
-  const emittedPosition = calculateCometPosition(comet, equator.emissionJulianDate);
+  const propagate = getCometPropagator(comet);
+
+  // Cheap heliocentric-only rejection before solving the geocentric position
+  const heliocentricDistance = propagate(jd).r;
+  if (
+    Number.isFinite(heliocentricDistance) &&
+    minimumCometMagnitude(comet, heliocentricDistance) > maxMagnitude
+  ) {
+    return null;
+  }
+
+  const equator = lightTimeCorrectedEquatorial(propagate, jd);
+  const { ra, dec, distance: earthDist, emittedPosition } = equator;
 
   // Skip if position calculation produced invalid values
   if (
@@ -370,6 +590,11 @@ export function calculateCometVisibility(
     return null;
   }
 
+  // Skip the full night sampling for comets that stay below the horizon
+  if (!canRiseDuringNight(propagate, nightInfo, { raHours: ra, decDegrees: dec }, calculator)) {
+    return null;
+  }
+
   // Calculate visibility using the sky calculator
   const visibility = calculator.calculateVisibility(
     ra,
@@ -381,7 +606,7 @@ export function calculateCometVisibility(
       magnitude: apparentMag,
       isInterstellar: comet.isInterstellar,
       commonName: `${comet.name} (${comet.designation})`,
-      positionAtTime: time => getCometEquatorial(comet, time),
+      positionAtTime: time => getCometEquatorial(propagate, time),
     }
   );
 
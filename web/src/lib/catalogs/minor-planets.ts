@@ -3,16 +3,26 @@ import type { NightInfo, ObjectVisibility } from '@/types';
 import type { SkyCalculator } from '../astronomy/calculator';
 import { AU_TO_KM, RADIANS_TO_ARCSEC } from '../astronomy/constants';
 import {
+  getEarthSunDistance,
   lightTimeCorrectedEquatorial,
   meanMotion,
-  orbitalToEcliptic,
+  orbitalPlaneBasis,
   solveKepler,
 } from '../astronomy/orbital-mechanics';
 
-function calculateMinorPlanetHeliocentric(
-  mp: MinorPlanetData,
-  julianDate: number
-): { x: number; y: number; z: number; r: number } {
+type HeliocentricPropagator = (julianDate: number) => {
+  x: number;
+  y: number;
+  z: number;
+  r: number;
+};
+
+/**
+ * Build a heliocentric ecliptic propagator for a minor planet. The orbital
+ * plane, mean motion and anomaly factors depend only on the elements, so they
+ * are evaluated once and each sample only solves Kepler's equation.
+ */
+function createMinorPlanetPropagator(mp: MinorPlanetData): HeliocentricPropagator {
   const {
     semiMajorAxis: a,
     eccentricity: e,
@@ -22,52 +32,75 @@ function calculateMinorPlanetHeliocentric(
     meanAnomalyAtEpoch: M0,
     epochJD,
   } = mp;
-  const iRad = (i * Math.PI) / 180;
-  const OmegaRad = (Omega * Math.PI) / 180;
-  const omegaRad = (omega * Math.PI) / 180;
+  const { px, py, pz, qx, qy, qz } = orbitalPlaneBasis(
+    (omega * Math.PI) / 180,
+    (Omega * Math.PI) / 180,
+    (i * Math.PI) / 180
+  );
   const M0Rad = (M0 * Math.PI) / 180;
   const n = meanMotion(a);
-  let meanAnomaly = M0Rad + n * (julianDate - epochJD);
-  meanAnomaly %= 2 * Math.PI;
-  if (meanAnomaly < 0) meanAnomaly += 2 * Math.PI;
+  const sqrtOnePlusE = Math.sqrt(1 + e);
+  const sqrtOneMinusE = Math.sqrt(1 - e);
 
-  const eccentricAnomaly = solveKepler(meanAnomaly, e);
-  const trueAnomaly =
-    2 *
-    Math.atan2(
-      Math.sqrt(1 + e) * Math.sin(eccentricAnomaly / 2),
-      Math.sqrt(1 - e) * Math.cos(eccentricAnomaly / 2)
-    );
-  const r = a * (1 - e * Math.cos(eccentricAnomaly));
-  const position = orbitalToEcliptic(
-    r * Math.cos(trueAnomaly),
-    r * Math.sin(trueAnomaly),
-    omegaRad,
-    OmegaRad,
-    iRad
-  );
-  return { ...position, r };
+  return julianDate => {
+    let meanAnomaly = M0Rad + n * (julianDate - epochJD);
+    meanAnomaly %= 2 * Math.PI;
+    if (meanAnomaly < 0) meanAnomaly += 2 * Math.PI;
+
+    const eccentricAnomaly = solveKepler(meanAnomaly, e);
+    const trueAnomaly =
+      2 *
+      Math.atan2(
+        sqrtOnePlusE * Math.sin(eccentricAnomaly / 2),
+        sqrtOneMinusE * Math.cos(eccentricAnomaly / 2)
+      );
+    const r = a * (1 - e * Math.cos(eccentricAnomaly));
+    const xOrbital = r * Math.cos(trueAnomaly);
+    const yOrbital = r * Math.sin(trueAnomaly);
+    return {
+      x: px * xOrbital + qx * yOrbital,
+      y: py * xOrbital + qy * yOrbital,
+      z: pz * xOrbital + qz * yOrbital,
+      r,
+    };
+  };
+}
+
+/**
+ * Propagators for the bundled minor planets. The element sets are module
+ * constants, so each propagator is built once and shared by every night and
+ * every forecast.
+ */
+const minorPlanetPropagators = new WeakMap<MinorPlanetData, HeliocentricPropagator>();
+
+function getMinorPlanetPropagator(mp: MinorPlanetData): HeliocentricPropagator {
+  let propagate = minorPlanetPropagators.get(mp);
+  if (!propagate) {
+    propagate = createMinorPlanetPropagator(mp);
+    minorPlanetPropagators.set(mp, propagate);
+  }
+  return propagate;
 }
 
 /**
  * Minor planet data structure
  */
 export interface MinorPlanetData {
-  designation: string;
-  name: string;
-  category: 'dwarf_planet' | 'asteroid';
+  readonly designation: string;
+  readonly name: string;
+  readonly category: 'dwarf_planet' | 'asteroid';
   // Orbital elements (J2000 epoch)
-  semiMajorAxis: number; // AU
-  eccentricity: number;
-  inclination: number; // degrees
-  longitudeOfAscendingNode: number; // degrees
-  argumentOfPerihelion: number; // degrees
-  meanAnomalyAtEpoch: number; // degrees
-  epochJD: number; // Julian date of epoch
+  readonly semiMajorAxis: number; // AU
+  readonly eccentricity: number;
+  readonly inclination: number; // degrees
+  readonly longitudeOfAscendingNode: number; // degrees
+  readonly argumentOfPerihelion: number; // degrees
+  readonly meanAnomalyAtEpoch: number; // degrees
+  readonly epochJD: number; // Julian date of epoch
   // Physical properties
-  absoluteMagnitude: number; // H magnitude
-  slopeParameter?: number; // IAU H-G parameter when measured
-  physicalDiameter: number; // km (for apparent size calculation)
+  readonly absoluteMagnitude: number; // H magnitude
+  readonly slopeParameter: number | null; // IAU H-G parameter when measured
+  readonly physicalDiameter: number; // km (for apparent size calculation)
 }
 
 /**
@@ -86,6 +119,7 @@ export const DWARF_PLANETS: MinorPlanetData[] = [
     meanAnomalyAtEpoch: 38.68366347318184,
     epochJD: 2457588.5,
     absoluteMagnitude: -0.7,
+    slopeParameter: null,
     physicalDiameter: 2376,
   },
   {
@@ -115,6 +149,7 @@ export const DWARF_PLANETS: MinorPlanetData[] = [
     meanAnomalyAtEpoch: 211.774434275007,
     epochJD: 2461200.5,
     absoluteMagnitude: -1.2,
+    slopeParameter: null,
     physicalDiameter: 2326,
   },
   {
@@ -129,6 +164,7 @@ export const DWARF_PLANETS: MinorPlanetData[] = [
     meanAnomalyAtEpoch: 169.9379962048232,
     epochJD: 2461200.5,
     absoluteMagnitude: -0.3,
+    slopeParameter: null,
     physicalDiameter: 1430,
   },
   {
@@ -143,6 +179,7 @@ export const DWARF_PLANETS: MinorPlanetData[] = [
     meanAnomalyAtEpoch: 223.2104118812299,
     epochJD: 2461200.5,
     absoluteMagnitude: 0.2,
+    slopeParameter: null,
     physicalDiameter: 1632,
   },
 ];
@@ -208,6 +245,7 @@ export const NOTABLE_ASTEROIDS: MinorPlanetData[] = [
     meanAnomalyAtEpoch: 252.0344242359649,
     epochJD: 2461200.5,
     absoluteMagnitude: 5.43,
+    slopeParameter: null,
     physicalDiameter: 434,
   },
 ];
@@ -235,13 +273,10 @@ export function calculateMinorPlanetPosition(
     };
   }
 
-  const equator = lightTimeCorrectedEquatorial(
-    sampleJD => calculateMinorPlanetHeliocentric(mp, sampleJD),
-    julianDate
-  );
-  const emittedPosition = calculateMinorPlanetHeliocentric(mp, equator.emissionJulianDate);
+  const propagate = getMinorPlanetPropagator(mp);
+  const equator = lightTimeCorrectedEquatorial(propagate, julianDate);
   return {
-    ...emittedPosition,
+    ...equator.emittedPosition,
     earthDist: equator.distance,
     ra: equator.ra,
     dec: equator.dec,
@@ -297,10 +332,8 @@ export function calculateMinorPlanetVisibility(
   maxMagnitude: number = 12.0
 ): ObjectVisibility | null {
   // Get Julian date for midnight
-  const midnight = new Date(
-    (nightInfo.observingWindowStart.getTime() + nightInfo.observingWindowEnd.getTime()) / 2
-  );
-  const jd = midnight.getTime() / 86400000 + 2440587.5;
+  const midnight = calculator.getNightMidpoint(nightInfo);
+  const jd = midnight.date.getTime() / 86400000 + 2440587.5;
 
   // Calculate position
   const pos = calculateMinorPlanetPosition(mp, jd);
@@ -316,7 +349,7 @@ export function calculateMinorPlanetVisibility(
   }
 
   // Calculate apparent magnitude
-  const earthSunDistance = Astronomy.HelioDistance(Astronomy.Body.Earth, midnight);
+  const earthSunDistance = getEarthSunDistance(jd);
   const cosPhase = Math.max(
     -1,
     Math.min(
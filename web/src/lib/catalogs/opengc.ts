@@ -1,34 +1,36 @@
 import type { DSOCatalogEntry, DSOSubtype } from '@/types';
 import { CACHE_KEYS, CACHE_TTLS, getCached, setCache } from '../utils/cache';
+import { forEachResponseLine } from '../utils/response-lines';
 import { getCommonName, MESSIER_EXTRAS } from './common-names';
 
 const OPENGC_URL =
   'https://raw.githubusercontent.com/mattiaverga/OpenNGC/master/database_files/NGC.csv';
 
+/** OpenNGC type codes and their DSOSubtype, built once for the whole catalog. */
+const OPENGC_SUBTYPES: Record<string, DSOSubtype> = {
+  G: 'galaxy',
+  GGroup: 'galaxy_group',
+  GPair: 'galaxy_pair',
+  GTrpl: 'galaxy_triplet',
+  PN: 'planetary_nebula',
+  HII: 'hii_region',
+  EmN: 'emission_nebula',
+  RfN: 'reflection_nebula',
+  SNR: 'supernova_remnant',
+  OCl: 'open_cluster',
+  GCl: 'globular_cluster',
+  Ast: 'asterism',
+  DN: 'dark_nebula',
+  'Cl+N': 'cluster_nebula', // Cluster with nebulosity (e.g., M42 Orion Nebula)
+  Neb: 'nebula',
+  Other: 'other',
+};
+
 /**
  * Map OpenNGC type codes to DSOSubtype
  */
 function mapTypeToSubtype(type: string): DSOSubtype {
-  const mapping: Record<string, DSOSubtype> = {
-    G: 'galaxy',
-    GGroup: 'galaxy_group',
-    GPair: 'galaxy_pair',
-    GTrpl: 'galaxy_triplet',
-    PN: 'planetary_nebula',
-    HII: 'hii_region',
-    EmN: 'emission_nebula',
-    RfN: 'reflection_nebula',
-    SNR: 'supernova_remnant',
-    OCl: 'open_cluster',
-    GCl: 'globular_cluster',
-    Ast: 'asterism',
-    DN: 'dark_nebula',
-    'Cl+N': 'cluster_nebula', // Cluster with nebulosity (e.g., M42 Orion Nebula)
-    Neb: 'nebula',
-    Other: 'other',
-  };
-
-  return mapping[type] || 'other';
+  return OPENGC_SUBTYPES[type] || 'other';
 }
 
 /**
@@ -87,19 +89,123 @@ function parseCSVLine(line: string): string[] {
   return result;
 }
 
+/** OpenNGC types that are not deep-sky objects. */
+const SKIP_TYPES = new Set(['NonEx', 'Dup', '*', '**', '*Ass', 'Nova']);
+
 /**
- * Load and parse the OpenNGC catalog
+ * Parse one OpenNGC CSV row, or null for non-DSO types and rows without
+ * usable coordinates
  */
 // biome-ignore lint/complexity/noExcessiveCognitiveComplexity: CSV parsing requires handling multiple field types and validation
+function parseCatalogRow(fields: string[], cols: Record<string, number>): DSOCatalogEntry | null {
+  // Reject non-DSO types before reading the remaining columns
+  const type = fields[cols.Type] || '';
+  if (SKIP_TYPES.has(type)) return null;
+
+  const name = fields[cols.Name] || '';
+  const raStr = fields[cols.RA] || '';
+  const decStr = fields[cols.Dec] || '';
+  const vMag = fields[cols['V-Mag']] || '';
+  const bMag = fields[cols['B-Mag']] || '';
+  const majorAx = fields[cols.MajAx] || '';
+  const minorAx = fields[cols.MinAx] || '';
+  const constellation = fields[cols.Const] || '';
+  const messier = fields[cols.M] || '';
+
+  // Parse coordinates
+  const raHours = parseRA(raStr);
+  const decDegrees = parseDec(decStr);
+  if (raHours === null || decDegrees === null) return null;
+
+  // Parse magnitude (prefer V-Mag, fall back to B-Mag)
+  let magnitude: number | null = null;
+  if (vMag && !Number.isNaN(parseFloat(vMag))) {
+    magnitude = parseFloat(vMag);
+  } else if (bMag && !Number.isNaN(parseFloat(bMag))) {
+    magnitude = parseFloat(bMag);
+  }
+
+  // Parse angular size
+  const majorAxisArcmin =
+    majorAx && !Number.isNaN(parseFloat(majorAx)) ? parseFloat(majorAx) : null;
+  const minorAxisArcmin =
+    minorAx && !Number.isNaN(parseFloat(minorAx)) ? parseFloat(minorAx) : null;
+
+  // Get Messier number
+  const messierNumber = messier?.match(/\d+/) ? parseInt(messier, 10) : null;
+
+  // Get common name from CSV first, then fall back to hardcoded dictionary
+  const csvCommonName = fields[cols['Common names']] || '';
+  const commonName = getCommonName(name) || csvCommonName || null;
+
+  // Calculate surface brightness if possible
+  let surfaceBrightness: number | null = null;
+  if (magnitude !== null && majorAxisArcmin !== null && majorAxisArcmin > 0) {
+    const minorAx = minorAxisArcmin || majorAxisArcmin;
+    const areaArcsec2 = Math.PI * ((majorAxisArcmin * 60) / 2) * ((minorAx * 60) / 2);
+    surfaceBrightness = magnitude + 2.5 * Math.log10(areaArcsec2);
+  }
+
+  return {
+    name,
+    type: mapTypeToSubtype(type),
+    raHours,
+    decDegrees,
+    magnitude,
+    majorAxisArcmin,
+    minorAxisArcmin,
+    constellation,
+    messierNumber,
+    commonName,
+    surfaceBrightness,
+  };
+}
+
+/**
+ * Entries with valid coordinates, plus the columns the per-call filter reads,
+ * so each filter scans typed arrays rather than the entry objects. Filtered
+ * subsets are kept by filter key, so repeat forecasts for the same location
+ * and settings get the same list back; only the most recent few are kept.
+ */
+interface IndexedCatalog {
+  entries: DSOCatalogEntry[];
+  magnitude: Float64Array; // NaN when unknown
+  decDegrees: Float64Array;
+  subsets: Map<string, readonly DSOCatalogEntry[]>;
+}
+
+/** Filtered subsets kept per catalog, one per recent location and settings. */
+const MAX_CATALOG_SUBSETS = 4;
+
+/**
+ * Parsed catalog kept for the session, so later forecasts and searches skip
+ * the IndexedDB read and structured clone of every entry. Expires with the
+ * same TTL as the persisted cache.
+ */
+let loadedCatalog: { catalog: IndexedCatalog; loadedAt: number } | null = null;
+
+function rememberCatalog(catalog: DSOCatalogEntry[]): IndexedCatalog {
+  const indexed = indexCatalog(catalog);
+  loadedCatalog = { catalog: indexed, loadedAt: Date.now() };
+  return indexed;
+}
+
+/**
+ * Load and parse the OpenNGC catalog
+ */
 export async function loadOpenNGCCatalog(
   options: { maxMagnitude?: number; observerLatitude?: number; minAltitude?: number } = {}
-): Promise<DSOCatalogEntry[]> {
+): Promise<readonly DSOCatalogEntry[]> {
   const { maxMagnitude = 14.0, observerLatitude, minAltitude = 30 } = options;
 
+  if (loadedCatalog && Date.now() - loadedCatalog.loadedAt <= CACHE_TTLS.OPENGC) {
+    return filterCatalog(loadedCatalog.catalog, maxMagnitude, observerLatitude, minAltitude);
+  }
+
   // Check cache first
   const cached = await getCached<DSOCatalogEntry[]>(CACHE_KEYS.OPENGC, CACHE_TTLS.OPENGC);
   if (cached) {
-    return filterCatalog(cached, maxMagnitude, observerLatitude, minAltitude);
+    return filterCatalog(rememberCatalog(cached), maxMagnitude, observerLatitude, minAltitude);
   }
 
   // Fetch from URL
@@ -108,89 +214,24 @@ export async function loadOpenNGCCatalog(
     throw new Error(`Failed to fetch OpenNGC catalog: ${response.status}`);
   }
 
-  const text = await response.text();
-  const lines = text.split('\n');
-
-  // Parse header to find column indices
-  const header = parseCSVLine(lines[0]);
-  const cols: Record<string, number> = {};
-  header.forEach((col, i) => {
-    cols[col] = i;
-  });
-
+  // The header row maps column names to indices; every later row is parsed
+  // as it streams in, so the CSV text is never held whole.
+  let cols: Record<string, number> | null = null;
   const catalog: DSOCatalogEntry[] = [];
-
-  // Skip types that aren't DSOs
-  const skipTypes = new Set(['NonEx', 'Dup', '*', '**', '*Ass', 'Nova']);
-
-  for (let i = 1; i < lines.length; i++) {
-    const line = lines[i].trim();
-    if (!line) continue;
+  await forEachResponseLine(response, rawLine => {
+    const line = rawLine.trim();
+    if (!line) return;
 
     const fields = parseCSVLine(line);
-
-    const name = fields[cols.Name] || '';
-    const type = fields[cols.Type] || '';
-    const raStr = fields[cols.RA] || '';
-    const decStr = fields[cols.Dec] || '';
-    const vMag = fields[cols['V-Mag']] || '';
-    const bMag = fields[cols['B-Mag']] || '';
-    const majorAx = fields[cols.MajAx] || '';
-    const minorAx = fields[cols.MinAx] || '';
-    const constellation = fields[cols.Const] || '';
-    const messier = fields[cols.M] || '';
-
-    // Skip non-DSO types
-    if (skipTypes.has(type)) continue;
-
-    // Parse coordinates
-    const raHours = parseRA(raStr);
-    const decDegrees = parseDec(decStr);
-    if (raHours === null || decDegrees === null) continue;
-
-    // Parse magnitude (prefer V-Mag, fall back to B-Mag)
-    let magnitude: number | null = null;
-    if (vMag && !Number.isNaN(parseFloat(vMag))) {
-      magnitude = parseFloat(vMag);
-    } else if (bMag && !Number.isNaN(parseFloat(bMag))) {
-      magnitude = parseFloat(bMag);
-    }
-
-    // Parse angular size
-    const majorAxisArcmin =
-      majorAx && !Number.isNaN(parseFloat(majorAx)) ? parseFloat(majorAx) : null;
-    const minorAxisArcmin =
-      minorAx && !Number.isNaN(parseFloat(minorAx)) ? parseFloat(minorAx) : null;
-
-    // Get Messier number
-    const messierNumber = messier?.match(/\d+/) ? parseInt(messier, 10) : null;
-
-    // Get common name from CSV first, then fall back to hardcoded dictionary
-    const csvCommonName = fields[cols['Common names']] || '';
-    const commonName = getCommonName(name) || csvCommonName || null;
-
-    // Calculate surface brightness if possible
-    let surfaceBrightness: number | null = null;
-    if (magnitude !== null && majorAxisArcmin !== null && majorAxisArcmin > 0) {
-      const minorAx = minorAxisArcmin || majorAxisArcmin;
-      const areaArcsec2 = Math.PI * ((majorAxisArcmin * 60) / 2) * ((minorAx * 60) / 2);
-      surfaceBrightness = magnitude + 2.5 * Math.log10(areaArcsec2);
+    if (!cols) {
+      cols = {};
+      for (const [i, col] of fields.entries()) cols[col] = i;
+      return;
     }
 
-    catalog.push({
-      name,
-      type: mapTypeToSubtype(type),
-      raHours,
-      decDegrees,
-      magnitude,
-      majorAxisArcmin,
-      minorAxisArcmin,
-      constellation,
-      messierNumber,
-      commonName,
-      surfaceBrightness,
-    });
-  }
+    const entry = parseCatalogRow(fields, cols);
+    if (entry) catalog.push(entry);
+  });
 
   // Add Messier objects not in NGC/IC
   for (const extra of MESSIER_EXTRAS) {
@@ -212,47 +253,92 @@ export async function loadOpenNGCCatalog(
   // Cache the full catalog
   await setCache(CACHE_KEYS.OPENGC, catalog);
 
-  return filterCatalog(catalog, maxMagnitude, observerLatitude, minAltitude);
+  return filterCatalog(rememberCatalog(catalog), maxMagnitude, observerLatitude, minAltitude);
+}
+
+/**
+ * Point every entry's subtype and constellation at one shared string per
+ * distinct value. The CSV parser and the IndexedDB structured clone both
+ * produce a fresh copy of these short codes for each of the ~13k entries.
+ */
+function internRepeatedStrings(entries: DSOCatalogEntry[]): void {
+  const pool = new Map<string, string>();
+  const intern = <T extends string>(value: T): T => {
+    const shared = pool.get(value);
+    if (shared !== undefined) return shared as T;
+    pool.set(value, value);
+    return value;
+  };
+  for (const entry of entries) {
+    entry.type = intern(entry.type);
+    entry.constellation = intern(entry.constellation);
+  }
+}
+
+/**
+ * Drop entries with invalid coordinates and build the typed magnitude/declination columns
+ */
+function indexCatalog(catalog: DSOCatalogEntry[]): IndexedCatalog {
+  // Cached or upstream catalog rows must never be allowed to feed NaN or
+  // out-of-range coordinates into the ephemeris engine.
+  const entries = catalog.filter(
+    entry =>
+      Number.isFinite(entry.raHours) &&
+      Number.isFinite(entry.decDegrees) &&
+      entry.raHours >= 0 &&
+      entry.raHours < 24 &&
+      entry.decDegrees >= -90 &&
+      entry.decDegrees <= 90
+  );
+  internRepeatedStrings(entries);
+  return {
+    entries,
+    magnitude: Float64Array.from(entries, entry => entry.magnitude ?? Number.NaN),
+    decDegrees: Float64Array.from(entries, entry => entry.decDegrees),
+    subsets: new Map(),
+  };
 }
 
 /**
  * Filter catalog based on magnitude and visibility from observer location
  */
 function filterCatalog(
-  catalog: DSOCatalogEntry[],
+  catalog: IndexedCatalog,
   maxMagnitude: number,
   observerLatitude?: number,
   minAltitude: number = 30
-): DSOCatalogEntry[] {
-  return catalog.filter(entry => {
-    // Cached or upstream catalog rows must never be allowed to feed NaN or
-    // out-of-range coordinates into the ephemeris engine.
-    if (
-      !Number.isFinite(entry.raHours) ||
-      !Number.isFinite(entry.decDegrees) ||
-      entry.raHours < 0 ||
-      entry.raHours >= 24 ||
-      entry.decDegrees < -90 ||
-      entry.decDegrees > 90
-    ) {
-      return false;
-    }
+): readonly DSOCatalogEntry[] {
+  const key = `${maxMagnitude}|${observerLatitude}|${minAltitude}`;
+  const subset = catalog.subsets.get(key);
+  if (subset) {
+    // Refresh recency by re-inserting at the end of the map's order.
+    catalog.subsets.delete(key);
+    catalog.subsets.set(key, subset);
+    return subset;
+  }
 
-    // Magnitude filter (allow null to pass for very extended objects)
-    if (entry.magnitude !== null && entry.magnitude > maxMagnitude) {
-      return false;
-    }
+  const { entries, magnitude, decDegrees } = catalog;
+  const filtered: DSOCatalogEntry[] = [];
+  for (let index = 0; index < entries.length; index++) {
+    // Magnitude filter (unknown magnitudes are NaN and pass, for very
+    // extended objects)
+    if (magnitude[index] > maxMagnitude) continue;
 
-    // Declination filter based on observer latitude
-    if (observerLatitude !== undefined) {
-      // Object must be able to reach minAltitude from observer location
-      // Max altitude = 90 - |latitude - declination|
-      const maxPossibleAlt = 90 - Math.abs(observerLatitude - entry.decDegrees);
-      if (maxPossibleAlt < minAltitude) {
-        return false;
-      }
+    // Declination filter based on observer latitude: the object must be able
+    // to reach minAltitude, where max altitude = 90 - |latitude - declination|
+    if (
+      observerLatitude !== undefined &&
+      90 - Math.abs(observerLatitude - decDegrees[index]) < minAltitude
+    ) {
+      continue;
     }
 
-    return true;
-  });
+    filtered.push(entries[index]);
+  }
+  catalog.subsets.set(key, filtered);
+  if (catalog.subsets.size > MAX_CATALOG_SUBSETS) {
+    const oldestKey = catalog.subsets.keys().next().value;
+    if (oldestKey !== undefined) catalog.subsets.delete(oldestKey);
+  }
+  return filtered;
 }
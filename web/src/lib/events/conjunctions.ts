@@ -3,19 +3,29 @@ import type { Conjunction, NightInfo, ObjectVisibility } from '@/types';
 import { angularSeparation } from '../astronomy/calculator';
 
 const CONJUNCTION_THRESHOLD = 10;
+const NOTABLE_SEPARATION = 5;
 const SAMPLE_STEP_MS = 10 * 60 * 1000;
 
+/**
+ * Pairs whose closest grid sample is wider than the threshold plus this slack
+ * cannot close the gap between samples (the Moon, the fastest body, moves
+ * well under a degree per step), so they are rejected before refinement.
+ */
+const COARSE_SLACK_DEG = 1;
+const COARSE_REJECT_COSINE = Math.cos(((CONJUNCTION_THRESHOLD + COARSE_SLACK_DEG) * Math.PI) / 180);
+
+const PLANET_BODIES: Record<string, Astronomy.Body> = {
+  Mercury: Astronomy.Body.Mercury,
+  Venus: Astronomy.Body.Venus,
+  Mars: Astronomy.Body.Mars,
+  Jupiter: Astronomy.Body.Jupiter,
+  Saturn: Astronomy.Body.Saturn,
+  Uranus: Astronomy.Body.Uranus,
+  Neptune: Astronomy.Body.Neptune,
+};
+
 function getPlanetBody(name: string): Astronomy.Body | null {
-  const bodyMap: Record<string, Astronomy.Body> = {
-    Mercury: Astronomy.Body.Mercury,
-    Venus: Astronomy.Body.Venus,
-    Mars: Astronomy.Body.Mars,
-    Jupiter: Astronomy.Body.Jupiter,
-    Saturn: Astronomy.Body.Saturn,
-    Uranus: Astronomy.Body.Uranus,
-    Neptune: Astronomy.Body.Neptune,
-  };
-  return bodyMap[name] ?? null;
+  return PLANET_BODIES[name] ?? null;
 }
 
 function separationAt(
@@ -24,87 +34,238 @@ function separationAt(
   observer: Astronomy.Observer,
   timeMs: number
 ): number {
-  const time = new Date(timeMs);
+  const time = Astronomy.MakeTime(new Date(timeMs));
   const first = Astronomy.Equator(body1, time, observer, true, true);
   const second = Astronomy.Equator(body2, time, observer, true, true);
   return angularSeparation(first.ra * 15, first.dec, second.ra * 15, second.dec);
 }
 
-function altitudeAt(body: Astronomy.Body, observer: Astronomy.Observer, time: Date): number {
-  const equator = Astronomy.Equator(body, time, observer, true, true);
+function altitudeOf(
+  equator: Astronomy.EquatorialCoordinates,
+  observer: Astronomy.Observer,
+  time: Date
+): number {
   return Astronomy.Horizon(time, observer, equator.ra, equator.dec, 'normal').altitude;
 }
 
-/** Numerically minimize true topocentric angular separation during the observing interval. */
-export function findClosestApproach(
-  body1: Astronomy.Body,
-  body2: Astronomy.Body,
-  observer: Astronomy.Observer,
-  start: Date,
-  end: Date
-): { time: Date; separation: number } {
-  const startMs = start.getTime();
-  const endMs = end.getTime();
-  let bestMs = startMs;
-  let bestSeparation = separationAt(body1, body2, observer, startMs);
+/**
+ * Topocentric equatorial unit vectors of one body on the coarse search grid,
+ * packed as x, y, z per sample.
+ */
+interface BodyTrack {
+  body: Astronomy.Body;
+  directions: Float64Array;
+}
 
+function coarseSampleTimes(startMs: number, endMs: number): number[] {
+  const times = [startMs];
   for (let time = startMs + SAMPLE_STEP_MS; time <= endMs; time += SAMPLE_STEP_MS) {
-    const separation = separationAt(body1, body2, observer, time);
-    if (separation < bestSeparation) {
-      bestSeparation = separation;
-      bestMs = time;
+    times.push(time);
+  }
+  return times;
+}
+
+/**
+ * Sample every body once on the coarse grid. Each body takes part in several
+ * pairs, so sampling per body rather than per pair keeps the ephemeris work
+ * linear in the number of bodies.
+ */
+function sampleBodyTracks(
+  bodies: Astronomy.Body[],
+  observer: Astronomy.Observer,
+  timesMs: number[]
+): BodyTrack[] {
+  const tracks = bodies.map(body => ({ body, directions: new Float64Array(timesMs.length * 3) }));
+  for (const [index, timeMs] of timesMs.entries()) {
+    const time = Astronomy.MakeTime(new Date(timeMs));
+    for (const { body, directions } of tracks) {
+      const { vec } = Astronomy.Equator(body, time, observer, true, true);
+      const length = Math.hypot(vec.x, vec.y, vec.z);
+      directions[index * 3] = vec.x / length;
+      directions[index * 3 + 1] = vec.y / length;
+      directions[index * 3 + 2] = vec.z / length;
+    }
+  }
+  return tracks;
+}
+
+/** Closest approach together with both bodies' positions at that instant. */
+interface ClosestApproach {
+  time: Date;
+  separation: number;
+  firstEquator: Astronomy.EquatorialCoordinates;
+  secondEquator: Astronomy.EquatorialCoordinates;
+}
+
+/**
+ * Grid sample where two tracks come closest. The smallest separation is the
+ * largest dot product of the unit vectors, so the scan needs no trigonometry.
+ */
+function coarseClosestSample(
+  first: BodyTrack,
+  second: BodyTrack,
+  sampleCount: number
+): { index: number; cosine: number } {
+  const a = first.directions;
+  const b = second.directions;
+  let bestIndex = 0;
+  let bestCosine = Number.NEGATIVE_INFINITY;
+  for (let index = 0; index < sampleCount; index++) {
+    const offset = index * 3;
+    const cosine =
+      a[offset] * b[offset] + a[offset + 1] * b[offset + 1] + a[offset + 2] * b[offset + 2];
+    if (cosine > bestCosine) {
+      bestCosine = cosine;
+      bestIndex = index;
     }
   }
+  return { index: bestIndex, cosine: bestCosine };
+}
 
+/**
+ * Refine the coarse minimum of two sampled tracks with a golden-section
+ * search. Each step keeps one interior point from the previous step, so only
+ * one new pair of positions is evaluated per iteration.
+ */
+function refineClosestApproach(
+  first: BodyTrack,
+  second: BodyTrack,
+  observer: Astronomy.Observer,
+  timesMs: number[],
+  endMs: number,
+  bestIndex: number
+): ClosestApproach {
+  const startMs = timesMs[0];
+  const bestMs = timesMs[bestIndex];
+  const body1 = first.body;
+  const body2 = second.body;
   let low = Math.max(startMs, bestMs - SAMPLE_STEP_MS);
   let high = Math.min(endMs, bestMs + SAMPLE_STEP_MS);
   const ratio = (Math.sqrt(5) - 1) / 2;
+  let left = high - ratio * (high - low);
+  let right = low + ratio * (high - low);
+  let leftSeparation = separationAt(body1, body2, observer, left);
+  let rightSeparation = separationAt(body1, body2, observer, right);
 
   for (let iteration = 0; iteration < 32 && high - low > 1000; iteration++) {
-    const left = high - ratio * (high - low);
-    const right = low + ratio * (high - low);
-    if (separationAt(body1, body2, observer, left) <= separationAt(body1, body2, observer, right)) {
+    if (leftSeparation <= rightSeparation) {
       high = right;
+      right = left;
+      rightSeparation = leftSeparation;
+      left = high - ratio * (high - low);
+      leftSeparation = separationAt(body1, body2, observer, left);
     } else {
       low = left;
+      left = right;
+      leftSeparation = rightSeparation;
+      right = low + ratio * (high - low);
+      rightSeparation = separationAt(body1, body2, observer, right);
     }
   }
 
   const time = new Date((low + high) / 2);
-  return { time, separation: separationAt(body1, body2, observer, time.getTime()) };
+  const astroTime = Astronomy.MakeTime(time);
+  const firstEquator = Astronomy.Equator(body1, astroTime, observer, true, true);
+  const secondEquator = Astronomy.Equator(body2, astroTime, observer, true, true);
+  return {
+    time,
+    separation: angularSeparation(
+      firstEquator.ra * 15,
+      firstEquator.dec,
+      secondEquator.ra * 15,
+      secondEquator.dec
+    ),
+    firstEquator,
+    secondEquator,
+  };
 }
 
-function buildConjunction(
-  object1Name: string,
-  object2Name: string,
+/** Numerically minimize true topocentric angular separation during the observing interval. */
+export function findClosestApproach(
   body1: Astronomy.Body,
   body2: Astronomy.Body,
   observer: Astronomy.Observer,
+  start: Date,
+  end: Date
+): { time: Date; separation: number } {
+  const endMs = end.getTime();
+  const timesMs = coarseSampleTimes(start.getTime(), endMs);
+  const [first, second] = sampleBodyTracks([body1, body2], observer, timesMs);
+  const { index } = coarseClosestSample(first, second, timesMs.length);
+  const { time, separation } = refineClosestApproach(
+    first,
+    second,
+    observer,
+    timesMs,
+    endMs,
+    index
+  );
+  return { time, separation };
+}
+
+/**
+ * Numeric result for one accepted pair. Descriptions are formatted only once
+ * the ordered list is final.
+ */
+type ConjunctionCandidate = Pick<
+  Conjunction,
+  'object1Name' | 'object2Name' | 'separationDegrees' | 'time'
+>;
+
+function findConjunction(
+  object1Name: string,
+  object2Name: string,
+  first: BodyTrack,
+  second: BodyTrack,
+  observer: Astronomy.Observer,
+  timesMs: number[],
   nightInfo: NightInfo
-): Conjunction | null {
-  const closest = findClosestApproach(
-    body1,
-    body2,
+): ConjunctionCandidate | null {
+  const coarse = coarseClosestSample(first, second, timesMs.length);
+  if (coarse.cosine < COARSE_REJECT_COSINE) return null;
+
+  const closest = refineClosestApproach(
+    first,
+    second,
     observer,
-    nightInfo.observingWindowStart,
-    nightInfo.observingWindowEnd
+    timesMs,
+    nightInfo.observingWindowEnd.getTime(),
+    coarse.index
   );
 
   if (
     closest.separation >= CONJUNCTION_THRESHOLD ||
-    altitudeAt(body1, observer, closest.time) <= 0 ||
-    altitudeAt(body2, observer, closest.time) <= 0
+    altitudeOf(closest.firstEquator, observer, closest.time) <= 0 ||
+    altitudeOf(closest.secondEquator, observer, closest.time) <= 0
   ) {
     return null;
   }
 
+  return { object1Name, object2Name, separationDegrees: closest.separation, time: closest.time };
+}
+
+/**
+ * Insert a candidate keeping the list in ascending separation order, with
+ * equal separations left in detection order. A night yields only a handful
+ * of conjunctions, so ordering them as they are found replaces a final sort.
+ */
+function insertBySeparation(
+  candidates: ConjunctionCandidate[],
+  candidate: ConjunctionCandidate
+): void {
+  let index = candidates.length;
+  while (index > 0 && candidates[index - 1].separationDegrees > candidate.separationDegrees) {
+    index--;
+  }
+  candidates.splice(index, 0, candidate);
+}
+
+function toConjunction(candidate: ConjunctionCandidate): Conjunction {
+  const { object1Name, object2Name, separationDegrees } = candidate;
   return {
-    object1Name,
-    object2Name,
-    separationDegrees: closest.separation,
-    time: closest.time,
-    description: getConjunctionDescription(object1Name, object2Name, closest.separation),
-    isNotable: closest.separation < 5,
+    ...candidate,
+    description: getConjunctionDescription(object1Name, object2Name, separationDegrees),
+    isNotable: separationDegrees < NOTABLE_SEPARATION,
   };
 }
 
@@ -119,35 +280,49 @@ export function detectConjunctions(
     .filter(planet => planet.maxAltitude >= 15)
     .map(planet => ({ name: planet.objectName, body: getPlanetBody(planet.objectName) }))
     .filter((planet): planet is { name: string; body: Astronomy.Body } => planet.body !== null);
-  const conjunctions: Conjunction[] = [];
+  if (planets.length === 0) return [];
+
+  const timesMs = coarseSampleTimes(
+    nightInfo.observingWindowStart.getTime(),
+    nightInfo.observingWindowEnd.getTime()
+  );
+  const tracks = sampleBodyTracks(
+    [...planets.map(planet => planet.body), Astronomy.Body.Moon],
+    observer,
+    timesMs
+  );
+  const moonTrack = tracks[planets.length];
+  const candidates: ConjunctionCandidate[] = [];
 
   for (let first = 0; first < planets.length; first++) {
     for (let second = first + 1; second < planets.length; second++) {
-      const conjunction = buildConjunction(
+      const candidate = findConjunction(
         planets[first].name,
         planets[second].name,
-        planets[first].body,
-        planets[second].body,
+        tracks[first],
+        tracks[second],
         observer,
+        timesMs,
         nightInfo
       );
-      if (conjunction) conjunctions.push(conjunction);
+      if (candidate) insertBySeparation(candidates, candidate);
     }
   }
 
-  for (const planet of planets) {
-    const conjunction = buildConjunction(
+  for (const [index, planet] of planets.entries()) {
+    const candidate = findConjunction(
       planet.name,
       'Moon',
-      planet.body,
-      Astronomy.Body.Moon,
+      tracks[index],
+      moonTrack,
       observer,
+      timesMs,
       nightInfo
     );
-    if (conjunction) conjunctions.push(conjunction);
+    if (candidate) insertBySeparation(candidates, candidate);
   }
 
-  return conjunctions.sort((a, b) => a.separationDegrees - b.separationDegrees);
+  return candidates.map(toConjunction);
 }
 
 function getConjunctionDescription(object1: string, object2: string, separation: number): string {
@@ -155,6 +330,6 @@ function getConjunctionDescription(object1: string, object2: string, separation:
   if (separation < 2) {
     return `Close conjunction: ${object1} and ${object2} only ${sepStr} degrees apart!`;
   }
-  if (separation < 5) return `${object1} near ${object2} (${sepStr} degrees)`;
+  if (separation < NOTABLE_SEPARATION) return `${object1} near ${object2} (${sepStr} degrees)`;
   return `${object1} and ${object2} within ${sepStr} degrees`;
 }
@@ -217,35 +217,116 @@ function getActivityOffsets(shower: (typeof METEOR_SHOWERS)[0]): {
   return { start: start - peak, end: end - peak };
 }
 
-function getShowerTiming(
-  shower: (typeof IAU_METEOR_SHOWERS)[number],
-  date: Date
-): { isActive: boolean; daysFromPeak: number; peakTime: Date } {
-  const candidatePeaks: Date[] = [];
-  const year = date.getUTCFullYear();
-  for (let candidateYear = year - 1; candidateYear <= year + 1; candidateYear++) {
-    const peak = Astronomy.SearchSunLongitude(
+/** Activity window of each catalog shower, in days relative to its peak. */
+const SHOWER_ACTIVITY_OFFSETS = IAU_METEOR_SHOWERS.map(getActivityOffsets);
+
+const IAU_SHOWERS_BY_CODE = new Map(IAU_METEOR_SHOWERS.map(shower => [shower.code, shower]));
+
+/**
+ * Solar-longitude peak times (ms, NaN when the search fails) keyed by
+ * `${longitude}:${year}`. A peak depends only on the shower's solar longitude
+ * and the year, so adjacent years' tables share the same root searches.
+ */
+const solarLongitudePeaks = new Map<string, number>();
+
+function getSolarLongitudePeak(solarLongitude: number, year: number): number {
+  const key = `${solarLongitude}:${year}`;
+  let peak = solarLongitudePeaks.get(key);
+  if (peak === undefined) {
+    const yearStart = new Date(Date.UTC(year, 0, 1));
+    const event = Astronomy.SearchSunLongitude(solarLongitude, yearStart, 370);
+    peak = event ? event.date.getTime() : Number.NaN;
+    solarLongitudePeaks.set(key, peak);
+  }
+  return peak;
+}
+
+/** Candidate peaks per shower: calendar fallback, then previous/same/next year. */
+const PEAK_CANDIDATES = 4;
+
+/**
+ * Candidate peak times (ms) of every catalog shower for nights in a given
+ * year, laid out PEAK_CANDIDATES per shower. A shower's entries stay NaN until
+ * a night near its calendar window first needs them, so the solar-longitude
+ * searches run only for showers that can be active in the forecast.
+ */
+const showerPeakTables = new Map<number, Float64Array>();
+
+function getShowerPeakTable(year: number): Float64Array {
+  let table = showerPeakTables.get(year);
+  if (!table) {
+    table = new Float64Array(IAU_METEOR_SHOWERS.length * PEAK_CANDIDATES).fill(Number.NaN);
+    showerPeakTables.set(year, table);
+  }
+  return table;
+}
+
+function fillShowerPeaks(table: Float64Array, index: number, year: number): void {
+  const shower = IAU_METEOR_SHOWERS[index];
+  const offset = index * PEAK_CANDIDATES;
+  table[offset] = Date.UTC(year, shower.peakMonth - 1, shower.peakDay, 12);
+  for (let candidate = 1; candidate < PEAK_CANDIDATES; candidate++) {
+    table[offset + candidate] = getSolarLongitudePeak(
       shower.solarLongitudePeak,
-      new Date(Date.UTC(candidateYear, 0, 1)),
-      370
+      year - 2 + candidate
     );
-    if (peak) candidatePeaks.push(peak.date);
   }
-  const fallbackPeak = new Date(Date.UTC(year, shower.peakMonth - 1, shower.peakDay, 12));
-  const peakTime = candidatePeaks.reduce(
-    (closest, candidate) =>
-      Math.abs(candidate.getTime() - date.getTime()) < Math.abs(closest.getTime() - date.getTime())
-        ? candidate
-        : closest,
-    fallbackPeak
-  );
-  const daysFromPeak = (date.getTime() - peakTime.getTime()) / 86_400_000;
-  const offsets = getActivityOffsets(shower);
+}
+
+/**
+ * Days of slack around a shower's calendar window. Solar-longitude peaks sit
+ * within about a day of the catalog dates, plus up to a day of leap-year drift.
+ */
+const CALENDAR_WINDOW_SLACK_DAYS = 3;
+
+/** Calendar activity window of each shower as [first day, length] in days. */
+const SHOWER_CALENDAR_WINDOWS = IAU_METEOR_SHOWERS.map(shower => {
+  const start = calendarDay(shower.startMonth, shower.startDay);
+  const end = calendarDay(shower.endMonth, shower.endDay);
   return {
-    isActive: daysFromPeak >= offsets.start && daysFromPeak <= offsets.end,
-    daysFromPeak,
-    peakTime,
+    first: start - CALENDAR_WINDOW_SLACK_DAYS,
+    length: ((((end - start) % 365) + 365) % 365) + 2 * CALENDAR_WINDOW_SLACK_DAYS,
   };
+});
+
+/**
+ * Cheap day-of-year check run before any peak lookup: a shower can only be
+ * active on dates near its catalog start-to-end window (which may wrap the
+ * new year).
+ */
+function isNearCalendarWindow(index: number, dayOfYear: number): boolean {
+  const { first, length } = SHOWER_CALENDAR_WINDOWS[index];
+  return (((dayOfYear - first) % 365) + 365) % 365 <= length;
+}
+
+/**
+ * Time from the closest candidate peak and whether the shower is active then.
+ * The calendar fallback wins ties; failed searches (NaN) never win.
+ */
+function getShowerTiming(
+  peakTable: Float64Array,
+  index: number,
+  year: number,
+  timeMs: number
+): { isActive: boolean; daysFromPeak: number } {
+  const offset = index * PEAK_CANDIDATES;
+  if (Number.isNaN(peakTable[offset])) fillShowerPeaks(peakTable, index, year);
+  let peakMs = peakTable[offset];
+  for (let candidate = 1; candidate < PEAK_CANDIDATES; candidate++) {
+    const candidateMs = peakTable[offset + candidate];
+    if (Math.abs(candidateMs - timeMs) < Math.abs(peakMs - timeMs)) peakMs = candidateMs;
+  }
+  const daysFromPeak = (timeMs - peakMs) / 86_400_000;
+  const { start, end } = SHOWER_ACTIVITY_OFFSETS[index];
+  return { isActive: daysFromPeak >= start && daysFromPeak <= end, daysFromPeak };
+}
+
+/** A shower active tonight, with its radiant drifted to tonight's position. */
+interface ActiveShower {
+  shower: (typeof IAU_METEOR_SHOWERS)[number];
+  daysFromPeak: number;
+  radiantRaDeg: number;
+  radiantDecDeg: number;
 }
 
 /**
@@ -259,24 +340,44 @@ export function detectMeteorShowers(
   const results: MeteorShower[] = [];
   if (nightInfo.observingWindowMode === 'none') return results;
 
-  // Calculate at midnight
-  const midnight = new Date(
-    (nightInfo.observingWindowStart.getTime() + nightInfo.observingWindowEnd.getTime()) / 2
-  );
+  // Calculate at midnight; the radiant and Moon lookups share this AstroTime
+  const midnightTime = calculator.getNightMidpoint(nightInfo);
+  const midnight = midnightTime.date;
+
+  const year = midnight.getUTCFullYear();
+  const peakTable = getShowerPeakTable(year);
+  const midnightMs = midnight.getTime();
+  const dayOfYear = calendarDay(midnight.getUTCMonth() + 1, midnight.getUTCDate());
 
   // Use IAU catalog for comprehensive meteor shower data
-  for (const shower of IAU_METEOR_SHOWERS) {
-    const { isActive, daysFromPeak } = getShowerTiming(shower, midnight);
+  const active: ActiveShower[] = [];
+  for (const [index, shower] of IAU_METEOR_SHOWERS.entries()) {
+    if (!isNearCalendarWindow(index, dayOfYear)) continue;
+
+    const { isActive, daysFromPeak } = getShowerTiming(peakTable, index, year, midnightMs);
 
     if (!isActive) continue;
 
-    // Calculate radiant altitude at midnight
+    // Radiant position drifted to tonight
     const radiantRaDeg = shower.radiantRaDeg + (shower.radiantRaDrift ?? 0) * daysFromPeak;
     const radiantDecDeg = shower.radiantDecDeg + (shower.radiantDecDrift ?? 0) * daysFromPeak;
-    const { altitude } = calculator.getAltAz(radiantRaDeg / 15, radiantDecDeg, midnight);
+    active.push({ shower, daysFromPeak, radiantRaDeg, radiantDecDeg });
+  }
+
+  if (active.length === 0) return results;
+
+  // Radiant altitudes at midnight share one horizon rotation, and the Moon is
+  // evaluated once for the whole night
+  const radiantHorizons = calculator.getAltAzForTargets(
+    active.map(({ radiantRaDeg, radiantDecDeg }) => ({
+      raHours: radiantRaDeg / 15,
+      decDeg: radiantDecDeg,
+    })),
+    midnightTime
+  );
+  const moonPos = calculator.getMoonPosition(midnightTime);
 
-    // Calculate moon separation from radiant
-    const moonPos = calculator.getMoonPosition(midnight);
+  for (const [index, { shower, daysFromPeak, radiantRaDeg, radiantDecDeg }] of active.entries()) {
     const moonSeparation = angularSeparation(
       radiantRaDeg,
       radiantDecDeg,
@@ -290,7 +391,7 @@ export function detectMeteorShowers(
       radiantDecDeg,
       isActive: true,
       daysFromPeak,
-      radiantAltitude: altitude,
+      radiantAltitude: radiantHorizons[index].altitude,
       moonIllumination: nightInfo.moonIllumination,
       moonSeparationDeg: moonSeparation,
       moonAltitudeDeg: moonPos.altitude,
@@ -309,7 +410,7 @@ export function getIAUMeteorShowerInfo(shower: MeteorShower): {
   solarLongitude: number | null;
 } {
   // Find the IAU data for this shower
-  const iauData = IAU_METEOR_SHOWERS.find(s => s.code === shower.code);
+  const iauData = IAU_SHOWERS_BY_CODE.get(shower.code);
 
   if (!iauData) {
     return {
@@ -7,7 +7,7 @@
  * to scale across many concurrent users without overloading SWPC servers.
  */
 
-import { CACHE_KEYS, CACHE_TTLS, getCached, setCache } from '../utils/cache';
+import { CACHE_KEYS, CACHE_TTLS, getCachedMany, setCache } from '../utils/cache';
 import { logger } from '../utils/logger';
 
 const SWPC_BASE = 'https://services.swpc.noaa.gov/json';
@@ -91,9 +91,6 @@ export function parseKpIndex(raw: RawKpEntry[]): KpIndexReading[] {
 
 /* v8 ignore start */
 async function fetchKpIndex(): Promise<KpIndexReading[]> {
-  const cached = await getCached<KpIndexReading[]>(CACHE_KEYS.SWPC_KP, CACHE_TTLS.SWPC_KP);
-  if (cached) return cached;
-
   const raw = await fetchJSON<RawKpEntry[]>(`${SWPC_BASE}/planetary_k_index_1m.json`);
   if (!raw) return [];
 
@@ -130,12 +127,6 @@ export function parseFlareProbabilities(raw: RawFlareProbEntry[]): SolarFlarePro
 
 /* v8 ignore start */
 async function fetchFlareProbabilities(): Promise<SolarFlareProbability[]> {
-  const cached = await getCached<SolarFlareProbability[]>(
-    CACHE_KEYS.SWPC_FLARE_PROB,
-    CACHE_TTLS.SWPC_GENERAL
-  );
-  if (cached) return cached;
-
   const raw = await fetchJSON<RawFlareProbEntry[]>(`${SWPC_BASE}/solar_probabilities.json`);
   if (!raw) return [];
 
@@ -180,12 +171,6 @@ export function parseSunspotReport(raw: RawSunspotEntry[]): SunspotRegion[] {
 
 /* v8 ignore start */
 async function fetchSunspotReport(): Promise<SunspotRegion[]> {
-  const cached = await getCached<SunspotRegion[]>(
-    CACHE_KEYS.SWPC_SUNSPOTS,
-    CACHE_TTLS.SWPC_GENERAL
-  );
-  if (cached) return cached;
-
   const raw = await fetchJSON<RawSunspotEntry[]>(`${SWPC_BASE}/sunspot_report.json`);
   if (!raw) return [];
 
@@ -206,9 +191,6 @@ interface RawFluxEntry {
 
 /* v8 ignore start */
 async function fetchSolarFlux(): Promise<SolarFluxReading | null> {
-  const cached = await getCached<SolarFluxReading>(CACHE_KEYS.SWPC_FLUX, CACHE_TTLS.SWPC_GENERAL);
-  if (cached) return cached;
-
   const raw = await fetchJSON<RawFluxEntry[]>(`${SWPC_BASE}/f107_cm_flux.json`);
   if (!raw || raw.length === 0) return null;
 
@@ -233,16 +215,25 @@ async function fetchSolarFlux(): Promise<SolarFluxReading | null> {
  */
 /* v8 ignore start */
 export async function fetchSWPCData(): Promise<SWPCData | null> {
-  // Check for a combined cache hit first (saves 4 IndexedDB reads)
-  const cached = await getCached<SWPCData>(CACHE_KEYS.SWPC_COMBINED, CACHE_TTLS.SWPC_KP);
+  // The combined entry and every per-source entry are read in one IndexedDB
+  // transaction; only sources without a fresh entry go to the network
+  const [cached, cachedKp, cachedFlares, cachedSunspots, cachedFlux] = await getCachedMany<
+    [SWPCData, KpIndexReading[], SolarFlareProbability[], SunspotRegion[], SolarFluxReading]
+  >([
+    { key: CACHE_KEYS.SWPC_COMBINED, maxAge: CACHE_TTLS.SWPC_KP },
+    { key: CACHE_KEYS.SWPC_KP, maxAge: CACHE_TTLS.SWPC_KP },
+    { key: CACHE_KEYS.SWPC_FLARE_PROB, maxAge: CACHE_TTLS.SWPC_GENERAL },
+    { key: CACHE_KEYS.SWPC_SUNSPOTS, maxAge: CACHE_TTLS.SWPC_GENERAL },
+    { key: CACHE_KEYS.SWPC_FLUX, maxAge: CACHE_TTLS.SWPC_GENERAL },
+  ]);
   if (cached) return cached;
 
   try {
     const [kpIndex, flareProbabilities, sunspotRegions, solarFlux] = await Promise.all([
-      fetchKpIndex(),
-      fetchFlareProbabilities(),
-      fetchSunspotReport(),
-      fetchSolarFlux(),
+      cachedKp ?? fetchKpIndex(),
+      cachedFlares ?? fetchFlareProbabilities(),
+      cachedSunspots ?? fetchSunspotReport(),
+      cachedFlux ?? fetchSolarFlux(),
     ]);
 
     // Return null only if we got absolutely nothing
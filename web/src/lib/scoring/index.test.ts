@@ -1,6 +1,12 @@
 import { describe, expect, it } from 'vitest';
+import {
+  createMockNightInfo,
+  createMockNightWeather,
+  createMockObjectVisibility,
+} from '@/test/factories';
 import type {
   ImagingWindow,
+  LunarApsis,
   NightWeather,
   OppositionEvent,
   SeeingForecast,
@@ -21,10 +27,12 @@ import {
   calculatePeakTimingScore,
   calculateSeasonalWindowScore,
   calculateSeeingQualityScore,
+  calculateSupermoonBonus,
   calculateTransientBonus,
   calculateTwilightPenalty,
   calculateVenusPeakBonus,
   calculateWeatherScore,
+  createNightScorer,
   getMosaicFootprint,
   getScoreTier,
 } from './index';
@@ -667,4 +675,45 @@ describe('scoring', () => {
       expect(fp.height).toBe(72);
     });
   });
+
+  describe('createNightScorer', () => {
+    it('scores night-level terms as direct calls for each object', () => {
+      const seeingForecast: SeeingForecast = {
+        rating: 'excellent',
+        estimatedArcsec: 0.8,
+        confidence: 0.9,
+        recommendation: 'Excellent',
+      };
+      const nightInfo = createMockNightInfo({ moonIllumination: 98, seeingForecast });
+      const weather = createMockNightWeather({ minDewMargin: 1, dewRiskHours: 4 });
+      const lunarApsis: LunarApsis = {
+        type: 'perigee',
+        date: nightInfo.date,
+        distanceKm: 357000,
+        isSupermoon: true,
+      };
+      const score = createNightScorer(nightInfo, weather, 19.8, [], lunarApsis);
+      const objects = [
+        createMockObjectVisibility(),
+        createMockObjectVisibility({ objectName: 'M42', subtype: 'emission_nebula' }),
+        createMockObjectVisibility({ objectName: 'Jupiter', objectType: 'planet', subtype: null }),
+        createMockObjectVisibility({ objectName: 'Moon', objectType: 'moon', subtype: null }),
+      ];
+
+      for (const obj of objects) {
+        const { scoreBreakdown } = score(obj);
+        expect(scoreBreakdown.weatherScore).toBe(
+          calculateWeatherScore(weather, obj.objectType, obj.subtype)
+        );
+        expect(scoreBreakdown.seeingQuality).toBe(
+          calculateSeeingQualityScore(seeingForecast, obj.objectType)
+        );
+        expect(scoreBreakdown.dewRiskPenalty).toBe(calculateDewRiskPenalty(weather));
+        expect(scoreBreakdown.supermoonBonus).toBe(
+          calculateSupermoonBonus(lunarApsis, nightInfo.moonIllumination, obj.objectType)
+        );
+      }
+      expect(score(objects[3]).scoreBreakdown.supermoonBonus).toBe(10);
+    });
+  });
 });
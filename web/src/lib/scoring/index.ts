@@ -111,11 +111,14 @@ export function calculateMoonInterference(
  * Calculate peak timing score (0-15 points)
  */
 export function calculatePeakTimingScore(peakTime: Date | null, dusk: Date, dawn: Date): number {
+  return scorePeakTiming(peakTime, dusk.getTime(), dawn.getTime());
+}
+
+/** Peak timing score against a window already converted to epoch milliseconds */
+function scorePeakTiming(peakTime: Date | null, duskMs: number, dawnMs: number): number {
   if (!peakTime) return 3;
 
   const peakMs = peakTime.getTime();
-  const duskMs = dusk.getTime();
-  const dawnMs = dawn.getTime();
 
   // Check if within observation window
   if (peakMs >= duskMs && peakMs <= dawnMs) return 15;
@@ -409,7 +412,7 @@ export function calculateElongationBonus(
 /**
  * Supermoon bonus for Moon photography (0-10 points)
  */
-function calculateSupermoonBonus(
+export function calculateSupermoonBonus(
   lunarApsis: LunarApsis | null,
   moonIllumination: number,
   objectType: ObjectCategory
@@ -704,10 +707,82 @@ export function calculateFrameFillPercent(
   return Math.round((angularSizeArcmin / minFovDim) * 100);
 }
 
+/**
+ * Night-level inputs shared by every object scored for a night
+ */
+interface NightScoringContext {
+  nightInfo: NightInfo;
+  weather: NightWeather | null;
+  sunRaHours: number;
+  oppositions: OppositionEvent[];
+  lunarApsis: LunarApsis | null;
+  venusPeak: VenusPeakInfo | null;
+  fov: { width: number; height: number } | null;
+  windowStartMs: number;
+  windowEndMs: number;
+  dewRiskPenalty: number;
+  categoryTerms: (objectType: ObjectCategory) => CategoryScoreTerms;
+}
+
+/**
+ * Score components that depend only on the night and the object category
+ */
+interface CategoryScoreTerms {
+  weatherScore: number;
+  seeingQuality: number;
+  supermoonBonus: number;
+}
+
+/**
+ * Bind a night's scoring inputs once and return a per-object scorer.
+ * Weather, seeing, dew and supermoon terms do not vary between objects of the
+ * same category, so they are computed once per category rather than per object.
+ */
+export function createNightScorer(
+  nightInfo: NightInfo,
+  weather: NightWeather | null,
+  sunRaHours: number,
+  oppositions: OppositionEvent[] = [],
+  lunarApsis: LunarApsis | null = null,
+  venusPeak: VenusPeakInfo | null = null,
+  fov: { width: number; height: number } | null = null
+): (visibility: ObjectVisibility) => ScoredObject {
+  const termsByCategory = new Map<ObjectCategory, CategoryScoreTerms>();
+  const context: NightScoringContext = {
+    nightInfo,
+    weather,
+    sunRaHours,
+    oppositions,
+    lunarApsis,
+    venusPeak,
+    fov,
+    windowStartMs: nightInfo.observingWindowStart.getTime(),
+    windowEndMs: nightInfo.observingWindowEnd.getTime(),
+    dewRiskPenalty: calculateDewRiskPenalty(weather),
+    categoryTerms: objectType => {
+      let terms = termsByCategory.get(objectType);
+      if (!terms) {
+        terms = {
+          // The weather score ignores the DSO subtype, so it is per category.
+          weatherScore: calculateWeatherScore(weather, objectType, null),
+          seeingQuality: calculateSeeingQualityScore(nightInfo.seeingForecast, objectType),
+          supermoonBonus: calculateSupermoonBonus(
+            lunarApsis,
+            nightInfo.moonIllumination,
+            objectType
+          ),
+        };
+        termsByCategory.set(objectType, terms);
+      }
+      return terms;
+    },
+  };
+  return visibility => scoreVisibility(visibility, context);
+}
+
 /**
  * Calculate total score for an object
  */
-// biome-ignore lint/complexity/noExcessiveCognitiveComplexity: Total score combines many individual scoring components
 export function calculateTotalScore(
   visibility: ObjectVisibility,
   nightInfo: NightInfo,
@@ -718,6 +793,26 @@ export function calculateTotalScore(
   venusPeak: VenusPeakInfo | null = null,
   fov: { width: number; height: number } | null = null
 ): ScoredObject {
+  return createNightScorer(
+    nightInfo,
+    weather,
+    sunRaHours,
+    oppositions,
+    lunarApsis,
+    venusPeak,
+    fov
+  )(visibility);
+}
+
+/**
+ * Score one object against a bound night context
+ */
+// biome-ignore lint/complexity/noExcessiveCognitiveComplexity: Total score combines many individual scoring components
+function scoreVisibility(
+  visibility: ObjectVisibility,
+  context: NightScoringContext
+): ScoredObject {
+  const { nightInfo, weather, sunRaHours, oppositions, venusPeak, fov } = context;
   const {
     objectType,
     subtype,
@@ -754,12 +849,8 @@ export function calculateTotalScore(
     subtype,
     moonAltitudeAtPeak
   );
-  const peakTiming = calculatePeakTimingScore(
-    maxAltitudeTime,
-    nightInfo.observingWindowStart,
-    nightInfo.observingWindowEnd
-  );
-  const weatherScore = calculateWeatherScore(weather, objectType, subtype);
+  const peakTiming = scorePeakTiming(maxAltitudeTime, context.windowStartMs, context.windowEndMs);
+  const { weatherScore, seeingQuality, supermoonBonus } = context.categoryTerms(objectType);
 
   // Object Characteristics (0-50)
   const surfaceBrightnessScore =
@@ -783,7 +874,6 @@ export function calculateTotalScore(
     objectType === 'planet' ? calculateOppositionBonus(objectName, isAtOpposition, oppositions) : 0;
   const elongationBonus =
     objectType === 'planet' ? calculateElongationBonus(elongationDeg, objectName) : 0;
-  const supermoonBonus = calculateSupermoonBonus(lunarApsis, moonIllumination, objectType);
 
   // New scoring factors
   // Heliocentric perihelion alone does not imply greater apparent brightness
@@ -792,8 +882,7 @@ export function calculateTotalScore(
   const meridianBonus = calculateMeridianBonus(hourAngle);
   const twilightPenalty = calculateTwilightPenalty(sunAngle, objectType);
   const venusPeakBonus = calculateVenusPeakBonus(objectName, venusPeak);
-  const seeingQuality = calculateSeeingQualityScore(nightInfo.seeingForecast, objectType);
-  const dewRiskPenalty = calculateDewRiskPenalty(weather);
+  const dewRiskPenalty = context.dewRiskPenalty;
   const imagingWindowScore = calculateImagingWindowScore(visibility.imagingWindow, weather);
   const fovSuitability = calculateFOVSuitabilityScore(angularSizeArcmin, objectType, fov);
 
@@ -20,7 +20,7 @@ import type {
   ObjectVisibility,
   ObjectVisibilityStatus,
 } from '@/types';
-import { SkyCalculator } from '../astronomy/calculator';
+import { getSkyCalculator, j2000Direction, type SkyCalculator } from '../astronomy/calculator';
 import {
   calculateCometMagnitude,
   calculateCometPosition,
@@ -57,6 +57,18 @@ const MAX_SEARCH_DAYS = 365;
 
 type PositionGetter = (time: Date) => { ra: number; dec: number } | null;
 
+/**
+ * A fixed catalog target. Its J2000 direction is resolved once and reused for
+ * every night a search checks, and it keeps the fixed-position fast paths.
+ */
+interface FixedTarget {
+  ra: number;
+  dec: number;
+  direction: readonly [number, number, number];
+}
+
+type SearchTarget = PositionGetter | FixedTarget;
+
 /**
  * Check if an object can ever be visible from a given latitude
  * Based on declination constraints:
@@ -128,14 +140,16 @@ interface NightSearchMatch {
  * exponential/binary search can skip a real window entirely.
  */
 async function findNextNightAtAltitude(
-  getRaDec: PositionGetter,
+  target: SearchTarget,
   calculator: SkyCalculator,
   startDate: Date,
   threshold: number,
   maxDays: number = MAX_SEARCH_DAYS
 ): Promise<NightSearchMatch | null> {
+  const getRaDec = typeof target === 'function' ? target : undefined;
+  const fixed = typeof target === 'function' ? undefined : target;
   return findFirstMatchingDay(startDate, maxDays, checkDate => {
-    const position = getRaDec(checkDate);
+    const position = fixed ?? getRaDec?.(checkDate);
     if (!position) return null;
 
     const nightInfo = calculator.getNightInfo(checkDate);
@@ -145,7 +159,8 @@ async function findNextNightAtAltitude(
       calculator,
       nightInfo,
       threshold,
-      getRaDec
+      getRaDec,
+      fixed?.direction
     );
     if (isVisible && visibility) {
       return { date: checkDate, nightInfo, visibility };
@@ -155,12 +170,12 @@ async function findNextNightAtAltitude(
 }
 
 function findNextOptimalNight(
-  getRaDec: PositionGetter,
+  target: SearchTarget,
   calculator: SkyCalculator,
   startDate: Date,
   maxDays: number = MAX_SEARCH_DAYS
 ): Promise<NightSearchMatch | null> {
-  return findNextNightAtAltitude(getRaDec, calculator, startDate, OPTIMAL_ALTITUDE, maxDays);
+  return findNextNightAtAltitude(target, calculator, startDate, OPTIMAL_ALTITUDE, maxDays);
 }
 
 /**
@@ -221,7 +236,8 @@ function checkVisibilityForNight(
   calculator: SkyCalculator,
   nightInfo: NightInfo,
   minAltitude: number = MIN_ALTITUDE,
-  positionAtTime?: PositionGetter
+  positionAtTime?: PositionGetter,
+  direction?: readonly [number, number, number]
 ): { isVisible: boolean; visibility: ObjectVisibility | null } {
   // This declination shortcut is valid only for a fixed object. A planet,
   // comet, or minor planet can cross into the observable declination range.
@@ -253,7 +269,7 @@ function checkVisibilityForNight(
               : { raHours, decDegrees };
           },
         }
-      : undefined
+      : { direction }
   );
 
   return {
@@ -264,18 +280,21 @@ function checkVisibilityForNight(
 
 /** Find the next night when an object reaches the search visibility threshold. */
 function findNextVisibleNight(
-  getRaDec: PositionGetter,
+  target: SearchTarget,
   calculator: SkyCalculator,
   startDate: Date,
   maxDays: number = MAX_SEARCH_DAYS
 ): Promise<NightSearchMatch | null> {
-  return findNextNightAtAltitude(getRaDec, calculator, startDate, MIN_ALTITUDE, maxDays);
+  return findNextNightAtAltitude(target, calculator, startDate, MIN_ALTITUDE, maxDays);
 }
 
 /**
  * Search for DSOs matching the query
  */
-async function searchDSOs(query: string, catalog: DSOCatalogEntry[]): Promise<DSOCatalogEntry[]> {
+async function searchDSOs(
+  query: string,
+  catalog: readonly DSOCatalogEntry[]
+): Promise<DSOCatalogEntry[]> {
   const lowerQuery = query.toLowerCase().trim();
 
   // Handle Messier designations: M1, M 1, m1, m 1, etc.
@@ -317,7 +336,7 @@ function searchPlanets(query: string): string[] {
 /**
  * Search for comets matching the query
  */
-function searchComets(query: string, comets: ParsedComet[]): ParsedComet[] {
+function searchComets(query: string, comets: readonly ParsedComet[]): ParsedComet[] {
   const lowerQuery = query.toLowerCase().trim();
   return comets.filter(
     c =>
@@ -364,7 +383,11 @@ async function createDSOSearchResult(
   const angularSize = dso.majorAxisArcmin || null;
 
   // DSOs have fixed coordinates
-  const getRaDec = () => ({ ra: dso.raHours, dec: dso.decDegrees });
+  const target: FixedTarget = {
+    ra: dso.raHours,
+    dec: dso.decDegrees,
+    direction: j2000Direction(dso.raHours, dso.decDegrees),
+  };
 
   if (!hemisphereCheck.canBeVisible) {
     return {
@@ -395,7 +418,15 @@ async function createDSOSearchResult(
   }
 
   // Check tonight
-  const tonightResult = checkVisibilityForNight(dso.raHours, dso.decDegrees, calculator, tonight);
+  const tonightResult = checkVisibilityForNight(
+    dso.raHours,
+    dso.decDegrees,
+    calculator,
+    tonight,
+    MIN_ALTITUDE,
+    undefined,
+    target.direction
+  );
 
   if (tonightResult.isVisible && tonightResult.visibility) {
     const isOptimalTonight = tonightResult.visibility.maxAltitude >= OPTIMAL_ALTITUDE;
@@ -404,7 +435,7 @@ async function createDSOSearchResult(
     // If visible but not optimal, find when it will be optimal
     if (!isOptimalTonight && optimalCheck.canReach) {
       const tomorrow = addAbsoluteDays(tonight.date, 1);
-      const nextOptimal = await findNextOptimalNight(getRaDec, calculator, tomorrow);
+      const nextOptimal = await findNextOptimalNight(target, calculator, tomorrow);
       if (nextOptimal) {
         nextOptimalDate = nextOptimal.date;
       }
@@ -438,7 +469,7 @@ async function createDSOSearchResult(
   }
 
   // Find next visible night
-  const nextVisible = await findNextVisibleNight(getRaDec, calculator, tonight.date);
+  const nextVisible = await findNextVisibleNight(target, calculator, tonight.date);
 
   if (nextVisible) {
     const daysUntil = Math.round(
@@ -452,7 +483,7 @@ async function createDSOSearchResult(
 
     if (!isOptimalThatNight && optimalCheck.canReach) {
       const dayAfter = addAbsoluteDays(nextVisible.date, 1);
-      const nextOptimal = await findNextOptimalNight(getRaDec, calculator, dayAfter);
+      const nextOptimal = await findNextOptimalNight(target, calculator, dayAfter);
       if (nextOptimal) {
         nextOptimalDate = nextOptimal.date;
       }
@@ -1056,7 +1087,7 @@ export async function searchCelestialObjects(
   const results: ObjectSearchResult[] = [];
 
   // Initialize calculator
-  const calculator = new SkyCalculator(location.latitude, location.longitude);
+  const calculator = getSkyCalculator(location.latitude, location.longitude);
   const tonight = calculator.getNightInfo(getObserverNoon(referenceDate, location.timezone));
 
   // Search planets first (fast)
@@ -1,4 +1,4 @@
-import { del, get, keys, set } from 'idb-keyval';
+import { del, delMany, get, getMany, keys, set } from 'idb-keyval';
 import { logger } from './logger';
 
 /**
@@ -30,6 +30,34 @@ export async function getCached<T>(key: string, maxAge: number): Promise<T | nul
   }
 }
 
+/**
+ * Get several cached entries in one IndexedDB transaction. Each result is
+ * null when its entry is missing or older than that entry's maxAge.
+ */
+export async function getCachedMany<T extends unknown[]>(requests: {
+  [K in keyof T]: { key: string; maxAge: number };
+}): Promise<{ [K in keyof T]: T[K] | null }> {
+  type Results = { [K in keyof T]: T[K] | null };
+  try {
+    const entries = await getMany<CacheEntry<unknown> | undefined>(requests.map(({ key }) => key));
+    const now = Date.now();
+    const expired: string[] = [];
+    const results = entries.map((entry, index) => {
+      if (!entry) return null;
+      if (now - entry.timestamp > requests[index].maxAge) {
+        expired.push(requests[index].key);
+        return null;
+      }
+      return entry.data;
+    });
+    if (expired.length > 0) await delMany(expired);
+    return results as Results;
+  } catch (e) {
+    logger.warn('Cache read failed', e);
+    return requests.map(() => null) as Results;
+  }
+}
+
 /**
  * Set cached data with current timestamp
  */
@@ -45,17 +73,23 @@ export async function setCache<T>(key: string, data: T): Promise<void> {
   }
 }
 
+/**
+ * Delete every string key matching a predicate. The matches are removed in
+ * one IndexedDB transaction rather than one transaction per key.
+ */
+async function deleteKeysWhere(predicate: (key: string) => boolean): Promise<void> {
+  const matching = (await keys()).filter(
+    (key): key is string => typeof key === 'string' && predicate(key)
+  );
+  if (matching.length > 0) await delMany(matching);
+}
+
 /**
  * Clear all cached data for NightSeek
  */
 export async function clearAllCache(): Promise<void> {
   try {
-    const allKeys = await keys();
-    for (const key of allKeys) {
-      if (typeof key === 'string' && key.startsWith('nightseek:')) {
-        await del(key);
-      }
-    }
+    await deleteKeysWhere(key => key.startsWith('nightseek:'));
   } catch (e) {
     logger.warn('Cache clear failed', e);
   }
@@ -67,26 +101,20 @@ export async function clearAllCache(): Promise<void> {
  */
 export async function cleanupOldCaches(): Promise<void> {
   try {
-    const allKeys = await keys();
     const currentVersionedKeys = new Set([
       CACHE_KEYS.FORECAST,
       CACHE_KEYS.OPENGC,
       CACHE_KEYS.COMETS,
     ]);
 
-    for (const key of allKeys) {
-      if (typeof key !== 'string') continue;
-
-      // Check for old versioned catalog caches (e.g., 'nightseek:opengc' or 'nightseek:opengc:v1')
-      if (
+    // Check for old versioned catalog caches (e.g., 'nightseek:opengc' or 'nightseek:opengc:v1')
+    await deleteKeysWhere(
+      key =>
         (key.startsWith('nightseek:forecast') ||
           key.startsWith('nightseek:opengc') ||
           key.startsWith('nightseek:comets')) &&
         !currentVersionedKeys.has(key)
-      ) {
-        await del(key);
-      }
-    }
+    );
   } catch (e) {
     logger.warn('Cache cleanup failed', e);
   }
@@ -94,7 +122,7 @@ export async function cleanupOldCaches(): Promise<void> {
 
 // Cache version - increment when cached data format changes or dictionaries are updated
 // This ensures users get fresh data after updates to common-names, star catalogs, etc.
-const CACHE_VERSION = 4;
+const CACHE_VERSION = 5;
 
 // Cache keys (versioned keys will invalidate old caches automatically)
 export const CACHE_KEYS = {
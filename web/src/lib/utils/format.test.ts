@@ -216,6 +216,14 @@ describe('format utils', () => {
     it('should return red for very low altitude', () => {
       expect(getAltitudeQualityClass(20)).toBe('text-red-400');
     });
+
+    it('should switch class exactly at each threshold', () => {
+      expect(getAltitudeQualityClass(75)).toBe('text-green-400');
+      expect(getAltitudeQualityClass(74.9)).toBe('text-blue-400');
+      expect(getAltitudeQualityClass(45)).toBe('text-yellow-400');
+      expect(getAltitudeQualityClass(30)).toBe('text-orange-400');
+      expect(getAltitudeQualityClass(29.9)).toBe('text-red-400');
+    });
   });
 
   describe('formatScore', () => {
@@ -72,16 +72,15 @@ export function getNightLabel(date: Date, possessive = false, timezone?: string)
   tomorrow.setDate(tomorrow.getDate() + 1);
 
   const dateStr = formatDateKey(date, timezone);
-  const todayStr = formatDateKey(today, timezone);
-  const tomorrowStr = formatDateKey(tomorrow, timezone);
 
   // Always include short date for clarity (e.g., "Mon 15")
   const shortDate = timezone ? formatInTimeZone(date, timezone, 'EEE d') : format(date, 'EEE d');
 
+  // Reference days are formatted only as far as the comparison needs them
   let label: string;
-  if (dateStr === todayStr) {
+  if (dateStr === formatDateKey(today, timezone)) {
     label = `Tonight (${shortDate})`;
-  } else if (dateStr === tomorrowStr) {
+  } else if (dateStr === formatDateKey(tomorrow, timezone)) {
     label = `Tomorrow (${shortDate})`;
   } else {
     // For other days, show day name with date
@@ -187,15 +186,23 @@ export function formatAltitude(altitude: number): string {
   return `${Math.round(altitude)}°`;
 }
 
+/** Ascending altitude thresholds and the class for each band they delimit. */
+const ALTITUDE_QUALITY_BINS = [30, 45, 60, 75] as const;
+const ALTITUDE_QUALITY_CLASSES = [
+  'text-red-400',
+  'text-orange-400',
+  'text-yellow-400',
+  'text-blue-400',
+  'text-green-400',
+] as const;
+
 /**
  * Get altitude quality class
  */
 export function getAltitudeQualityClass(altitude: number): string {
-  if (altitude >= 75) return 'text-green-400';
-  if (altitude >= 60) return 'text-blue-400';
-  if (altitude >= 45) return 'text-yellow-400';
-  if (altitude >= 30) return 'text-orange-400';
-  return 'text-red-400';
+  let band = 0;
+  for (const threshold of ALTITUDE_QUALITY_BINS) band += altitude >= threshold ? 1 : 0;
+  return ALTITUDE_QUALITY_CLASSES[band];
 }
 
 /**
@@ -243,12 +250,13 @@ export function getStarRating(rating: number, maxStars: number = 5): string {
   return '★'.repeat(filled) + '☆'.repeat(empty);
 }
 
+const MS_PER_DAY = 24 * 60 * 60 * 1000;
+
 /**
  * Format a date relative to now (e.g., "Tonight", "Tomorrow", "In 3 days")
  */
 export function formatRelativeDate(date: Date): string {
-  const now = new Date();
-  const diffDays = Math.round((date.getTime() - now.getTime()) / (1000 * 60 * 60 * 24));
+  const diffDays = Math.round((date.getTime() - Date.now()) / MS_PER_DAY);
 
   if (diffDays === 0) return 'Tonight';
   if (diffDays === 1) return 'Tomorrow';
@@ -1,5 +1,6 @@
 import { describe, expect, it } from 'vitest';
 import {
+  classifyTier,
   getRatingColorClass,
   getRatingFromPercentage,
   getRatingFromScore,
@@ -8,6 +9,7 @@ import {
   getTierFromPercentage,
   normalizeScore,
   type RatingTier,
+  THRESHOLDS,
 } from './rating';
 
 describe('rating utilities', () => {
@@ -69,6 +71,21 @@ describe('rating utilities', () => {
       expect(getTierFromPercentage(19)).toBe('poor');
       expect(getTierFromPercentage(0)).toBe('poor');
     });
+
+    it('handles fractional, out-of-range and NaN percentages', () => {
+      expect(getTierFromPercentage(74.99)).toBe('very_good');
+      expect(getTierFromPercentage(19.99)).toBe('poor');
+      expect(getTierFromPercentage(140)).toBe('excellent');
+      expect(getTierFromPercentage(-5)).toBe('poor');
+      expect(getTierFromPercentage(Number.NaN)).toBe('poor');
+    });
+
+    it('matches the comparison ladder on both sides of every threshold', () => {
+      for (const threshold of Object.values(THRESHOLDS)) {
+        expect(getTierFromPercentage(threshold)).toBe(classifyTier(threshold));
+        expect(getTierFromPercentage(threshold - 0.01)).toBe(classifyTier(threshold - 0.01));
+      }
+    });
   });
 
   describe('getRatingFromPercentage', () => {
@@ -23,7 +23,7 @@ export interface RatingDisplay {
 /**
  * Tier thresholds (normalized 0-100 scale)
  */
-const THRESHOLDS = {
+export const THRESHOLDS = {
   excellent: 75,
   very_good: 50,
   good: 35,
@@ -51,9 +51,16 @@ export function getStarString(stars: number, maxStars: number = 5): string {
 }
 
 /**
- * Get rating tier from a percentage (0-100)
+ * Five-star strings indexed by star count
  */
-export function getTierFromPercentage(percent: number): RatingTier {
+const STAR_STRINGS: readonly string[] = Array.from({ length: 6 }, (_, stars) =>
+  getStarString(stars)
+);
+
+/**
+ * Classify a percentage against THRESHOLDS, highest tier first
+ */
+export function classifyTier(percent: number): RatingTier {
   if (percent >= THRESHOLDS.excellent) return 'excellent';
   if (percent >= THRESHOLDS.very_good) return 'very_good';
   if (percent >= THRESHOLDS.good) return 'good';
@@ -61,6 +68,32 @@ export function getTierFromPercentage(percent: number): RatingTier {
   return 'poor';
 }
 
+function greatestCommonDivisor(a: number, b: number): number {
+  return b === 0 ? a : greatestCommonDivisor(b, a % b);
+}
+
+/**
+ * Widest bin that every threshold is a multiple of, so one tier per bin is exact
+ */
+const TIER_BIN_WIDTH = Object.values(THRESHOLDS).reduce(greatestCommonDivisor);
+
+/**
+ * Tier for each bin from 0 to 100, derived from THRESHOLDS
+ */
+const TIER_BY_BIN: readonly RatingTier[] = Array.from(
+  { length: Math.floor(100 / TIER_BIN_WIDTH) + 1 },
+  (_, bin) => classifyTier(bin * TIER_BIN_WIDTH)
+);
+
+/**
+ * Get rating tier from a percentage (0-100)
+ */
+export function getTierFromPercentage(percent: number): RatingTier {
+  // NaN fails every threshold, as in the comparison ladder
+  if (!(percent >= 0)) return 'poor';
+  return TIER_BY_BIN[Math.min(Math.floor(percent / TIER_BIN_WIDTH), TIER_BY_BIN.length - 1)];
+}
+
 /**
  * Get full rating display from a percentage (0-100)
  */
@@ -72,7 +105,7 @@ export function getRatingFromPercentage(percent: number): RatingDisplay {
     stars: config.stars,
     label: config.label,
     color: config.color,
-    starString: getStarString(config.stars),
+    starString: STAR_STRINGS[config.stars],
   };
 }
 
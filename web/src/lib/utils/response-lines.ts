@@ -0,0 +1,29 @@
+/**
+ * Line-by-line reading of large text responses (catalog downloads)
+ */
+
+/**
+ * Pass each line of a response body to `onLine` as chunks arrive, so a
+ * multi-megabyte catalog is never held whole alongside its split copy.
+ */
+export async function forEachResponseLine(
+  response: Response,
+  onLine: (line: string) => void
+): Promise<void> {
+  if (!response.body) {
+    for (const line of (await response.text()).split('\n')) onLine(line);
+    return;
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let pending = '';
+  let chunk = await reader.read();
+  while (!chunk.done) {
+    const lines = (pending + decoder.decode(chunk.value, { stream: true })).split('\n');
+    pending = lines.pop() ?? '';
+    for (const line of lines) onLine(line);
+    chunk = await reader.read();
+  }
+  onLine(pending + decoder.decode());
+}
@@ -173,4 +173,16 @@ describe('selectTonightPicks', () => {
       'Top Comet',
     ]);
   });
+
+  it('picks the best candidate regardless of input order, keeping the first of ties', () => {
+    const objects = [
+      makeScoredObject({ objectName: 'M101', totalScore: 70 }),
+      makeScoredObject({ objectName: 'M51', totalScore: 95 }),
+      makeScoredObject({ objectName: 'M81', totalScore: 95 }),
+      makeScoredObject({ objectName: 'M31', totalScore: 90 }),
+    ];
+    const picks = selectTonightPicks(objects);
+    expect(picks).toHaveLength(1);
+    expect(picks[0].object.objectName).toBe('M51');
+  });
 });
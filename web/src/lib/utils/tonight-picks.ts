@@ -52,9 +52,13 @@ function pickBest(
   pickedNames: Set<string>,
   compareObjects: (a: ScoredObject, b: ScoredObject) => number
 ): TonightPick | null {
-  const best = objects
-    .filter(obj => filter(obj) && !pickedNames.has(obj.objectName))
-    .sort(compareObjects)[0];
+  // Only the single best candidate is needed, so scan once instead of
+  // sorting; keeping the first of equal candidates matches a stable sort.
+  let best: ScoredObject | undefined;
+  for (const obj of objects) {
+    if (!filter(obj) || pickedNames.has(obj.objectName)) continue;
+    if (!best || compareObjects(obj, best) < 0) best = obj;
+  }
 
   if (best && best.totalScore >= minScore) {
     pickedNames.add(best.objectName);
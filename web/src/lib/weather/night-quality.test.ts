@@ -388,6 +388,16 @@ describe('night-quality', () => {
       expect(headline.metrics.source).toBe('whole_night');
     });
 
+    it('scores each forecast night once', () => {
+      const nightInfo = createMockNightInfo();
+      const weather = createMockNightWeather();
+
+      const first = calculateHeadlineNightQuality(weather, nightInfo);
+
+      expect(calculateHeadlineNightQuality(weather, nightInfo)).toBe(first);
+      expect(calculateHeadlineNightQuality(weather, createMockNightInfo())).not.toBe(first);
+    });
+
     it('surfaces moon and seeing in the penalty breakdown when they are the main limits', () => {
       const nightInfo = createMockNightInfo({
         moonIllumination: 75,
@@ -500,6 +500,17 @@ export function calculateNightQuality(
   return calculateFromMetrics(buildWholeNightMetrics(weather, nightInfo), weather, nightInfo);
 }
 
+interface HeadlineQualityEntry {
+  nightInfo: NightInfo;
+  quality: NightQuality;
+}
+
+/**
+ * Headline quality per forecast night. The best-night ranking, the night strip
+ * and the quality card all ask for the same nights, so each is scored once.
+ */
+const headlineQualities = new WeakMap<NightWeather, HeadlineQualityEntry>();
+
 /**
  * Calculate the displayed headline quality from the best observing window,
  * falling back to whole-night averages when no best window exists.
@@ -510,8 +521,13 @@ export function calculateHeadlineNightQuality(
 ): NightQuality {
   if (!weather) return calculateNightQuality(weather, nightInfo);
 
-  const bestWindowMetrics = buildBestWindowMetrics(weather, nightInfo);
-  if (!bestWindowMetrics) return calculateNightQuality(weather, nightInfo);
+  const cached = headlineQualities.get(weather);
+  if (cached?.nightInfo === nightInfo) return cached.quality;
 
-  return calculateFromMetrics(bestWindowMetrics, weather, nightInfo);
+  const bestWindowMetrics = buildBestWindowMetrics(weather, nightInfo);
+  const quality = bestWindowMetrics
+    ? calculateFromMetrics(bestWindowMetrics, weather, nightInfo)
+    : calculateNightQuality(weather, nightInfo);
+  headlineQualities.set(weather, { nightInfo, quality });
+  return quality;
 }
@@ -199,6 +199,29 @@ function collectHourlyData(
   }
 }
 
+/**
+ * Air-quality row by UTC time for each response, so every night's hours are
+ * map lookups instead of a scan that re-parses each timestamp per hour.
+ */
+const airQualityRowsByTime = new WeakMap<AirQualityAPIResponse['hourly'], Map<number, number>>();
+
+function getAirQualityRowsByTime(
+  airHourly: AirQualityAPIResponse['hourly'],
+  timezone: string
+): Map<number, number> {
+  let rows = airQualityRowsByTime.get(airHourly);
+  if (!rows) {
+    rows = new Map();
+    for (const [i, timeString] of airHourly.time.entries()) {
+      const time = parseLocalTime(timeString, timezone).getTime();
+      // Keep the first row for a repeated time, as a forward scan would
+      if (!rows.has(time)) rows.set(time, i);
+    }
+    airQualityRowsByTime.set(airHourly, rows);
+  }
+  return rows;
+}
+
 /**
  * Collect air quality data for a specific time
  */
@@ -208,8 +231,8 @@ function collectAirQualityData(
   arrays: NightWeatherArrays,
   timezone: string
 ): void {
-  const aqIndex = airHourly.time.findIndex(t => parseLocalTime(t, timezone).getTime() === time);
-  if (aqIndex < 0) return;
+  const aqIndex = getAirQualityRowsByTime(airHourly, timezone).get(time);
+  if (aqIndex === undefined) return;
 
   if (airHourly.aerosol_optical_depth?.[aqIndex] != null) {
     arrays.aod.push(airHourly.aerosol_optical_depth[aqIndex]);